@@ -15,6 +15,7 @@ CREATE TABLE public.CategoriaMaterial (
     nome character varying NOT NULL,
     descricao text,
     data_criacao timestamp with time zone DEFAULT now(),
+    data_atualizacao timestamp with time zone DEFAULT now(),
     CONSTRAINT CategoriaMaterial_pkey PRIMARY KEY (id)
 );
 
@@ -33,6 +34,7 @@ CREATE TABLE public.NivelSuporteTEA (
     nome character varying NOT NULL,
     descricao text,
     data_criacao timestamp with time zone DEFAULT now(),
+    data_atualizacao timestamp with time zone DEFAULT now(),
     CONSTRAINT NivelSuporteTEA_pkey PRIMARY KEY (id)
 );
 
@@ -131,6 +133,66 @@ CREATE TABLE public.ServicoLocal (
     data_criacao timestamp with time zone DEFAULT now(),
     data_atualizacao timestamp with time zone DEFAULT now(),
     url_servico text,
+    latitude double precision,
+    longitude double precision,
     CONSTRAINT ServicoLocal_pkey PRIMARY KEY (id),
     CONSTRAINT ServicoLocal_tipo_servico_id_fkey FOREIGN KEY (tipo_servico_id) REFERENCES public.TipoServico(id)
-);
\ No newline at end of file
+);
+
+-- Índices
+
+CREATE INDEX ArtigoInformativo_data_atualizacao_idx ON public.ArtigoInformativo (data_atualizacao DESC NULLS LAST);
+CREATE INDEX MaterialDeApoio_data_atualizacao_idx ON public.MaterialDeApoio (data_atualizacao DESC NULLS LAST);
+CREATE INDEX ServicoLocal_data_atualizacao_idx ON public.ServicoLocal (data_atualizacao DESC NULLS LAST);
+CREATE INDEX MaterialDeApoio_categoria_id_id_idx ON public.MaterialDeApoio (categoria_id, id);
+CREATE INDEX MaterialDeApoio_nivel_suporte_tea_id_id_idx ON public.MaterialDeApoio (nivel_suporte_tea_id, id);
+CREATE INDEX MaterialDeApoio_categoria_id_nivel_suporte_tea_id_id_idx ON public.MaterialDeApoio (categoria_id, nivel_suporte_tea_id, id);
+CREATE INDEX Dependente_responsavel_id_data_criacao_idx ON public.Dependente (responsavel_id, data_criacao DESC);
+CREATE INDEX MaterialFavorito_responsavel_id_dependente_id_idx ON public.MaterialFavorito (responsavel_id, dependente_id, material_id);
+CREATE INDEX DepoimentoResponsavel_aprovado_id_idx ON public.DepoimentoResponsavel (id) WHERE aprovado;
+CREATE INDEX DepoimentoResponsavel_aprovado_data_criacao_idx ON public.DepoimentoResponsavel (data_criacao DESC, id DESC) WHERE aprovado;
+CREATE INDEX DepoimentoResponsavel_aprovado_categoria_id_idx ON public.DepoimentoResponsavel (categoria_id, id) WHERE aprovado;
+
+-- Busca textual (ver supabase-project/volumes/db/init/08_busca.sql)
+
+CREATE EXTENSION IF NOT EXISTS unaccent;
+CREATE TEXT SEARCH CONFIGURATION public.portuguese_unaccent (COPY = pg_catalog.portuguese);
+ALTER TEXT SEARCH CONFIGURATION public.portuguese_unaccent ALTER MAPPING FOR hword, hword_part, word WITH unaccent, portuguese_stem;
+ALTER TABLE public.ArtigoInformativo ADD COLUMN busca tsvector GENERATED ALWAYS AS (setweight(to_tsvector('public.portuguese_unaccent', coalesce(titulo, '')), 'A') || setweight(to_tsvector('public.portuguese_unaccent', coalesce(corpo, '')), 'B')) STORED;
+ALTER TABLE public.MaterialDeApoio ADD COLUMN busca tsvector GENERATED ALWAYS AS (setweight(to_tsvector('public.portuguese_unaccent', coalesce(titulo, '')), 'A') || setweight(to_tsvector('public.portuguese_unaccent', coalesce(corpo, '')), 'B')) STORED;
+CREATE INDEX ArtigoInformativo_busca_idx ON public.ArtigoInformativo USING GIN (busca);
+CREATE INDEX MaterialDeApoio_busca_idx ON public.MaterialDeApoio USING GIN (busca);
+
+-- Proximidade de serviços (ver supabase-project/volumes/db/init/09_servicos_geo.sql)
+
+CREATE EXTENSION IF NOT EXISTS cube;
+CREATE EXTENSION IF NOT EXISTS earthdistance;
+CREATE INDEX ServicoLocal_localizacao_idx ON public.ServicoLocal USING GIST (ll_to_earth(latitude, longitude)) WHERE latitude IS NOT NULL;
+
+-- Reimportação incremental do IBGE (ver supabase-project/volumes/db/init/10_importacao_incremental.sql)
+
+CREATE UNIQUE INDEX TEA_escolarizacao_por_estado_chave_idx ON public.TEA_escolarizacao_por_estado (localidade, ano, sexo, faixa_idade, tipo_deficiencia) NULLS NOT DISTINCT;
+CREATE TABLE public.ImportacaoArquivo (
+    tabela text NOT NULL,
+    arquivo text NOT NULL,
+    sha256 text NOT NULL,
+    linhas integer NOT NULL,
+    data_importacao timestamp with time zone NOT NULL DEFAULT now(),
+    CONSTRAINT ImportacaoArquivo_pkey PRIMARY KEY (tabela, arquivo)
+);
+
+-- Estatísticas agregadas (ver supabase-project/volumes/db/init/11_estatisticas_agregadas.sql)
+
+CREATE MATERIALIZED VIEW public.TEA_escolarizacao_agregada AS
+SELECT GROUPING(localidade, ano, sexo, faixa_idade, tipo_deficiencia) AS agrupamento, localidade, ano, sexo, faixa_idade, tipo_deficiencia,
+    avg(taxa_escolarizacao) AS media, min(taxa_escolarizacao) AS minimo, max(taxa_escolarizacao) AS maximo, count(taxa_escolarizacao) AS registros
+FROM public.TEA_escolarizacao_por_estado
+GROUP BY CUBE (localidade, ano, sexo, faixa_idade, tipo_deficiencia);
+CREATE UNIQUE INDEX TEA_escolarizacao_agregada_chave_idx ON public.TEA_escolarizacao_agregada (agrupamento, localidade, ano, sexo, faixa_idade, tipo_deficiencia) NULLS NOT DISTINCT;
+CREATE INDEX TEA_escolarizacao_agregada_ano_idx ON public.TEA_escolarizacao_agregada (agrupamento, ano, sexo, faixa_idade, tipo_deficiencia);
+CREATE MATERIALIZED VIEW public.TEA_nivel_agregado AS
+SELECT GROUPING(local, dificuldades) AS agrupamento, local, dificuldades,
+    sum(absolute)::bigint AS soma_absoluto, avg(relative)::double precision AS media_relativo, count(*) AS registros
+FROM public.TEA_nivel_por_estado
+GROUP BY CUBE (local, dificuldades);
+CREATE UNIQUE INDEX TEA_nivel_agregado_chave_idx ON public.TEA_nivel_agregado (agrupamento, local, dificuldades) NULLS NOT DISTINCT;
@@ -7,6 +7,10 @@ from app.api.v1.routes.servico import router as servico_router
 from app.api.v1.routes.estatisticas import router as estatisticas_router
 from app.api.v1.routes.artigo import router as artigo_router
 from app.api.v1.routes.material import router as material_router
+from app.api.v1.routes.busca import router as busca_router
+from app.api.v1.routes.cache import router as cache_router
+from app.api.v1.routes.dashboard import router as dashboard_router
+from app.api.v1.routes.dependente import router as dependente_router
 
 # Create the main API instance
 api = NinjaAPI(
@@ -22,9 +26,13 @@ api.add_router("/servicos", servico_router, tags=["Serviços"])
 api.add_router("/estatisticas", estatisticas_router, tags=["Estatísticas"])
 api.add_router("/artigos", artigo_router, tags=["Artigos"])
 api.add_router("/materiais", material_router, tags=["Materiais"])
+api.add_router("/busca", busca_router, tags=["Busca"])
+api.add_router("/cache", cache_router, tags=["Cache"])
+api.add_router("/dashboard", dashboard_router, tags=["Dashboard"])
+api.add_router("/dependentes", dependente_router, tags=["Dependentes"])
 
 # Health check endpoint
 @api.get("/health", tags=["Health"])
-def health_check(request: HttpRequest):
+async def health_check(request: HttpRequest):
     """Health check endpoint"""
     return {"status": "healthy", "message": "Guia Cuidar API is running"}
@@ -1,36 +1,48 @@
-from ninja import Router
-from typing import List, Union
-from supabase import Client
+from ninja import Router, Query
+from ninja.decorators import decorate_view
+from typing import Union
 
-from app.core.db import get_supabase_client
+from app.core.conditional import conditional_get
+from app.core.pagination import PaginationParams, InvalidPageRequest, fetch_page
+from app.core.serialization import respond
 from app.schemas.artigo import ArtigoInformativo
-from app.schemas.common import ErrorResponse
+from app.schemas.common import ErrorResponse, Page, partial_model
 
 router = Router()
 
 
-@router.get("/", response={200: List[ArtigoInformativo], 500: ErrorResponse})
-def get_artigos_informativos(request) -> Union[List[ArtigoInformativo], ErrorResponse]:
+@router.get("/", response={200: Page[partial_model(ArtigoInformativo)], 400: ErrorResponse, 500: ErrorResponse}, exclude_unset=True)
+@decorate_view(conditional_get("ArtigoInformativo"))
+async def get_artigos_informativos(request, params: Query[PaginationParams]) -> Union[Page, ErrorResponse]:
     """
-    Get all informative articles (artigos informativos)
+    Get informative articles (artigos informativos), paginated by keyset
+    
+    Args:
+        params: `limit`, `cursor` (the previous page's `next_cursor`), `order_by`
+            (`id` ascending or `data_criacao` newest first) and `fields`, a
+            comma-separated projection such as `id,titulo,autor`
     
     Returns:
-        List[ArtigoInformativo]: List of all informative articles
+        Page: One page of informative articles and the cursor of the next page
         ErrorResponse: Error response with error details
     """
     try:
-        supabase: Client = get_supabase_client()
-        
-        # Get all informative articles
-        result = supabase.table("ArtigoInformativo").select("*").execute()
-        
-        if result.data:
-            return [ArtigoInformativo(**artigo) for artigo in result.data]
-        else:
-            return []
-            
+        # Get one page of articles (served from the reference-data cache)
+        return respond(await fetch_page(
+            "ArtigoInformativo",
+            ArtigoInformativo,
+            params,
+            cached=True,
+            direct=True
+        ))
+    
+    except InvalidPageRequest as e:
+        return 400, ErrorResponse(
+            message=str(e),
+            error_code="INVALID_PAGE_REQUEST"
+        )
     except Exception as e:
-        return ErrorResponse(
+        return 500, ErrorResponse(
             message=f"An error occurred while fetching informative articles: {str(e)}",
             error_code="FETCH_ARTIGOS_ERROR"
         )
@@ -1,9 +1,10 @@
 from ninja import Router
 from ninja.responses import Response
 from typing import Union
-from supabase import Client
+from supabase_auth import AsyncGoTrueClient
 
-from app.core.db import get_supabase_client
+from app.core.db import get_async_auth_client
+from app.core.auth import supabase_auth
 from app.schemas.auth import (
     SignInRequest, 
     LoginRequest, 
@@ -15,7 +16,7 @@ router = Router()
 
 
 @router.post("/signin", response={200: AuthResponse, 400: ErrorResponse, 500: ErrorResponse})
-def signin(request, signin_data: SignInRequest) -> Union[AuthResponse, ErrorResponse]:
+async def signin(request, signin_data: SignInRequest) -> Union[AuthResponse, ErrorResponse]:
     """
     Create a new user account (sign up)
     
@@ -27,10 +28,10 @@ def signin(request, signin_data: SignInRequest) -> Union[AuthResponse, ErrorResp
         ErrorResponse: Error response with error details
     """
     try:
-        supabase: Client = get_supabase_client()
+        auth_client: AsyncGoTrueClient = await get_async_auth_client()
         
         # Create user with Supabase Auth
-        auth_response = supabase.auth.sign_up({
+        auth_response = await auth_client.sign_up({
             "email": signin_data.email,
             "password": signin_data.password,
             "options": {
@@ -80,7 +81,7 @@ def signin(request, signin_data: SignInRequest) -> Union[AuthResponse, ErrorResp
 
 
 @router.post("/login", response={200: AuthResponse, 401: ErrorResponse, 500: ErrorResponse})
-def login(request, login_data: LoginRequest) -> Union[AuthResponse, ErrorResponse]:
+async def login(request, login_data: LoginRequest) -> Union[AuthResponse, ErrorResponse]:
     """
     Authenticate user and return access tokens
     
@@ -92,10 +93,10 @@ def login(request, login_data: LoginRequest) -> Union[AuthResponse, ErrorRespons
         ErrorResponse: Error response with error details
     """
     try:
-        supabase: Client = get_supabase_client()
+        auth_client: AsyncGoTrueClient = await get_async_auth_client()
         
         # Authenticate user with Supabase Auth
-        auth_response = supabase.auth.sign_in_with_password({
+        auth_response = await auth_client.sign_in_with_password({
             "email": login_data.email,
             "password": login_data.password
         })
@@ -133,20 +134,20 @@ def login(request, login_data: LoginRequest) -> Union[AuthResponse, ErrorRespons
             )
 
 
-@router.post("/logout", response={200: AuthResponse, 401: ErrorResponse})
-def logout(request) -> Union[AuthResponse, ErrorResponse]:
+@router.post("/logout", auth=supabase_auth, response={200: AuthResponse, 401: ErrorResponse})
+async def logout(request) -> Union[AuthResponse, ErrorResponse]:
     """
-    Logout the current user
+    Logout the current user (revokes the sessions of the bearer token's user)
     
     Returns:
         AuthResponse: Success response
         ErrorResponse: Error response with error details
     """
     try:
-        supabase: Client = get_supabase_client()
+        auth_client: AsyncGoTrueClient = await get_async_auth_client()
         
-        # Sign out the current user
-        supabase.auth.sign_out()
+        # Sign out the user identified by the request's token
+        await auth_client.admin.sign_out(request.auth.token)
         
         return AuthResponse(
             success=True,
@@ -160,8 +161,8 @@ def logout(request) -> Union[AuthResponse, ErrorResponse]:
         )
 
 
-@router.get("/me", response={200: dict, 401: ErrorResponse})
-def get_current_user(request) -> Union[dict, ErrorResponse]:
+@router.get("/me", auth=supabase_auth, response={200: dict, 401: ErrorResponse})
+async def get_current_user(request) -> Union[dict, ErrorResponse]:
     """
     Get current authenticated user information
     
@@ -170,10 +171,10 @@ def get_current_user(request) -> Union[dict, ErrorResponse]:
         ErrorResponse: Error response with error details
     """
     try:
-        supabase: Client = get_supabase_client()
+        auth_client: AsyncGoTrueClient = await get_async_auth_client()
         
-        # Get current user
-        user = supabase.auth.get_user()
+        # Get the full profile of the user identified by the request's token
+        user = await auth_client.get_user(request.auth.token)
         
         if user.user:
             return {
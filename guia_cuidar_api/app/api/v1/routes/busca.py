@@ -0,0 +1,70 @@
+from ninja import Router, Query
+from typing import Any, List, Union
+from supabase import AsyncClient
+
+from app.core.db import get_async_supabase_client
+from app.core.pagination import InvalidPageRequest, decode_key, encode_key
+from app.core.serialization import respond
+from app.schemas.busca import BuscaParams, ResultadoBusca
+from app.schemas.common import ErrorResponse, Page
+
+router = Router()
+
+
+def _decode_cursor(cursor: str) -> List[Any]:
+    """Decode a (rank, tipo, id) cursor and check its value types."""
+    rank, tipo, id_ = decode_key(cursor, 3)
+    if not isinstance(rank, (int, float)) or tipo not in ("artigo", "material") or not isinstance(id_, int):
+        raise InvalidPageRequest("Invalid cursor")
+    return [rank, tipo, id_]
+
+
+@router.get("/", response={200: Page[ResultadoBusca], 400: ErrorResponse, 500: ErrorResponse})
+async def buscar(request, params: Query[BuscaParams]) -> Union[Page, ErrorResponse]:
+    """
+    Full-text search over articles and support materials
+    
+    Runs the `buscar_conteudo` Postgres function: a Portuguese, accent-insensitive
+    `tsvector` match on `titulo`/`corpo` (GIN indexed), ranked by relevance, with
+    a highlighted snippet (`<mark>`) per result.
+    
+    Args:
+        params: `q` (web-search syntax: words, "phrases", -exclusions), optional
+            `tipo` (`artigo` or `material`), `limit` and `cursor`
+    
+    Returns:
+        Page: One page of results, most relevant first, and the next cursor
+        ErrorResponse: Error response with error details
+    """
+    try:
+        rank, tipo, last_id = _decode_cursor(params.cursor) if params.cursor else (None, None, None)
+        supabase: AsyncClient = await get_async_supabase_client()
+        
+        # Search both tables in one RPC call; one extra row tells if there is a next page
+        result = await supabase.rpc("buscar_conteudo", {
+            "p_consulta": params.q,
+            "p_limite": params.limit + 1,
+            "p_tipo": params.tipo,
+            "p_cursor_rank": rank,
+            "p_cursor_tipo": tipo,
+            "p_cursor_id": last_id
+        }).execute()
+        
+        rows = result.data or []
+        next_cursor = None
+        if len(rows) > params.limit:
+            rows = rows[:params.limit]
+            next_cursor = encode_key([rows[-1]["rank"], rows[-1]["tipo"], rows[-1]["id"]])
+        
+        return respond({"items": rows, "next_cursor": next_cursor})
+    
+    except InvalidPageRequest as e:
+        return 400, ErrorResponse(
+            message=str(e),
+            error_code="INVALID_PAGE_REQUEST"
+        )
+    except Exception as e:
+        return 500, ErrorResponse(
+            message=f"An error occurred while searching: {str(e)}",
+            error_code="BUSCA_ERROR"
+        )
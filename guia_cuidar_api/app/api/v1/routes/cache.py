@@ -0,0 +1,68 @@
+import hmac
+from ninja import Router
+from ninja.security import APIKeyHeader
+from typing import Optional
+
+from app.core.cache import reference_cache, invalidate, settings
+from app.core.http_client import pool_stats
+from app.schemas.cache import CacheInvalidationRequest, CacheInvalidationResponse
+from app.schemas.common import ErrorResponse
+
+
+class CacheTokenAuth(APIKeyHeader):
+    """Shared-secret header used by the Supabase webhook and operators"""
+    param_name = "X-Cache-Token"
+
+    def authenticate(self, request, key: Optional[str]):
+        expected = settings.cache_invalidation_token
+        if expected and key and hmac.compare_digest(key, expected):
+            return key
+        return None
+
+
+router = Router(auth=CacheTokenAuth())
+
+
+@router.get("/stats", response={200: dict, 401: ErrorResponse})
+async def get_cache_stats(request) -> dict:
+    """
+    Get reference-data cache counters
+
+    Returns:
+        dict: Hit/miss/eviction counters per table and current size
+    """
+    return reference_cache.stats()
+
+
+@router.get("/pool", response={200: dict, 401: ErrorResponse})
+async def get_pool_stats(request) -> dict:
+    """
+    Get Supabase HTTP connection-pool counters
+
+    Returns:
+        dict: Configured limits plus requests, errors, pool timeouts, new
+            connections and open/idle connections per client
+    """
+    return pool_stats()
+
+
+@router.post("/invalidate", response={200: CacheInvalidationResponse, 401: ErrorResponse})
+async def invalidate_cache(request, payload: CacheInvalidationRequest) -> CacheInvalidationResponse:
+    """
+    Invalidate cached reference data
+
+    Meant to be called by a Supabase Database Webhook on INSERT/UPDATE/DELETE
+    of the cached tables, or manually after bulk edits.
+
+    Args:
+        payload: Table whose entries should be dropped (omit to clear everything)
+
+    Returns:
+        CacheInvalidationResponse: Number of entries removed
+    """
+    removed = invalidate(payload.table)
+    return CacheInvalidationResponse(
+        success=True,
+        message=f"Cache invalidated for {payload.table or 'all tables'}",
+        removed=removed
+    )
@@ -0,0 +1,126 @@
+import asyncio
+from ninja import Router
+from typing import Any, Dict, List, Optional, Union
+from supabase import AsyncClient
+
+from app.core.db import get_async_supabase_client
+from app.core.auth import supabase_auth
+from app.core.cache import cached_select
+from app.core.dependentes import get_dependentes
+from app.core.serialization import project_rows, respond
+from app.schemas.dashboard import DashboardFavorites, DashboardProfile, DashboardTips, Responsavel
+from app.schemas.material import CategoriaMaterial, NivelSuporteTEA
+from app.schemas.common import ErrorResponse
+
+router = Router()
+
+# Every column but `senha_hash`
+RESPONSAVEL_COLUMNS = ",".join(Responsavel.model_fields)
+
+
+async def _responsavel(user_id: str) -> Optional[Dict[str, Any]]:
+    """The user's Responsavel row, or None if the profile was not created yet"""
+    supabase: AsyncClient = await get_async_supabase_client()
+    result = await supabase.table("Responsavel").select(RESPONSAVEL_COLUMNS).eq("id", user_id).limit(1).execute()
+    rows = project_rows(Responsavel, result.data or [])
+    return rows[0] if rows else None
+
+
+async def _categorias() -> List[Dict[str, Any]]:
+    return project_rows(CategoriaMaterial, await cached_select("CategoriaMaterial"))
+
+
+async def _niveis_suporte() -> List[Dict[str, Any]]:
+    return project_rows(NivelSuporteTEA, await cached_select("NivelSuporteTEA"))
+
+
+@router.get("/tips", auth=supabase_auth, response={200: DashboardTips, 500: ErrorResponse})
+async def get_dashboard_tips(request) -> Union[DashboardTips, ErrorResponse]:
+    """
+    Get the initial data of the tips page in one request
+
+    The user's dependents, the material categories and the TEA support levels
+    are read concurrently; all three usually come from the caches.
+
+    Returns:
+        DashboardTips: Dependents (newest first), categories and support levels
+        ErrorResponse: Error response with error details
+    """
+    try:
+        # Get the page's data concurrently
+        dependentes, categorias, niveis_suporte = await asyncio.gather(
+            get_dependentes(request.auth.id),
+            _categorias(),
+            _niveis_suporte()
+        )
+
+        return respond({
+            "dependentes": dependentes,
+            "categorias": categorias,
+            "niveis_suporte": niveis_suporte
+        })
+
+    except Exception as e:
+        return 500, ErrorResponse(
+            message=f"An error occurred while loading the tips page: {str(e)}",
+            error_code="DASHBOARD_TIPS_ERROR"
+        )
+
+
+@router.get("/favorites", auth=supabase_auth, response={200: DashboardFavorites, 500: ErrorResponse})
+async def get_dashboard_favorites(request) -> Union[DashboardFavorites, ErrorResponse]:
+    """
+    Get the initial data of the favorites page in one request
+
+    Returns:
+        DashboardFavorites: Dependents (newest first) and material categories
+        ErrorResponse: Error response with error details
+    """
+    try:
+        # Get the page's data concurrently
+        dependentes, categorias = await asyncio.gather(
+            get_dependentes(request.auth.id),
+            _categorias()
+        )
+
+        return respond({
+            "dependentes": dependentes,
+            "categorias": categorias
+        })
+
+    except Exception as e:
+        return 500, ErrorResponse(
+            message=f"An error occurred while loading the favorites page: {str(e)}",
+            error_code="DASHBOARD_FAVORITES_ERROR"
+        )
+
+
+@router.get("/profile", auth=supabase_auth, response={200: DashboardProfile, 500: ErrorResponse})
+async def get_dashboard_profile(request) -> Union[DashboardProfile, ErrorResponse]:
+    """
+    Get the initial data of the profile page in one request
+
+    Returns:
+        DashboardProfile: The user's profile (null if not created yet),
+            dependents (newest first) and support levels
+        ErrorResponse: Error response with error details
+    """
+    try:
+        # Get the page's data concurrently
+        responsavel, dependentes, niveis_suporte = await asyncio.gather(
+            _responsavel(request.auth.id),
+            get_dependentes(request.auth.id),
+            _niveis_suporte()
+        )
+
+        return respond({
+            "responsavel": responsavel,
+            "dependentes": dependentes,
+            "niveis_suporte": niveis_suporte
+        })
+
+    except Exception as e:
+        return 500, ErrorResponse(
+            message=f"An error occurred while loading the profile page: {str(e)}",
+            error_code="DASHBOARD_PROFILE_ERROR"
+        )
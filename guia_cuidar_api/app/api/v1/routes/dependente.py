@@ -0,0 +1,194 @@
+from datetime import datetime, timezone
+from ninja import Router
+from typing import List, Union
+from supabase import AsyncClient
+from postgrest.exceptions import APIError
+
+from app.core.db import get_async_supabase_client
+from app.core.auth import supabase_auth
+from app.core.dependentes import get_dependentes, invalidate_dependentes
+from app.core.serialization import project_rows, respond
+from app.schemas.dependente import Dependente, DependenteCreate, DependenteUpdate
+from app.schemas.common import ErrorResponse, SuccessResponse
+
+router = Router()
+
+
+def _foreign_key_error(e: APIError, action: str) -> tuple:
+    """Map a foreign key violation (23503) on Dependente to a 4xx response"""
+    if "nivel_suporte_tea_id" in (e.message or ""):
+        return 400, ErrorResponse(
+            message="TEA support level not found",
+            error_code="NIVEL_SUPORTE_NOT_FOUND"
+        )
+    if "MaterialFavorito" in (e.message or ""):
+        return 409, ErrorResponse(
+            message="Dependent has favorite materials; remove them first",
+            error_code="DEPENDENTE_HAS_FAVORITOS"
+        )
+    return 400, ErrorResponse(
+        message=f"An error occurred while {action} the dependent: {e.message}",
+        error_code="DEPENDENTE_REFERENCE_ERROR"
+    )
+
+
+@router.get("/", auth=supabase_auth, response={200: List[Dependente], 500: ErrorResponse})
+async def get_dependentes_usuario(request) -> Union[List[Dependente], ErrorResponse]:
+    """
+    Get the current user's dependents, newest first
+
+    Served from a short-lived per-user cache, dropped on every write below.
+
+    Returns:
+        List[Dependente]: The user's dependents
+        ErrorResponse: Error response with error details
+    """
+    try:
+        # Get the user's dependents (served from the per-user cache)
+        return respond(await get_dependentes(request.auth.id))
+
+    except Exception as e:
+        return 500, ErrorResponse(
+            message=f"An error occurred while fetching dependents: {str(e)}",
+            error_code="FETCH_DEPENDENTES_ERROR"
+        )
+
+
+@router.post("/", auth=supabase_auth, response={201: Dependente, 400: ErrorResponse, 500: ErrorResponse})
+async def create_dependente(request, dependente_data: DependenteCreate) -> Union[Dependente, ErrorResponse]:
+    """
+    Create a dependent for the current user
+
+    Args:
+        dependente_data: Name and optional TEA support level
+
+    Returns:
+        Dependente: Created dependent
+        ErrorResponse: Error response with error details
+    """
+    try:
+        supabase: AsyncClient = await get_async_supabase_client()
+
+        # Create dependent
+        result = await supabase.table("Dependente").insert({
+            **dependente_data.model_dump(),
+            "responsavel_id": request.auth.id
+        }).execute()
+        invalidate_dependentes(request.auth.id)
+
+        if result.data:
+            return 201, project_rows(Dependente, result.data)[0]
+        else:
+            return 500, ErrorResponse(
+                message="Failed to create dependent",
+                error_code="CREATE_DEPENDENTE_FAILED"
+            )
+
+    except APIError as e:
+        if e.code == "23503":
+            return _foreign_key_error(e, "creating")
+        return 500, ErrorResponse(
+            message=f"An error occurred while creating the dependent: {e.message}",
+            error_code="CREATE_DEPENDENTE_ERROR"
+        )
+    except Exception as e:
+        return 500, ErrorResponse(
+            message=f"An error occurred while creating the dependent: {str(e)}",
+            error_code="CREATE_DEPENDENTE_ERROR"
+        )
+
+
+@router.patch("/{dependente_id}", auth=supabase_auth, response={200: Dependente, 400: ErrorResponse, 404: ErrorResponse, 500: ErrorResponse})
+async def update_dependente(request, dependente_id: int, dependente_data: DependenteUpdate) -> Union[Dependente, ErrorResponse]:
+    """
+    Update one of the current user's dependents
+
+    Args:
+        dependente_id: ID of the dependent
+        dependente_data: Fields to change (omitted fields are kept)
+
+    Returns:
+        Dependente: Updated dependent
+        ErrorResponse: Error response with error details
+    """
+    changes = dependente_data.model_dump(exclude_unset=True)
+    if not changes:
+        return 400, ErrorResponse(
+            message="No fields to update",
+            error_code="EMPTY_UPDATE"
+        )
+
+    try:
+        supabase: AsyncClient = await get_async_supabase_client()
+
+        # Update the dependent, only if it belongs to the user
+        result = await supabase.table("Dependente").update({
+            **changes,
+            "data_atualizacao": datetime.now(timezone.utc).isoformat()
+        }).eq("id", dependente_id).eq("responsavel_id", request.auth.id).execute()
+        invalidate_dependentes(request.auth.id)
+
+        if result.data:
+            return project_rows(Dependente, result.data)[0]
+        else:
+            return 404, ErrorResponse(
+                message="Dependent not found or does not belong to user",
+                error_code="DEPENDENTE_NOT_FOUND"
+            )
+
+    except APIError as e:
+        if e.code == "23503":
+            return _foreign_key_error(e, "updating")
+        return 500, ErrorResponse(
+            message=f"An error occurred while updating the dependent: {e.message}",
+            error_code="UPDATE_DEPENDENTE_ERROR"
+        )
+    except Exception as e:
+        return 500, ErrorResponse(
+            message=f"An error occurred while updating the dependent: {str(e)}",
+            error_code="UPDATE_DEPENDENTE_ERROR"
+        )
+
+
+@router.delete("/{dependente_id}", auth=supabase_auth, response={200: SuccessResponse, 404: ErrorResponse, 409: ErrorResponse, 500: ErrorResponse})
+async def delete_dependente(request, dependente_id: int) -> Union[SuccessResponse, ErrorResponse]:
+    """
+    Delete one of the current user's dependents
+
+    Args:
+        dependente_id: ID of the dependent
+
+    Returns:
+        SuccessResponse: Success response
+        ErrorResponse: Error response with error details
+    """
+    try:
+        supabase: AsyncClient = await get_async_supabase_client()
+
+        # Delete the dependent, only if it belongs to the user
+        result = await supabase.table("Dependente").delete().eq("id", dependente_id).eq("responsavel_id", request.auth.id).execute()
+        invalidate_dependentes(request.auth.id)
+
+        if result.data:
+            return SuccessResponse(
+                success=True,
+                message="Dependent removed successfully"
+            )
+        else:
+            return 404, ErrorResponse(
+                message="Dependent not found or does not belong to user",
+                error_code="DEPENDENTE_NOT_FOUND"
+            )
+
+    except APIError as e:
+        if e.code == "23503":
+            return _foreign_key_error(e, "deleting")
+        return 500, ErrorResponse(
+            message=f"An error occurred while deleting the dependent: {e.message}",
+            error_code="DELETE_DEPENDENTE_ERROR"
+        )
+    except Exception as e:
+        return 500, ErrorResponse(
+            message=f"An error occurred while deleting the dependent: {str(e)}",
+            error_code="DELETE_DEPENDENTE_ERROR"
+        )
@@ -1,84 +1,178 @@
-from ninja import Router
-from typing import List, Union
-from supabase import Client
+from ninja import Router, Query
+from typing import Union
+from supabase import AsyncClient
 
-from app.core.db import get_supabase_client
-from app.schemas.depoimento import DepoimentoResponsavel, DepoimentoResponsavelCreate
-from app.schemas.common import ErrorResponse, SuccessResponse
+from app.core.db import get_async_supabase_client
+from app.core.auth import supabase_admin_auth, supabase_auth
+from app.core.cache import cached_select
+from app.core.config import Settings
+from app.core.depoimentos import enqueue_depoimento, invalidate_aprovados
+from app.core.pagination import PaginationParams, InvalidPageRequest, fetch_page
+from app.core.serialization import respond
+from app.schemas.depoimento import (
+    DepoimentoEnfileirado,
+    DepoimentoFiltros,
+    DepoimentoResponsavel,
+    DepoimentoResponsavelCreate,
+    ModeracaoLote,
+    ModeracaoResponse
+)
+from app.schemas.common import ErrorResponse, Page, partial_model, SuccessResponse
+
+settings = Settings()
 
 router = Router()
 
 
-@router.get("/", response={200: List[DepoimentoResponsavel], 500: ErrorResponse})
-def get_depoimentos(request) -> Union[List[DepoimentoResponsavel], ErrorResponse]:
+@router.get("/", response={200: Page[partial_model(DepoimentoResponsavel)], 400: ErrorResponse, 500: ErrorResponse}, exclude_unset=True)
+async def get_depoimentos(request, params: Query[PaginationParams], filtros: Query[DepoimentoFiltros]) -> Union[Page, ErrorResponse]:
     """
-    Get all approved testimonials (depoimentos)
+    Get approved testimonials (depoimentos), paginated by keyset
+    
+    Pages are served from the reference-data cache, which moderation clears,
+    and read through partial indexes that only hold approved testimonials.
+    
+    Args:
+        params: `limit`, `cursor` (the previous page's `next_cursor`), `order_by`
+            (`id` ascending or `data_criacao` newest first) and `fields`, a
+            comma-separated projection such as `id,texto`
+        filtros: `categoria_id` filter
     
     Returns:
-        List[DepoimentoResponsavel]: List of approved testimonials
+        Page: One page of testimonials and the cursor of the next page
         ErrorResponse: Error response with error details
     """
     try:
-        supabase: Client = get_supabase_client()
-        
-        # Get all approved testimonials
-        result = supabase.table("DepoimentoResponsavel").select("*").eq("aprovado", True).execute()
+        filters = {"aprovado": True}
+        if filtros.categoria_id is not None:
+            filters["categoria_id"] = filtros.categoria_id
         
-        if result.data:
-            return [DepoimentoResponsavel(**depoimento) for depoimento in result.data]
-        else:
-            return []
-            
+        # Get one page of approved testimonials (served from the cache)
+        return respond(await fetch_page(
+            "DepoimentoResponsavel",
+            DepoimentoResponsavel,
+            params,
+            filters=filters,
+            cached=True,
+            direct=True
+        ))
+    
+    except InvalidPageRequest as e:
+        return 400, ErrorResponse(
+            message=str(e),
+            error_code="INVALID_PAGE_REQUEST"
+        )
     except Exception as e:
-        return ErrorResponse(
+        return 500, ErrorResponse(
             message=f"An error occurred while fetching testimonials: {str(e)}",
             error_code="FETCH_DEPOIMENTOS_ERROR"
         )
 
 
-@router.post("/", response={201: DepoimentoResponsavel, 400: ErrorResponse, 500: ErrorResponse})
-def create_depoimento(request, depoimento_data: DepoimentoResponsavelCreate) -> Union[DepoimentoResponsavel, ErrorResponse]:
+@router.post("/", auth=supabase_auth, response={201: DepoimentoResponsavel, 202: DepoimentoEnfileirado, 400: ErrorResponse, 500: ErrorResponse})
+async def create_depoimento(request, depoimento_data: DepoimentoResponsavelCreate) -> Union[DepoimentoResponsavel, DepoimentoEnfileirado, ErrorResponse]:
     """
     Create a new testimonial (depoimento)
     
+    With `DEPOIMENTOS_WRITE_BEHIND=true` the testimonial is only written to a
+    local on-disk queue and the request answers 202; a background worker
+    inserts queued testimonials in batches, so a slow Supabase does not slow
+    down submissions.
+    
     Args:
         depoimento_data: Testimonial data including text and optional category
         
     Returns:
-        DepoimentoResponsavel: Created testimonial
+        DepoimentoResponsavel: Created testimonial (201)
+        DepoimentoEnfileirado: Queue receipt (202, write-behind mode)
         ErrorResponse: Error response with error details
     """
     try:
-        supabase: Client = get_supabase_client()
-        
-        # Get current user
-        user = supabase.auth.get_user()
-        if not user.user:
-            return ErrorResponse(
-                message="User not authenticated",
-                error_code="NOT_AUTHENTICATED"
-            )
-        
-        # Create testimonial
         testimonial_data = {
             "texto": depoimento_data.texto,
             "aprovado": False,  # New testimonials need approval
-            "responsavel_id": user.user.id,
+            "responsavel_id": request.auth.id,
             "categoria_id": depoimento_data.categoria_id
         }
         
-        result = supabase.table("DepoimentoResponsavel").insert(testimonial_data).execute()
+        if settings.depoimentos_write_behind:
+            # Reject an unknown category now (cached), not in the background insert
+            if depoimento_data.categoria_id is not None:
+                categorias = await cached_select("CategoriaMaterial", "id")
+                if all(c["id"] != depoimento_data.categoria_id for c in categorias):
+                    return 400, ErrorResponse(
+                        message="Category not found",
+                        error_code="CATEGORIA_NOT_FOUND"
+                    )
+            
+            # Queue the testimonial on local disk
+            fila_id = await enqueue_depoimento(testimonial_data)
+            return 202, DepoimentoEnfileirado(
+                success=True,
+                message="Testimonial received and awaiting moderation",
+                fila_id=fila_id
+            )
+        
+        supabase: AsyncClient = await get_async_supabase_client()
+        
+        # Create testimonial
+        result = await supabase.table("DepoimentoResponsavel").insert(testimonial_data).execute()
         
         if result.data:
-            return DepoimentoResponsavel(**result.data[0])
+            return 201, DepoimentoResponsavel(**result.data[0])
         else:
-            return ErrorResponse(
+            return 500, ErrorResponse(
                 message="Failed to create testimonial",
                 error_code="CREATE_DEPOIMENTO_FAILED"
             )
             
     except Exception as e:
-        return ErrorResponse(
+        return 500, ErrorResponse(
             message=f"An error occurred while creating testimonial: {str(e)}",
             error_code="CREATE_DEPOIMENTO_ERROR"
         )
+
+
+@router.post("/moderacao", auth=supabase_admin_auth, response={200: ModeracaoResponse, 401: ErrorResponse, 500: ErrorResponse})
+async def moderar_depoimentos(request, lote: ModeracaoLote) -> Union[ModeracaoResponse, ErrorResponse]:
+    """
+    Approve and reject many testimonials at once (administrators only)
+    
+    Both lists are applied by the `moderar_depoimentos` Postgres function in
+    a single UPDATE, i.e. one round trip. The cached pages of approved
+    testimonials are dropped afterwards.
+    
+    Args:
+        lote: Ids to approve and ids to reject (up to 500 each)
+        
+    Returns:
+        ModeracaoResponse: New `aprovado` flag of each updated testimonial and
+            the ids that do not exist
+        ErrorResponse: Error response with error details
+    """
+    try:
+        supabase: AsyncClient = await get_async_supabase_client()
+        
+        # Update every flag in one RPC call
+        result = await supabase.rpc("moderar_depoimentos", {
+            "p_aprovar": lote.aprovar,
+            "p_rejeitar": lote.rejeitar
+        }).execute()
+        
+        atualizados = result.data or []
+        if atualizados:
+            # The approved set changed, drop the cached pages
+            invalidate_aprovados()
+        encontrados = {item["id"] for item in atualizados}
+        return ModeracaoResponse(
+            success=True,
+            message=f"{len(atualizados)} testimonials moderated",
+            atualizados=atualizados,
+            nao_encontrados=[i for i in lote.aprovar + lote.rejeitar if i not in encontrados]
+        )
+    
+    except Exception as e:
+        return 500, ErrorResponse(
+            message=f"An error occurred while moderating testimonials: {str(e)}",
+            error_code="MODERAR_DEPOIMENTOS_ERROR"
+        )
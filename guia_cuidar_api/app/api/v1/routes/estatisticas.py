@@ -1,16 +1,35 @@
-from ninja import Router
+from django.http import HttpResponse, StreamingHttpResponse
+from ninja import Router, Query
 from typing import List, Union
-from supabase import Client
 
-from app.core.db import get_supabase_client
-from app.schemas.estatisticas import DadosEstatisticosTEA
+from app.core.aggregates import InvalidAggregation, fetch_aggregate
+from app.core.cache import cached_select
+from app.core.columnar import (
+    CONTENT_TYPES,
+    EXTENSIONS,
+    ColumnarUnavailable,
+    export_escolarizacao_parquet,
+    stream_escolarizacao,
+)
+from app.core.serialization import project_rows, respond
+from app.schemas.estatisticas import (
+    DadosEstatisticosTEA,
+    EscolarizacaoAgregada,
+    EscolarizacaoParams,
+    ExportacaoParams,
+    NivelAgregado,
+    NivelParams,
+)
 from app.schemas.common import ErrorResponse
 
 router = Router()
 
+ESCOLARIZACAO_DIMENSOES = ("localidade", "ano", "sexo", "faixa_idade", "tipo_deficiencia")
+NIVEL_DIMENSOES = ("local", "dificuldades")
+
 
 @router.get("/", response={200: List[DadosEstatisticosTEA], 500: ErrorResponse})
-def get_dados_estatisticos(request) -> Union[List[DadosEstatisticosTEA], ErrorResponse]:
+async def get_dados_estatisticos(request) -> Union[List[DadosEstatisticosTEA], ErrorResponse]:
     """
     Get all TEA statistical data (dados estatísticos)
     
@@ -19,18 +38,135 @@ def get_dados_estatisticos(request) -> Union[List[DadosEstatisticosTEA], ErrorRe
         ErrorResponse: Error response with error details
     """
     try:
-        supabase: Client = get_supabase_client()
-        
-        # Get all statistical data
-        result = supabase.table("DadosEstatisticosTEA").select("*").execute()
+        # Get all statistical data (served from the reference-data cache)
+        rows = await cached_select("DadosEstatisticosTEA")
         
-        if result.data:
-            return [DadosEstatisticosTEA(**dado) for dado in result.data]
-        else:
-            return []
+        return respond(project_rows(DadosEstatisticosTEA, rows))
             
     except Exception as e:
         return ErrorResponse(
             message=f"An error occurred while fetching statistical data: {str(e)}",
             error_code="FETCH_ESTATISTICAS_ERROR"
         )
+
+
+@router.get("/escolarizacao", response={200: List[EscolarizacaoAgregada], 400: ErrorResponse, 500: ErrorResponse})
+async def get_escolarizacao_agregada(request, params: Query[EscolarizacaoParams]) -> Union[List[EscolarizacaoAgregada], ErrorResponse]:
+    """
+    Get schooling rates (IBGE table 10139) aggregated for charts
+    
+    Served from the `TEA_escolarizacao_agregada` materialized view, which holds
+    every grouping of the raw table; no raw rows are read per request.
+    
+    Args:
+        params: `agrupar` (comma-separated dimensions, empty for the grand total)
+            and optional equality filters on each dimension
+    
+    Returns:
+        List[EscolarizacaoAgregada]: One row per group with avg/min/max rate and row count
+        ErrorResponse: Error response with error details
+    """
+    try:
+        # Get the requested grouping (served from the reference-data cache)
+        rows = await fetch_aggregate(
+            "TEA_escolarizacao_agregada",
+            ESCOLARIZACAO_DIMENSOES,
+            ("media", "minimo", "maximo", "registros"),
+            params.agrupar,
+            params.model_dump(exclude={"agrupar"})
+        )
+        
+        return respond(project_rows(EscolarizacaoAgregada, rows))
+    
+    except InvalidAggregation as e:
+        return 400, ErrorResponse(
+            message=str(e),
+            error_code="INVALID_AGGREGATION"
+        )
+    except Exception as e:
+        return 500, ErrorResponse(
+            message=f"An error occurred while fetching schooling statistics: {str(e)}",
+            error_code="FETCH_ESCOLARIZACAO_ERROR"
+        )
+
+
+@router.get("/escolarizacao/exportar", response={500: ErrorResponse, 501: ErrorResponse})
+async def exportar_escolarizacao(request, params: Query[ExportacaoParams]) -> Union[HttpResponse, ErrorResponse]:
+    """
+    Download every row of TEA_escolarizacao_por_estado in a columnar format
+    
+    For analytics clients: an Arrow IPC stream (`pyarrow.ipc.open_stream`) or a
+    Parquet file (`pandas.read_parquet`), with sexo/faixa_idade/tipo_deficiencia
+    dictionary-encoded. The Arrow stream is sent batch by batch while the table
+    is read (keyset pages of 1000 rows); Parquet needs its footer, so that file
+    is built in memory and cached like reference data.
+    
+    Args:
+        params: `formato` (`arrow` or `parquet`)
+    
+    Returns:
+        HttpResponse: The encoded table as an attachment (streamed for Arrow)
+        ErrorResponse: Error response with error details (501 without pyarrow)
+    """
+    try:
+        if params.formato == "arrow":
+            # Stream the table as it is read
+            response = StreamingHttpResponse(await stream_escolarizacao(), content_type=CONTENT_TYPES["arrow"])
+        else:
+            # Get the Parquet file (served from the reference-data cache)
+            response = HttpResponse(await export_escolarizacao_parquet(), content_type=CONTENT_TYPES["parquet"])
+        response["Content-Disposition"] = (
+            f'attachment; filename="escolarizacao.{EXTENSIONS[params.formato]}"'
+        )
+        return response
+    
+    except ColumnarUnavailable as e:
+        return 501, ErrorResponse(
+            message=str(e),
+            error_code="COLUMNAR_EXPORT_UNAVAILABLE"
+        )
+    except Exception as e:
+        return 500, ErrorResponse(
+            message=f"An error occurred while exporting schooling statistics: {str(e)}",
+            error_code="EXPORT_ESCOLARIZACAO_ERROR"
+        )
+
+
+@router.get("/niveis", response={200: List[NivelAgregado], 400: ErrorResponse, 500: ErrorResponse})
+async def get_nivel_agregado(request, params: Query[NivelParams]) -> Union[List[NivelAgregado], ErrorResponse]:
+    """
+    Get people with TEA by state and number of difficulties, aggregated for charts
+    
+    Served from the `TEA_nivel_agregado` materialized view (sum of absolute
+    counts, average of relative percentages).
+    
+    Args:
+        params: `agrupar` (`local`, `dificuldades`, both or empty for the grand
+            total) and optional equality filters
+    
+    Returns:
+        List[NivelAgregado]: One row per group
+        ErrorResponse: Error response with error details
+    """
+    try:
+        # Get the requested grouping (served from the reference-data cache)
+        rows = await fetch_aggregate(
+            "TEA_nivel_agregado",
+            NIVEL_DIMENSOES,
+            ("soma_absoluto", "media_relativo", "registros"),
+            params.agrupar,
+            params.model_dump(exclude={"agrupar"})
+        )
+        
+        return respond(project_rows(NivelAgregado, rows))
+    
+    except InvalidAggregation as e:
+        return 400, ErrorResponse(
+            message=str(e),
+            error_code="INVALID_AGGREGATION"
+        )
+    except Exception as e:
+        return 500, ErrorResponse(
+            message=f"An error occurred while fetching support-level statistics: {str(e)}",
+            error_code="FETCH_NIVEIS_ERROR"
+        )
@@ -1,87 +1,156 @@
-from ninja import Router
+from ninja import Router, Query
+from ninja.decorators import decorate_view
 from typing import List, Union
-from supabase import Client
+from supabase import AsyncClient
+from postgrest.exceptions import APIError
 
-from app.core.db import get_supabase_client
+from app.core.db import get_async_supabase_client
+from app.core.auth import supabase_auth
+from app.core.cache import cached_select
+from app.core.conditional import conditional_get
+from app.core.pagination import Embed, PaginationParams, InvalidPageRequest, decode_key, encode_key, fetch_page
+from app.core.serialization import project_rows, respond
 from app.schemas.material import (
     MaterialDeApoio, 
+    MaterialDeApoioDetalhado,
+    MaterialFiltros,
     MaterialFavorito, 
     MaterialFavoritoCreate,
+    MaterialFavoritoDetalhado,
+    MaterialFavoritoParams,
+    MaterialFavoritoLote,
+    MaterialFavoritoLoteResponse,
     NivelSuporteTEA,
     CategoriaMaterial
 )
-from app.schemas.common import ErrorResponse, SuccessResponse
+from app.schemas.common import ErrorResponse, Page, partial_model, SuccessResponse
 
 router = Router()
 
+# Names of the category and support level, fetched in the same query (`embed=true`)
+MATERIAL_EMBEDS = [
+    Embed("categoria", "CategoriaMaterial", ("id", "nome"), "categoria_id"),
+    Embed("nivel_suporte", "NivelSuporteTEA", ("id", "nome"), "nivel_suporte_tea_id"),
+]
 
-@router.get("/", response={200: List[MaterialDeApoio], 500: ErrorResponse})
-def get_materiais(request) -> Union[List[MaterialDeApoio], ErrorResponse]:
+# Favorited material with its own embeds (`GET /favoritos?embed=true`)
+FAVORITO_EMBED = "material:MaterialDeApoio(id,titulo,corpo,categoria_id,nivel_suporte_tea_id,{})".format(
+    ",".join(str(e) for e in MATERIAL_EMBEDS)
+)
+
+
+@router.get("/", response={200: Page[partial_model(MaterialDeApoioDetalhado)], 400: ErrorResponse, 500: ErrorResponse}, exclude_unset=True)
+@decorate_view(conditional_get("MaterialDeApoio", *(e.table for e in MATERIAL_EMBEDS)))
+async def get_materiais(request, params: Query[PaginationParams], filtros: Query[MaterialFiltros]) -> Union[Page, ErrorResponse]:
     """
-    Get all support materials (materiais de apoio)
+    Get support materials (materiais de apoio), paginated by keyset
+    
+    Args:
+        params: `limit`, `cursor` (the previous page's `next_cursor`), `order_by`
+            (`id` ascending or `data_criacao` newest first) and `fields`, a
+            comma-separated projection such as `id,titulo,categoria_id`
+        filtros: `categoria_id` and `nivel_suporte_tea_id` filters, and `embed`
+            to include the category and support level names in each item
     
     Returns:
-        List[MaterialDeApoio]: List of all support materials
+        Page: One page of support materials and the cursor of the next page
         ErrorResponse: Error response with error details
     """
     try:
-        supabase: Client = get_supabase_client()
-        
-        # Get all support materials
-        result = supabase.table("MaterialDeApoio").select("*").execute()
+        filters = {
+            column: value
+            for column, value in filtros.model_dump(exclude={"embed"}).items()
+            if value is not None
+        }
+        embeds = MATERIAL_EMBEDS if filtros.embed else None
         
-        if result.data:
-            return [MaterialDeApoio(**material) for material in result.data]
-        else:
-            return []
-            
+        # Get one page of support materials, filtered in the database
+        return respond(await fetch_page(
+            "MaterialDeApoio",
+            MaterialDeApoio,
+            params,
+            filters=filters,
+            embeds=embeds,
+            direct=True
+        ))
+    
+    except InvalidPageRequest as e:
+        return 400, ErrorResponse(
+            message=str(e),
+            error_code="INVALID_PAGE_REQUEST"
+        )
     except Exception as e:
-        return ErrorResponse(
+        return 500, ErrorResponse(
             message=f"An error occurred while fetching support materials: {str(e)}",
             error_code="FETCH_MATERIAIS_ERROR"
         )
 
 
-@router.get("/favoritos", response={200: List[MaterialFavorito], 500: ErrorResponse})
-def get_materiais_favoritos(request) -> Union[List[MaterialFavorito], ErrorResponse]:
+@router.get("/favoritos", auth=supabase_auth, response={200: Page[MaterialFavoritoDetalhado], 400: ErrorResponse, 500: ErrorResponse}, exclude_unset=True)
+async def get_materiais_favoritos(request, params: Query[MaterialFavoritoParams]) -> Union[Page, ErrorResponse]:
     """
-    Get all favorite materials for the current user
+    Get the current user's favorite materials, paginated by keyset
+    
+    Ordered by dependent and material, which is the order of the
+    `MaterialFavorito(responsavel_id, dependente_id, material_id)` index.
+    
+    Args:
+        params: `dependente_id` filter, `embed` to include each material (title,
+            body, category and support level) in the same query, `limit` and
+            `cursor` (the previous page's `next_cursor`)
     
     Returns:
-        List[MaterialFavorito]: List of user's favorite materials
+        Page: One page of favorites and the cursor of the next page
         ErrorResponse: Error response with error details
     """
     try:
-        supabase: Client = get_supabase_client()
+        supabase: AsyncClient = await get_async_supabase_client()
         
-        # Get current user
-        user = supabase.auth.get_user()
-        if not user.user:
-            return ErrorResponse(
-                message="User not authenticated",
-                error_code="NOT_AUTHENTICATED"
+        # Get one page of the user's favorites, with the materials if requested
+        columns = ",".join(MaterialFavorito.model_fields)
+        query = supabase.table("MaterialFavorito").select(
+            f"{columns},{FAVORITO_EMBED}" if params.embed else columns
+        ).eq("responsavel_id", request.auth.id)
+        if params.dependente_id is not None:
+            query = query.eq("dependente_id", params.dependente_id)
+        if params.cursor:
+            last_dependente, last_material = decode_key(params.cursor, 2)
+            if not isinstance(last_dependente, int) or not isinstance(last_material, int):
+                raise InvalidPageRequest("Invalid cursor")
+            query = query.or_(
+                f"dependente_id.gt.{last_dependente},"
+                f"and(dependente_id.eq.{last_dependente},material_id.gt.{last_material})"
             )
+        result = await query.order("dependente_id").order("material_id").limit(params.limit + 1).execute()
         
-        # Get user's favorite materials
-        result = supabase.table("MaterialFavorito").select("*").eq("responsavel_id", user.user.id).execute()
+        rows = result.data or []
+        next_cursor = None
+        if len(rows) > params.limit:
+            rows = rows[:params.limit]
+            next_cursor = encode_key([rows[-1]["dependente_id"], rows[-1]["material_id"]])
         
-        if result.data:
-            return [MaterialFavorito(**favorito) for favorito in result.data]
-        else:
-            return []
-            
+        return respond({"items": rows, "next_cursor": next_cursor})
+    
+    except InvalidPageRequest as e:
+        return 400, ErrorResponse(
+            message=str(e),
+            error_code="INVALID_PAGE_REQUEST"
+        )
     except Exception as e:
-        return ErrorResponse(
+        return 500, ErrorResponse(
             message=f"An error occurred while fetching favorite materials: {str(e)}",
             error_code="FETCH_FAVORITOS_ERROR"
         )
 
 
-@router.post("/favoritar", response={201: MaterialFavorito, 400: ErrorResponse, 500: ErrorResponse})
-def favoritar_material(request, favorito_data: MaterialFavoritoCreate) -> Union[MaterialFavorito, ErrorResponse]:
+@router.post("/favoritar", auth=supabase_auth, response={201: MaterialFavorito, 400: ErrorResponse, 404: ErrorResponse, 409: ErrorResponse, 500: ErrorResponse})
+async def favoritar_material(request, favorito_data: MaterialFavoritoCreate) -> Union[MaterialFavorito, ErrorResponse]:
     """
     Add a material to favorites
     
+    The material check, the dependent ownership check and the insert run in
+    the `favoritar_material` Postgres function, i.e. a single round trip.
+    
     Args:
         favorito_data: Material and dependent information for favoriting
         
@@ -90,64 +159,52 @@ def favoritar_material(request, favorito_data: MaterialFavoritoCreate) -> Union[
         ErrorResponse: Error response with error details
     """
     try:
-        supabase: Client = get_supabase_client()
+        supabase: AsyncClient = await get_async_supabase_client()
         
-        # Get current user
-        user = supabase.auth.get_user()
-        if not user.user:
-            return ErrorResponse(
-                message="User not authenticated",
-                error_code="NOT_AUTHENTICATED"
-            )
+        # Validate and create favorite material in one RPC call
+        result = await supabase.rpc("favoritar_material", {
+            "p_responsavel_id": request.auth.id,
+            "p_material_id": favorito_data.material_id,
+            "p_dependente_id": favorito_data.dependente_id
+        }).execute()
         
-        # Check if material exists
-        material_result = supabase.table("MaterialDeApoio").select("id").eq("id", favorito_data.material_id).execute()
-        if not material_result.data:
-            return ErrorResponse(
+        if result.data:
+            return 201, MaterialFavorito(**result.data[0])
+        else:
+            return 500, ErrorResponse(
+                message="Failed to add material to favorites",
+                error_code="FAVORITAR_FAILED"
+            )
+    
+    except APIError as e:
+        if e.message == "MATERIAL_NOT_FOUND":
+            return 404, ErrorResponse(
                 message="Material not found",
                 error_code="MATERIAL_NOT_FOUND"
             )
-        
-        # Check if dependent belongs to user
-        dependente_result = supabase.table("Dependente").select("id").eq("id", favorito_data.dependente_id).eq("responsavel_id", user.user.id).execute()
-        if not dependente_result.data:
-            return ErrorResponse(
+        if e.message == "DEPENDENTE_NOT_FOUND":
+            return 404, ErrorResponse(
                 message="Dependent not found or does not belong to user",
                 error_code="DEPENDENTE_NOT_FOUND"
             )
-        
-        # Create favorite material
-        favorito_material_data = {
-            "responsavel_id": user.user.id,
-            "material_id": favorito_data.material_id,
-            "dependente_id": favorito_data.dependente_id
-        }
-        
-        result = supabase.table("MaterialFavorito").insert(favorito_material_data).execute()
-        
-        if result.data:
-            return MaterialFavorito(**result.data[0])
-        else:
-            return ErrorResponse(
-                message="Failed to add material to favorites",
-                error_code="FAVORITAR_FAILED"
-            )
-            
-    except Exception as e:
-        error_message = str(e)
-        if "duplicate key" in error_message.lower():
-            return ErrorResponse(
+        if e.code == "23505":
+            return 409, ErrorResponse(
                 message="Material is already in favorites",
                 error_code="ALREADY_FAVORITED"
             )
-        return ErrorResponse(
-            message=f"An error occurred while adding material to favorites: {error_message}",
+        return 500, ErrorResponse(
+            message=f"An error occurred while adding material to favorites: {e.message}",
+            error_code="FAVORITAR_ERROR"
+        )
+    except Exception as e:
+        return 500, ErrorResponse(
+            message=f"An error occurred while adding material to favorites: {str(e)}",
             error_code="FAVORITAR_ERROR"
         )
 
 
-@router.delete("/favoritar/{material_id}/{dependente_id}", response={200: SuccessResponse, 400: ErrorResponse, 500: ErrorResponse})
-def desfavoritar_material(request, material_id: int, dependente_id: int) -> Union[SuccessResponse, ErrorResponse]:
+@router.delete("/favoritar/{material_id}/{dependente_id}", auth=supabase_auth, response={200: SuccessResponse, 400: ErrorResponse, 500: ErrorResponse})
+async def desfavoritar_material(request, material_id: int, dependente_id: int) -> Union[SuccessResponse, ErrorResponse]:
     """
     Remove a material from favorites
     
@@ -160,18 +217,10 @@ def desfavoritar_material(request, material_id: int, dependente_id: int) -> Unio
         ErrorResponse: Error response with error details
     """
     try:
-        supabase: Client = get_supabase_client()
-        
-        # Get current user
-        user = supabase.auth.get_user()
-        if not user.user:
-            return ErrorResponse(
-                message="User not authenticated",
-                error_code="NOT_AUTHENTICATED"
-            )
+        supabase: AsyncClient = await get_async_supabase_client()
         
         # Remove favorite material
-        result = supabase.table("MaterialFavorito").delete().eq("responsavel_id", user.user.id).eq("material_id", material_id).eq("dependente_id", dependente_id).execute()
+        result = await supabase.table("MaterialFavorito").delete().eq("responsavel_id", request.auth.id).eq("material_id", material_id).eq("dependente_id", dependente_id).execute()
         
         if result.data:
             return SuccessResponse(
@@ -191,8 +240,87 @@ def desfavoritar_material(request, material_id: int, dependente_id: int) -> Unio
         )
 
 
+@router.post("/favoritar/lote", auth=supabase_auth, response={200: MaterialFavoritoLoteResponse, 400: ErrorResponse, 500: ErrorResponse})
+async def favoritar_materiais_lote(request, lote: MaterialFavoritoLote) -> Union[MaterialFavoritoLoteResponse, ErrorResponse]:
+    """
+    Add several materials to favorites in one request
+    
+    Every pair is validated and inserted by the `favoritar_materiais_lote`
+    Postgres function in a single round trip. Each result carries one of
+    `CREATED`, `ALREADY_FAVORITED`, `MATERIAL_NOT_FOUND` or `DEPENDENTE_NOT_FOUND`.
+    
+    Args:
+        lote: Material and dependent pairs to favorite (up to 200)
+        
+    Returns:
+        MaterialFavoritoLoteResponse: Per-item status results
+        ErrorResponse: Error response with error details
+    """
+    try:
+        supabase: AsyncClient = await get_async_supabase_client()
+        
+        # Validate and create every favorite in one RPC call
+        result = await supabase.rpc("favoritar_materiais_lote", {
+            "p_responsavel_id": request.auth.id,
+            "p_itens": [item.model_dump() for item in lote.itens]
+        }).execute()
+        
+        resultados = result.data or []
+        created = sum(1 for item in resultados if item["status"] == "CREATED")
+        return MaterialFavoritoLoteResponse(
+            success=True,
+            message=f"{created} of {len(resultados)} materials added to favorites",
+            resultados=resultados
+        )
+    
+    except Exception as e:
+        return 500, ErrorResponse(
+            message=f"An error occurred while adding materials to favorites: {str(e)}",
+            error_code="FAVORITAR_LOTE_ERROR"
+        )
+
+
+@router.post("/desfavoritar/lote", auth=supabase_auth, response={200: MaterialFavoritoLoteResponse, 400: ErrorResponse, 500: ErrorResponse})
+async def desfavoritar_materiais_lote(request, lote: MaterialFavoritoLote) -> Union[MaterialFavoritoLoteResponse, ErrorResponse]:
+    """
+    Remove several materials from favorites in one request
+    
+    The delete runs in the `desfavoritar_materiais_lote` Postgres function in
+    a single round trip. Each result carries `REMOVED` or `FAVORITE_NOT_FOUND`.
+    
+    Args:
+        lote: Material and dependent pairs to remove from favorites (up to 200)
+        
+    Returns:
+        MaterialFavoritoLoteResponse: Per-item status results
+        ErrorResponse: Error response with error details
+    """
+    try:
+        supabase: AsyncClient = await get_async_supabase_client()
+        
+        # Remove every favorite in one RPC call
+        result = await supabase.rpc("desfavoritar_materiais_lote", {
+            "p_responsavel_id": request.auth.id,
+            "p_itens": [item.model_dump() for item in lote.itens]
+        }).execute()
+        
+        resultados = result.data or []
+        removed = sum(1 for item in resultados if item["status"] == "REMOVED")
+        return MaterialFavoritoLoteResponse(
+            success=True,
+            message=f"{removed} of {len(resultados)} materials removed from favorites",
+            resultados=resultados
+        )
+    
+    except Exception as e:
+        return 500, ErrorResponse(
+            message=f"An error occurred while removing materials from favorites: {str(e)}",
+            error_code="DESFAVORITAR_LOTE_ERROR"
+        )
+
+
 @router.get("/categorias", response={200: List[CategoriaMaterial], 500: ErrorResponse})
-def get_categorias_material(request) -> Union[List[CategoriaMaterial], ErrorResponse]:
+async def get_categorias_material(request) -> Union[List[CategoriaMaterial], ErrorResponse]:
     """
     Get all material categories
     
@@ -201,15 +329,10 @@ def get_categorias_material(request) -> Union[List[CategoriaMaterial], ErrorResp
         ErrorResponse: Error response with error details
     """
     try:
-        supabase: Client = get_supabase_client()
-        
-        # Get all material categories
-        result = supabase.table("CategoriaMaterial").select("*").execute()
+        # Get all material categories (served from the reference-data cache)
+        rows = await cached_select("CategoriaMaterial")
         
-        if result.data:
-            return [CategoriaMaterial(**categoria) for categoria in result.data]
-        else:
-            return []
+        return respond(project_rows(CategoriaMaterial, rows))
             
     except Exception as e:
         return ErrorResponse(
@@ -219,7 +342,7 @@ def get_categorias_material(request) -> Union[List[CategoriaMaterial], ErrorResp
 
 
 @router.get("/niveis-suporte", response={200: List[NivelSuporteTEA], 500: ErrorResponse})
-def get_niveis_suporte(request) -> Union[List[NivelSuporteTEA], ErrorResponse]:
+async def get_niveis_suporte(request) -> Union[List[NivelSuporteTEA], ErrorResponse]:
     """
     Get all TEA support levels
     
@@ -228,15 +351,10 @@ def get_niveis_suporte(request) -> Union[List[NivelSuporteTEA], ErrorResponse]:
         ErrorResponse: Error response with error details
     """
     try:
-        supabase: Client = get_supabase_client()
-        
-        # Get all TEA support levels
-        result = supabase.table("NivelSuporteTEA").select("*").execute()
+        # Get all TEA support levels (served from the reference-data cache)
+        rows = await cached_select("NivelSuporteTEA")
         
-        if result.data:
-            return [NivelSuporteTEA(**nivel) for nivel in result.data]
-        else:
-            return []
+        return respond(project_rows(NivelSuporteTEA, rows))
             
     except Exception as e:
         return ErrorResponse(
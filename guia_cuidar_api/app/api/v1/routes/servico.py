@@ -1,43 +1,113 @@
-from ninja import Router
+from ninja import Router, Query
+from ninja.decorators import decorate_view
 from typing import List, Union
-from supabase import Client
+from supabase import AsyncClient
 
-from app.core.db import get_supabase_client
-from app.schemas.servico import ServicoLocal, TipoServico
-from app.schemas.common import ErrorResponse
+from app.core.cache import cached_select
+from app.core.conditional import conditional_get
+from app.core.db import get_async_supabase_client
+from app.core.pagination import PaginationParams, InvalidPageRequest, decode_key, encode_key, fetch_page
+from app.core.serialization import project_rows, respond
+from app.schemas.servico import ProximosParams, ServicoLocal, ServicoProximo, TipoServico
+from app.schemas.common import ErrorResponse, Page, partial_model
 
 router = Router()
 
 
-@router.get("/", response={200: List[ServicoLocal], 500: ErrorResponse})
-def get_servicos_locais(request) -> Union[List[ServicoLocal], ErrorResponse]:
+@router.get("/", response={200: Page[partial_model(ServicoLocal)], 400: ErrorResponse, 500: ErrorResponse}, exclude_unset=True)
+@decorate_view(conditional_get("ServicoLocal"))
+async def get_servicos_locais(request, params: Query[PaginationParams]) -> Union[Page, ErrorResponse]:
     """
-    Get all service locations (serviços locais)
+    Get service locations (serviços locais), paginated by keyset
+    
+    Args:
+        params: `limit`, `cursor` (the previous page's `next_cursor`), `order_by`
+            (`id` ascending or `data_criacao` newest first) and `fields`, a
+            comma-separated projection such as `id,name,endereco`
     
     Returns:
-        List[ServicoLocal]: List of all service locations
+        Page: One page of service locations and the cursor of the next page
         ErrorResponse: Error response with error details
     """
     try:
-        supabase: Client = get_supabase_client()
-        
-        # Get all service locations
-        result = supabase.table("ServicoLocal").select("*").execute()
-        
-        if result.data:
-            return [ServicoLocal(**servico) for servico in result.data]
-        else:
-            return []
-            
+        # Get one page of service locations
+        return respond(await fetch_page(
+            "ServicoLocal",
+            ServicoLocal,
+            params,
+            direct=True
+        ))
+    
+    except InvalidPageRequest as e:
+        return 400, ErrorResponse(
+            message=str(e),
+            error_code="INVALID_PAGE_REQUEST"
+        )
     except Exception as e:
-        return ErrorResponse(
+        return 500, ErrorResponse(
             message=f"An error occurred while fetching service locations: {str(e)}",
             error_code="FETCH_SERVICOS_ERROR"
         )
 
 
+@router.get("/proximos", response={200: Page[ServicoProximo], 400: ErrorResponse, 500: ErrorResponse})
+async def get_servicos_proximos(request, params: Query[ProximosParams]) -> Union[Page, ErrorResponse]:
+    """
+    Get service locations near a point, closest first
+    
+    Runs the `servicos_proximos` Postgres function, which prefilters with a
+    GiST-indexed `earth_box` and sorts by `earth_distance`. Services without
+    coordinates are not returned.
+    
+    Args:
+        params: `lat`/`lon` of the point, `raio` in km, optional `tipo`
+            (tipo_servico_id), `limit` and `cursor`
+    
+    Returns:
+        Page: One page of services with `distancia_m` and the next cursor
+        ErrorResponse: Error response with error details
+    """
+    try:
+        distancia, last_id = None, None
+        if params.cursor:
+            distancia, last_id = decode_key(params.cursor, 2)
+            if not isinstance(distancia, (int, float)) or not isinstance(last_id, int):
+                raise InvalidPageRequest("Invalid cursor")
+        supabase: AsyncClient = await get_async_supabase_client()
+        
+        # Get the nearest services in one RPC call; one extra row tells if there is a next page
+        result = await supabase.rpc("servicos_proximos", {
+            "p_lat": params.lat,
+            "p_lon": params.lon,
+            "p_raio_m": params.raio * 1000,
+            "p_tipo_servico_id": params.tipo,
+            "p_limite": params.limit + 1,
+            "p_cursor_distancia": distancia,
+            "p_cursor_id": last_id
+        }).execute()
+        
+        rows = result.data or []
+        next_cursor = None
+        if len(rows) > params.limit:
+            rows = rows[:params.limit]
+            next_cursor = encode_key([rows[-1]["distancia_m"], rows[-1]["id"]])
+        
+        return respond({"items": rows, "next_cursor": next_cursor})
+    
+    except InvalidPageRequest as e:
+        return 400, ErrorResponse(
+            message=str(e),
+            error_code="INVALID_PAGE_REQUEST"
+        )
+    except Exception as e:
+        return 500, ErrorResponse(
+            message=f"An error occurred while fetching nearby services: {str(e)}",
+            error_code="FETCH_SERVICOS_PROXIMOS_ERROR"
+        )
+
+
 @router.get("/tipos", response={200: List[TipoServico], 500: ErrorResponse})
-def get_tipos_servico(request) -> Union[List[TipoServico], ErrorResponse]:
+async def get_tipos_servico(request) -> Union[List[TipoServico], ErrorResponse]:
     """
     Get all service types (tipos de serviço)
     
@@ -46,15 +116,10 @@ def get_tipos_servico(request) -> Union[List[TipoServico], ErrorResponse]:
         ErrorResponse: Error response with error details
     """
     try:
-        supabase: Client = get_supabase_client()
-        
-        # Get all service types
-        result = supabase.table("TipoServico").select("*").execute()
+        # Get all service types (served from the reference-data cache)
+        rows = await cached_select("TipoServico")
         
-        if result.data:
-            return [TipoServico(**tipo) for tipo in result.data]
-        else:
-            return []
+        return respond(project_rows(TipoServico, rows))
             
     except Exception as e:
         return ErrorResponse(
@@ -0,0 +1,79 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.core.cache import reference_cache
+from app.core.db import get_async_supabase_client
+
+
+class InvalidAggregation(ValueError):
+    """Raised for an unknown dimension in `agrupar=`"""
+
+
+def parse_dimensions(agrupar: Optional[str], dimensions: Sequence[str]) -> List[str]:
+    """Turn a comma-separated `agrupar=` value into dimension names, in view order."""
+    requested = [d.strip() for d in (agrupar or "").split(",") if d.strip()]
+    unknown = [d for d in requested if d not in dimensions]
+    if unknown:
+        raise InvalidAggregation(
+            f"Unknown dimensions: {', '.join(unknown)} (expected {', '.join(dimensions)})"
+        )
+    return [d for d in dimensions if d in requested]
+
+
+def grouping_mask(dimensions: Sequence[str], grouped: Sequence[str]) -> int:
+    """
+    Value of `GROUPING(*dimensions)` for rows grouped by `grouped`.
+
+    Postgres sets one bit per aggregated (not grouped) dimension, the first
+    dimension being the most significant bit.
+    """
+    last = len(dimensions) - 1
+    return sum(1 << (last - i) for i, d in enumerate(dimensions) if d not in grouped)
+
+
+async def fetch_aggregate(
+    view: str,
+    dimensions: Sequence[str],
+    measures: Sequence[str],
+    agrupar: Optional[str],
+    filters: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """
+    Read one grouping of a `GROUP BY CUBE` materialized view.
+
+    The views store every grouping set with an `agrupamento` column holding
+    `GROUPING()` of the dimensions (see
+    supabase-project/volumes/db/init/11_estatisticas_agregadas.sql), so a
+    chart query is an indexed lookup instead of an aggregation over raw rows.
+    Filtered dimensions are added to the grouping, so filtering by `ano=2022`
+    while grouping by `localidade` reads the (localidade, ano) rows for 2022.
+
+    Args:
+        view: Materialized view name
+        dimensions: Dimension columns of the view, in `GROUPING()` order
+        measures: Aggregate columns to return
+        agrupar: Comma-separated dimensions to group by (none = grand total)
+        filters: Equality filters on dimensions; `None` values are ignored
+
+    Returns:
+        list: Raw rows ordered by the grouped dimensions
+
+    Raises:
+        InvalidAggregation: If `agrupar` names an unknown dimension
+    """
+    filters = {k: v for k, v in filters.items() if v is not None}
+    grouped = parse_dimensions(agrupar, dimensions)
+    mask = grouping_mask(dimensions, set(grouped) | set(filters))
+    columns = ",".join([*dimensions, *measures])
+
+    async def load():
+        supabase = await get_async_supabase_client()
+        query = supabase.table(view).select(columns).eq("agrupamento", mask)
+        for column, value in filters.items():
+            query = query.eq(column, value)
+        for column in grouped:
+            query = query.order(column)
+        result = await query.execute()
+        return result.data or []
+
+    key = (mask, tuple(grouped), tuple(sorted(filters.items())))
+    return await reference_cache.get_or_load(view, key, load)
@@ -0,0 +1,134 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import jwt
+from ninja.security import HttpBearer
+
+from app.core.config import Settings
+
+settings = Settings()
+
+_jwks_client: Optional[jwt.PyJWKClient] = None
+
+
+@dataclass
+class AuthenticatedUser:
+    """User identity taken from a verified Supabase access token"""
+    id: str
+    token: str
+    email: Optional[str] = None
+    role: Optional[str] = None
+    claims: Dict[str, Any] = field(default_factory=dict)
+
+
+def get_jwks_client() -> jwt.PyJWKClient:
+    """
+    Get the JWKS client for the Supabase project.
+
+    The key set is cached in-process for `JWKS_CACHE_TTL` seconds, so the
+    endpoint is only hit on startup, after expiry or for an unknown `kid`.
+    Fetches give up after `JWKS_TIMEOUT` seconds.
+    """
+    global _jwks_client
+    if _jwks_client is None:
+        _jwks_client = jwt.PyJWKClient(
+            f"{settings.supabase_url}/auth/v1/.well-known/jwks.json",
+            cache_jwk_set=True,
+            lifespan=settings.jwks_cache_ttl,
+            headers={"apikey": settings.supabase_key},
+            timeout=settings.jwks_timeout,
+        )
+    return _jwks_client
+
+
+def verify_token(token: str) -> Dict[str, Any]:
+    """
+    Verify a Supabase access token locally and return its claims.
+
+    HS256 tokens are checked against `SUPABASE_JWT_SECRET`; asymmetric
+    tokens (RS256/ES256) against the cached JWKS.
+
+    Raises:
+        jwt.PyJWTError: If the token is malformed, expired or badly signed
+    """
+    algorithm = jwt.get_unverified_header(token).get("alg")
+    if algorithm == "HS256":
+        if not settings.supabase_jwt_secret:
+            raise jwt.InvalidKeyError("SUPABASE_JWT_SECRET is not configured")
+        key = settings.supabase_jwt_secret
+    elif algorithm in ("RS256", "ES256"):
+        key = get_jwks_client().get_signing_key_from_jwt(token).key
+    else:
+        raise jwt.InvalidAlgorithmError(f"Unsupported algorithm: {algorithm}")
+
+    return jwt.decode(
+        token,
+        key,
+        algorithms=[algorithm],
+        audience=settings.jwt_audience,
+        options={"require": ["exp", "sub"]},
+    )
+
+
+async def averify_token(token: str) -> Dict[str, Any]:
+    """
+    `verify_token` for async views.
+
+    Asymmetric tokens may need a (blocking) JWKS fetch, so they are verified
+    in a worker thread instead of on the event loop; HS256 tokens are only
+    CPU work and are verified inline.
+    """
+    if jwt.get_unverified_header(token).get("alg") == "HS256":
+        return verify_token(token)
+    return await asyncio.to_thread(verify_token, token)
+
+
+class SupabaseJWTAuth(HttpBearer):
+    """
+    Request-scoped bearer authentication.
+
+    Validates the `Authorization: Bearer <access_token>` header without a
+    round trip to Supabase Auth and exposes the user as `request.auth`.
+    Async, so it can only guard async views.
+    """
+
+    # Tells django-ninja to await `authenticate`
+    is_async = True
+
+    async def authenticate(self, request, token: str) -> Optional[AuthenticatedUser]:
+        try:
+            claims = await averify_token(token)
+        except jwt.PyJWTError:
+            return None
+        return AuthenticatedUser(
+            id=claims["sub"],
+            token=token,
+            email=claims.get("email"),
+            role=claims.get("role"),
+            claims=claims,
+        )
+
+
+supabase_auth = SupabaseJWTAuth()
+
+
+class SupabaseAdminAuth(SupabaseJWTAuth):
+    """
+    Bearer authentication restricted to administrators.
+
+    The role is read from `app_metadata.role`, which only the service role
+    can set, and must be one of `ADMIN_ROLES`.
+    """
+
+    async def authenticate(self, request, token: str) -> Optional[AuthenticatedUser]:
+        user = await super().authenticate(request, token)
+        if user is None:
+            return None
+        roles = {r.strip() for r in settings.admin_roles.split(",") if r.strip()}
+        if (user.claims.get("app_metadata") or {}).get("role") not in roles:
+            return None
+        return user
+
+
+supabase_admin_auth = SupabaseAdminAuth()
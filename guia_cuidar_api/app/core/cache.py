@@ -0,0 +1,204 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from app.core.config import Settings
+from app.core.db import get_async_supabase_client
+
+settings = Settings()
+
+# Reference tables change rarely (weekly at most); these TTLs bound how stale
+# a response can be when no invalidation webhook reaches us.
+TABLE_TTLS: Dict[str, float] = {
+    "CategoriaMaterial": 3600,
+    "NivelSuporteTEA": 3600,
+    "TipoServico": 3600,
+    "DadosEstatisticosTEA": 1800,
+    "ArtigoInformativo": 600,
+    # Approved testimonials only; dropped by POST /depoimentos/moderacao
+    "DepoimentoResponsavel": 300,
+    # Materialized views, refreshed by the IBGE import scripts
+    "TEA_escolarizacao_agregada": 1800,
+    "TEA_nivel_agregado": 1800,
+    # Parquet export of the raw table (app/core/columnar.py)
+    "TEA_escolarizacao_por_estado": 1800,
+}
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    loads: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+
+
+@dataclass
+class TTLCache:
+    """
+    Bounded in-process LRU cache with per-table TTLs.
+
+    Entries are keyed by `(table, key)`. Concurrent misses for the same key
+    share a single upstream load (single-flight), so a cold or expired entry
+    never triggers a burst of identical Supabase queries.
+    """
+
+    max_entries: int = 512
+    default_ttl: float = 300
+    ttls: Dict[str, float] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self._entries: "OrderedDict[Tuple[str, Hashable], _Entry]" = OrderedDict()
+        self._inflight: Dict[Tuple[Any, str, Hashable], asyncio.Future] = {}
+        self._stats: Dict[str, CacheStats] = {}
+        self._lock = threading.Lock()
+
+    def _table_stats(self, table: str) -> CacheStats:
+        return self._stats.setdefault(table, CacheStats())
+
+    def get(self, table: str, key: Hashable) -> Tuple[bool, Any]:
+        """Return `(found, value)` for a fresh entry, counting the hit or miss."""
+        with self._lock:
+            stats = self._table_stats(table)
+            entry = self._entries.get((table, key))
+            if entry is not None and entry.expires_at > time.monotonic():
+                self._entries.move_to_end((table, key))
+                stats.hits += 1
+                return True, entry.value
+            if entry is not None:
+                del self._entries[(table, key)]
+            stats.misses += 1
+            return False, None
+
+    def set(self, table: str, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store a value, evicting least recently used entries past `max_entries`."""
+        ttl = ttl if ttl is not None else self.ttls.get(table, self.default_ttl)
+        with self._lock:
+            self._entries[(table, key)] = _Entry(value, time.monotonic() + ttl)
+            self._entries.move_to_end((table, key))
+            while len(self._entries) > self.max_entries:
+                (evicted_table, _), _ = self._entries.popitem(last=False)
+                self._table_stats(evicted_table).evictions += 1
+
+    async def get_or_load(
+        self,
+        table: str,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """
+        Return the cached value for `(table, key)`, calling `loader` on a miss.
+
+        Only one `loader` call per key runs at a time on a given event loop;
+        other callers await its result. Failures are propagated to every
+        waiter and are not cached. `ttl` overrides the table's TTL.
+        """
+        found, value = self.get(table, key)
+        if found:
+            return value
+
+        # Futures belong to one event loop, so in-flight loads are tracked per loop.
+        flight_key = (asyncio.get_running_loop(), table, key)
+        pending = self._inflight.get(flight_key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[flight_key] = future
+        try:
+            value = await loader()
+            self._table_stats(table).loads += 1
+            self.set(table, key, value, ttl)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure does not log a warning.
+            future.exception()
+            raise
+        finally:
+            del self._inflight[flight_key]
+
+    def invalidate(self, table: Optional[str] = None) -> int:
+        """
+        Drop every entry for `table` (or the whole cache when omitted).
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            keys = [k for k in self._entries if table is None or k[0] == table]
+            for k in keys:
+                del self._entries[k]
+            for name in ({table} if table else set(self._stats)):
+                self._table_stats(name).invalidations += 1
+            return len(keys)
+
+    def discard(self, table: str, key: Hashable) -> bool:
+        """Drop a single entry; returns True if it was cached."""
+        with self._lock:
+            removed = self._entries.pop((table, key), None) is not None
+            self._table_stats(table).invalidations += 1
+            return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters per table plus current size."""
+        with self._lock:
+            tables = {name: vars(s).copy() for name, s in self._stats.items()}
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": sum(s["hits"] for s in tables.values()),
+                "misses": sum(s["misses"] for s in tables.values()),
+                "tables": tables,
+            }
+
+
+# Shared cache for reference-data endpoints
+reference_cache = TTLCache(
+    max_entries=settings.cache_max_entries,
+    default_ttl=settings.cache_default_ttl,
+    ttls=TABLE_TTLS,
+)
+
+# Per-user rows (one entry per user and table), kept apart so they never
+# evict reference data
+user_cache = TTLCache(
+    max_entries=settings.user_cache_max_entries,
+    default_ttl=settings.user_cache_ttl,
+)
+
+
+async def cached_select(table: str, columns: str = "*") -> list:
+    """
+    Fetch every row of a reference table through `reference_cache`.
+
+    Args:
+        table: Supabase table name
+        columns: PostgREST select expression
+
+    Returns:
+        list: Raw rows as returned by PostgREST
+    """
+    async def load():
+        supabase = await get_async_supabase_client()
+        result = await supabase.table(table).select(columns).execute()
+        return result.data or []
+
+    return await reference_cache.get_or_load(table, columns, load)
+
+
+def invalidate(table: Optional[str] = None) -> int:
+    """Invalidation hook: drop cached data for `table` (or everything)."""
+    return reference_cache.invalidate(table) + user_cache.invalidate(table)
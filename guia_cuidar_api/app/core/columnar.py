@@ -0,0 +1,217 @@
+import io
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Sequence
+
+from app.core.cache import reference_cache
+from app.core.db import get_async_supabase_client
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional, only the columnar export endpoints need it
+    pa = pq = None
+
+ExportFormat = Literal["arrow", "parquet"]
+
+CONTENT_TYPES: Dict[str, str] = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+EXTENSIONS: Dict[str, str] = {"arrow": "arrows", "parquet": "parquet"}
+
+# PostgREST caps every response at `max-rows` (1000 on Supabase)
+PAGE_SIZE = 1000
+
+# Unique key of TEA_escolarizacao_por_estado (TEA_escolarizacao_por_estado_chave_idx)
+ESCOLARIZACAO_KEY = ("localidade", "ano", "sexo", "faixa_idade", "tipo_deficiencia")
+
+
+class ColumnarUnavailable(RuntimeError):
+    """Raised when pyarrow is not installed"""
+
+
+def escolarizacao_schema() -> "pa.Schema":
+    """
+    Arrow schema of TEA_escolarizacao_por_estado.
+
+    The repeated categories are dictionary-encoded, so each distinct value is
+    stored once and pandas reads them as `category` columns (same layout as
+    the files written by scripts/ibge/sinks.py).
+    """
+    category = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("localidade", pa.string()),
+        ("ano", pa.int64()),
+        ("sexo", category),
+        ("faixa_idade", category),
+        ("tipo_deficiencia", category),
+        ("taxa_escolarizacao", pa.float64()),
+    ])
+
+
+def _quote(value: Any) -> str:
+    """A value inside a PostgREST `or=(...)` filter (strings double-quoted)."""
+    if isinstance(value, str):
+        return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    return str(value)
+
+
+def after_key(order: Sequence[str], last: Dict[str, Any]) -> Optional[str]:
+    """
+    PostgREST `or` filter for the rows after `last` in `order`.
+
+    Ascending order with nulls last, as PostgREST sorts by default: the
+    comparison is expanded column by column (`a > x`, or `a = x and b > y`,
+    ...), with nulls sorting after every value.
+
+    Returns:
+        str: The filter, or None if nothing can follow `last`
+    """
+    terms = []
+    for i, column in enumerate(order):
+        value = last[column]
+        if value is None:
+            # Nothing sorts after a null in this column
+            continue
+        equal = [f"{c}.is.null" if last[c] is None else f"{c}.eq.{_quote(last[c])}" for c in order[:i]]
+        for greater in (f"{column}.gt.{_quote(value)}", f"{column}.is.null"):
+            terms.append(f"and({','.join(equal + [greater])})" if equal else greater)
+    return ",".join(terms) or None
+
+
+async def iter_pages(table: str, columns: Sequence[str], order: Sequence[str]) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Read a whole table through PostgREST with keyset pagination.
+
+    Each request asks for the `PAGE_SIZE` rows after the last one seen, so
+    every page is an index range on `order` (it must match a unique index)
+    instead of a growing offset. Rows with a non-null first key column are
+    read first, with that column as a range bound the index can start from;
+    the rows where it is null follow.
+
+    Args:
+        table: Supabase table name
+        columns: Columns to select
+        order: Columns of a unique key, giving a stable order across pages
+
+    Yields:
+        list: Raw rows, at most `PAGE_SIZE` per page
+    """
+    supabase = await get_async_supabase_client()
+    lead = order[0]
+    for nulls in (False, True):
+        last: Optional[Dict[str, Any]] = None
+        while True:
+            query = supabase.table(table).select(",".join(columns))
+            query = query.is_(lead, "null") if nulls else query.not_.is_(lead, "null")
+            if last is not None:
+                after = after_key(order[1:] if nulls else order, last)
+                if after is None:
+                    break
+                if not nulls:
+                    query = query.gte(lead, last[lead])
+                query = query.or_(after)
+            for column in order:
+                query = query.order(column)
+            page = (await query.limit(PAGE_SIZE).execute()).data or []
+            if page:
+                yield page
+            if len(page) < PAGE_SIZE:
+                break
+            last = page[-1]
+
+
+async def fetch_all_rows(table: str, columns: Sequence[str], order: Sequence[str]) -> List[Dict[str, Any]]:
+    """Read a whole table through PostgREST (see `iter_pages`)."""
+    return [row async for page in iter_pages(table, columns, order) for row in page]
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file collecting what an Arrow writer emits until `take()`."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def take(self) -> bytes:
+        data, self._chunks = b"".join(self._chunks), []
+        return data
+
+
+def encode_rows(rows: List[Dict[str, Any]], schema: "pa.Schema", fmt: ExportFormat) -> bytes:
+    """Encode rows as one Arrow IPC stream or Parquet (zstd) file."""
+    table = pa.Table.from_pylist(rows, schema=schema)
+    sink = pa.BufferOutputStream()
+    if fmt == "parquet":
+        pq.write_table(table, sink, compression="zstd")
+    else:
+        with pa.ipc.new_stream(sink, schema) as writer:
+            writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ColumnarUnavailable("Columnar export requires pyarrow (pip install 'guiacuidarapi[arrow]')")
+
+
+async def stream_escolarizacao() -> AsyncIterator[bytes]:
+    """
+    Stream TEA_escolarizacao_por_estado as an Arrow IPC stream.
+
+    One record batch is written per PostgREST page, each with its own
+    dictionaries (replacement is allowed in the stream format), so memory
+    stays bounded by one page. The first page is read before returning, so
+    upstream and configuration errors surface before the response starts.
+
+    Returns:
+        AsyncIterator[bytes]: The stream's bytes (schema, batches, end marker)
+
+    Raises:
+        ColumnarUnavailable: If pyarrow is not installed
+    """
+    _require_pyarrow()
+    schema = escolarizacao_schema()
+    pages = iter_pages("TEA_escolarizacao_por_estado", schema.names, ESCOLARIZACAO_KEY)
+    first = await anext(pages, [])
+
+    async def chunks():
+        sink = _ChunkSink()
+        with pa.ipc.new_stream(sink, schema) as writer:
+            if first:
+                writer.write_batch(pa.RecordBatch.from_pylist(first, schema=schema))
+                yield sink.take()
+            async for page in pages:
+                writer.write_batch(pa.RecordBatch.from_pylist(page, schema=schema))
+                yield sink.take()
+        yield sink.take()
+
+    return chunks()
+
+
+async def export_escolarizacao_parquet() -> bytes:
+    """
+    Export TEA_escolarizacao_por_estado as one Parquet (zstd) file.
+
+    Parquet ends with a footer describing the whole file, and its readers
+    need all of it, so this one is buffered rather than streamed. The file is
+    cached in `reference_cache` under the table name, so repeated downloads
+    reuse one buffer until the TTL expires or the table is invalidated.
+
+    Raises:
+        ColumnarUnavailable: If pyarrow is not installed
+    """
+    _require_pyarrow()
+    schema = escolarizacao_schema()
+
+    async def load():
+        rows = await fetch_all_rows("TEA_escolarizacao_por_estado", schema.names, ESCOLARIZACAO_KEY)
+        return encode_rows(rows, schema, "parquet")
+
+    return await reference_cache.get_or_load("TEA_escolarizacao_por_estado", ("export", "parquet"), load)
@@ -0,0 +1,94 @@
+import asyncio
+import hashlib
+from functools import wraps
+from typing import Dict, Optional
+
+from django.http import HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags, quote_etag
+
+from app.core.cache import reference_cache
+from app.core.config import Settings
+from app.core.db import get_async_supabase_client
+
+settings = Settings()
+
+# Last version seen per table, used to drop stale cached pages on change
+_versions: Dict[str, str] = {}
+
+
+async def table_version(table: str) -> str:
+    """
+    Cheap version of `table`: its newest `data_atualizacao` and its row count.
+    
+    Both come from one PostgREST call (ordered `limit=1` plus `count=exact`)
+    and are reused for `ETAG_VERSION_TTL` seconds, so a burst of polls costs
+    one query. When the version moves, cached pages of `table` are dropped.
+    
+    Args:
+        table: Supabase table name with a `data_atualizacao` column
+    
+    Returns:
+        str: Opaque version string
+    """
+    async def load():
+        supabase = await get_async_supabase_client()
+        result = await (
+            supabase.table(table)
+            .select("data_atualizacao", count="exact")
+            .order("data_atualizacao", desc=True, nullsfirst=False)
+            .limit(1)
+            .execute()
+        )
+        newest = result.data[0]["data_atualizacao"] if result.data else None
+        version = f"{newest}:{result.count}"
+        if _versions.get(table) not in (None, version):
+            reference_cache.invalidate(table)
+        _versions[table] = version
+        return version
+
+    return await reference_cache.get_or_load(table, ("version",), load, ttl=settings.etag_version_ttl)
+
+
+def conditional_get(table: str, *embedded: str):
+    """
+    View decorator adding a strong ETag and `Cache-Control` to a list endpoint.
+    
+    The ETag hashes the table version with the full request path, so every
+    page/projection has its own tag. A matching `If-None-Match` is answered
+    with `304 Not Modified` before the handler runs. Apply it with
+    `ninja.decorators.decorate_view` below the route decorator.
+    
+    Args:
+        table: Table whose version determines the response
+        embedded: Tables the response may embed (e.g. with `embed=true`);
+            their versions are part of every tag too
+    """
+    def decorator(run):
+        @wraps(run)
+        async def wrapper(request, *args, **kwargs):
+            etag: Optional[str] = None
+            try:
+                versions = await asyncio.gather(*(table_version(t) for t in (table, *embedded)))
+                version = ":".join(versions)
+                digest = hashlib.sha256(f"{table}:{version}:{request.get_full_path()}".encode()).hexdigest()
+                etag = quote_etag(digest[:32])
+            except Exception:
+                # Without a version just serve the full response, uncached
+                pass
+
+            client_etags = parse_etags(request.headers.get("If-None-Match", ""))
+            if etag and (etag in client_etags or "*" in client_etags):
+                response = HttpResponseNotModified()
+            else:
+                response = await run(request, *args, **kwargs)
+                if not etag or response.status_code != 200:
+                    return response
+
+            response["ETag"] = etag
+            patch_cache_control(response, public=True, max_age=settings.http_cache_max_age, must_revalidate=True)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -7,4 +7,64 @@ load_dotenv(override=True)
 @dataclass
 class Settings:
     supabase_url: str = os.getenv("SUPABASE_URL")
-    supabase_key: str = os.getenv("SUPABASE_KEY")
\ No newline at end of file
+    supabase_key: str = os.getenv("SUPABASE_KEY")
+
+    # Local JWT verification (HS256 secret and/or the project's JWKS)
+    supabase_jwt_secret: str = os.getenv("SUPABASE_JWT_SECRET")
+    jwt_audience: str = os.getenv("JWT_AUDIENCE", "authenticated")
+    jwks_cache_ttl: float = float(os.getenv("JWKS_CACHE_TTL", "600"))
+    jwks_timeout: float = float(os.getenv("JWKS_TIMEOUT", "5"))
+
+    # Reference-data cache
+    cache_max_entries: int = int(os.getenv("CACHE_MAX_ENTRIES", "512"))
+    cache_default_ttl: float = float(os.getenv("CACHE_DEFAULT_TTL", "300"))
+    cache_invalidation_token: str = os.getenv("CACHE_INVALIDATION_TOKEN")
+    # Per-user data (e.g. a caregiver's dependents); each worker has its own copy,
+    # so the TTL bounds how long another worker can serve a stale list
+    user_cache_max_entries: int = int(os.getenv("USER_CACHE_MAX_ENTRIES", "2048"))
+    user_cache_ttl: float = float(os.getenv("USER_CACHE_TTL", "30"))
+
+    # Write-behind testimonials: queue submissions on local disk and answer 202;
+    # a background thread (or `manage.py drain_depoimentos`) inserts them in batches
+    depoimentos_write_behind: bool = os.getenv("DEPOIMENTOS_WRITE_BEHIND", "false").lower() in ("1", "true", "yes")
+    depoimentos_queue_path: str = os.getenv("DEPOIMENTOS_QUEUE_PATH", "var/depoimentos_queue.sqlite3")
+    write_queue_batch_size: int = int(os.getenv("WRITE_QUEUE_BATCH_SIZE", "100"))
+    write_queue_interval: float = float(os.getenv("WRITE_QUEUE_INTERVAL", "1"))
+    write_queue_lease: float = float(os.getenv("WRITE_QUEUE_LEASE", "60"))
+    # Attempts only count rows the database rejects; upstream failures just back off
+    write_queue_max_attempts: int = int(os.getenv("WRITE_QUEUE_MAX_ATTEMPTS", "8"))
+    write_queue_backoff: float = float(os.getenv("WRITE_QUEUE_BACKOFF", "2"))
+    write_queue_max_backoff: float = float(os.getenv("WRITE_QUEUE_MAX_BACKOFF", "300"))
+
+    # `app_metadata.role` values allowed to moderate testimonials
+    admin_roles: str = os.getenv("ADMIN_ROLES", "admin")
+
+    # Render trusted PostgREST rows straight to JSON, skipping response re-validation
+    trusted_responses: bool = os.getenv("TRUSTED_RESPONSES", "true").lower() in ("1", "true", "yes")
+
+    # Conditional GET (ETag) on catalog endpoints
+    http_cache_max_age: int = int(os.getenv("HTTP_CACHE_MAX_AGE", "0"))
+    etag_version_ttl: float = float(os.getenv("ETAG_VERSION_TTL", "1"))
+    # Supabase HTTP connection pool (one pooled client per service and event loop).
+    # Keep it small: httpcore's bookkeeping grows quadratically with open
+    # connections (benchmarks/http_pool.py); extra calls queue for a free one.
+    supabase_max_connections: int = int(os.getenv("SUPABASE_MAX_CONNECTIONS", "20"))
+    supabase_max_keepalive: int = int(os.getenv("SUPABASE_MAX_KEEPALIVE", "20"))
+    # Keep below the gateway's idle timeout (Kong: 60 s) so we never reuse a closed socket
+    supabase_keepalive_expiry: float = float(os.getenv("SUPABASE_KEEPALIVE_EXPIRY", "30"))
+    supabase_timeout: float = float(os.getenv("SUPABASE_TIMEOUT", "30"))
+    supabase_connect_timeout: float = float(os.getenv("SUPABASE_CONNECT_TIMEOUT", "5"))
+    supabase_pool_timeout: float = float(os.getenv("SUPABASE_POOL_TIMEOUT", "10"))
+    # Negotiated via ALPN, so only used over https
+    supabase_http2: bool = os.getenv("SUPABASE_HTTP2", "true").lower() in ("1", "true", "yes")
+
+    # Direct Postgres reads for the hot list endpoints (READ_BACKEND=postgres instead of
+    # postgrest), through Supavisor in transaction mode (port 6543)
+    read_backend: str = os.getenv("READ_BACKEND", "postgrest").lower()
+    database_url: str = os.getenv("DATABASE_URL")
+    database_pool_min: int = int(os.getenv("DATABASE_POOL_MIN", "1"))
+    database_pool_max: int = int(os.getenv("DATABASE_POOL_MAX", "10"))
+    # Role taken in each transaction. PostgREST runs as the role of SUPABASE_KEY (service_role),
+    # so that is the default; "none" keeps the login role
+    database_read_role: str = os.getenv("DATABASE_READ_ROLE", "service_role")
+    database_statement_timeout: int = int(os.getenv("DATABASE_STATEMENT_TIMEOUT_MS", "5000"))
@@ -1,7 +1,11 @@
 import os
-from supabase import create_client, Client
+import asyncio
+import weakref
+from supabase import create_client, acreate_client, Client, AsyncClient, AsyncClientOptions, ClientOptions
+from supabase_auth import AsyncGoTrueClient
 
 from app.core.config import Settings
+from app.core.http_client import create_http_client, create_sync_http_client
 
 # Validate required environment variables
 required_vars = ["SUPABASE_URL", "SUPABASE_KEY"]
@@ -12,7 +16,16 @@ if missing_vars:
 
 # Create global Supabase client
 settings = Settings()
-supabase_client: Client = create_client(settings.supabase_url, settings.supabase_key)
+supabase_client: Client = create_client(
+    settings.supabase_url,
+    settings.supabase_key,
+    options=ClientOptions(httpx_client=create_sync_http_client()),
+)
+
+# Async clients are bound to the event loop that created their HTTP session,
+# so we keep one per running loop (one per worker under uvicorn).
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncClient]" = weakref.WeakKeyDictionary()
+_async_auth_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncGoTrueClient]" = weakref.WeakKeyDictionary()
 
 def get_supabase_client() -> Client:
     """
@@ -23,6 +36,56 @@ def get_supabase_client() -> Client:
     """
     return supabase_client
 
+async def get_async_supabase_client() -> AsyncClient:
+    """
+    Get the async Supabase client for the running event loop.
+
+    The client is created on first use and reused by every request served
+    by the same event loop, so concurrent handlers share one connection pool
+    (sized and timed by the `SUPABASE_*` pool settings, see
+    `app.core.http_client`).
+
+    Returns:
+        AsyncClient: The async Supabase client instance
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = await acreate_client(
+            settings.supabase_url,
+            settings.supabase_key,
+            options=AsyncClientOptions(httpx_client=create_http_client("postgrest")),
+        )
+        _async_clients[loop] = client
+    return client
+
+async def get_async_auth_client() -> AsyncGoTrueClient:
+    """
+    Get a stateless GoTrue client for the running event loop.
+
+    Unlike `AsyncClient.auth`, signing in through this client never stores the
+    user's session on the shared PostgREST client, so one user's login cannot
+    leak into requests made on behalf of another.
+
+    Returns:
+        AsyncGoTrueClient: The auth client instance
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_auth_clients.get(loop)
+    if client is None:
+        client = AsyncGoTrueClient(
+            url=f"{settings.supabase_url}/auth/v1",
+            headers={
+                "apikey": settings.supabase_key,
+                "Authorization": f"Bearer {settings.supabase_key}",
+            },
+            auto_refresh_token=False,
+            persist_session=False,
+            http_client=create_http_client("auth"),
+        )
+        _async_auth_clients[loop] = client
+    return client
+
 def test_connection() -> bool:
     """
     Test the Supabase connection.
@@ -0,0 +1,34 @@
+from typing import Any, Dict, List
+
+from app.core.cache import user_cache
+from app.core.db import get_async_supabase_client
+from app.core.serialization import project_rows
+from app.schemas.dependente import Dependente
+
+
+async def get_dependentes(user_id: str) -> List[Dict[str, Any]]:
+    """
+    Get a caregiver's dependents, newest first, through `user_cache`.
+
+    The list is small and read on every dashboard page,
+    so it is kept per user for `USER_CACHE_TTL` seconds. Writes made through
+    the API drop the user's entry (`invalidate_dependentes`).
+
+    Args:
+        user_id: Responsavel ID
+
+    Returns:
+        list: `Dependente` rows (uses the index on responsavel_id, data_criacao DESC)
+    """
+    async def load():
+        supabase = await get_async_supabase_client()
+        result = await supabase.table("Dependente").select("*").eq("responsavel_id", user_id).order("data_criacao", desc=True).execute()
+        return project_rows(Dependente, result.data or [])
+
+    return await user_cache.get_or_load("Dependente", user_id, load)
+
+
+def invalidate_dependentes(user_id: str):
+    """Drop the cached dependents of one caregiver after a write."""
+    user_cache.discard("Dependente", user_id)
+
@@ -0,0 +1,81 @@
+import asyncio
+import os
+from typing import Any, Dict, Optional
+
+from app.core.cache import reference_cache
+from app.core.config import Settings
+from app.core.write_queue import DrainWorker, DurableQueue
+
+settings = Settings()
+
+TABLE = "DepoimentoResponsavel"
+
+_queue: Optional[DurableQueue] = None
+_worker: Optional[DrainWorker] = None
+
+
+def get_queue() -> DurableQueue:
+    """The on-disk queue of testimonials waiting to be inserted (`DEPOIMENTOS_QUEUE_PATH`)."""
+    global _queue
+    if _queue is None:
+        _queue = DurableQueue(settings.depoimentos_queue_path)
+    return _queue
+
+
+def get_worker() -> DrainWorker:
+    """This process's background drain of the testimonial queue."""
+    global _worker
+    if _worker is None:
+        _worker = DrainWorker(get_queue(), TABLE)
+    return _worker
+
+
+def start_worker() -> bool:
+    """
+    Start this process's drain when the server starts.
+
+    Called from the ASGI/WSGI entry points, so testimonials left in the queue
+    by a restart or crash are inserted without waiting for the next
+    submission. Runs when write-behind is on, or when it was turned off with
+    rows still queued.
+
+    Returns:
+        bool: Whether the worker was started
+    """
+    if not settings.depoimentos_write_behind:
+        if not os.path.exists(settings.depoimentos_queue_path):
+            return False
+        stats = get_queue().stats()
+        if not stats["pending"] and not stats["leased"]:
+            return False
+    worker = get_worker()
+    worker.ensure_started()
+    worker.notify()
+    return True
+
+
+async def enqueue_depoimento(row: Dict[str, Any]) -> int:
+    """
+    Queue a testimonial row for insertion and wake the drain.
+
+    Returns once the row is fsynced to the local queue; the insert into
+    Supabase happens in the background, batched with other submissions.
+
+    Returns:
+        int: Queue id of the submission
+    """
+    queue_id = await asyncio.to_thread(get_queue().put, row)
+    worker = get_worker()
+    worker.ensure_started()
+    worker.notify()
+    return queue_id
+
+
+def invalidate_aprovados() -> int:
+    """
+    Drop the cached pages of approved testimonials after a moderation.
+
+    Only this process's cache is cleared; other workers catch up within the
+    table's TTL (or through `POST /cache/invalidate`).
+    """
+    return reference_cache.invalidate(TABLE)
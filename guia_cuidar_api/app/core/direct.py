@@ -0,0 +1,160 @@
+import asyncio
+import weakref
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.core.config import Settings
+
+try:
+    from psycopg import sql
+    from psycopg_pool import AsyncConnectionPool
+except ImportError:  # optional, only needed for READ_BACKEND=postgres
+    sql = AsyncConnectionPool = None
+
+settings = Settings()
+
+# Pools are bound to the event loop that opened them, like the Supabase clients
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncConnectionPool]" = weakref.WeakKeyDictionary()
+
+
+def direct_reads_enabled() -> bool:
+    """True when hot list endpoints should read from Postgres instead of PostgREST."""
+    return settings.read_backend == "postgres"
+
+
+async def _configure(conn):
+    # Client-side flag: every transaction starts as BEGIN READ ONLY
+    await conn.set_read_only(True)
+
+
+async def get_pool() -> "AsyncConnectionPool":
+    """
+    Get the Postgres connection pool for the running event loop.
+
+    Connections go through Supavisor in transaction mode (the pooler on port
+    6543), so nothing is kept in the session between transactions and
+    server-side prepared statements are disabled.
+
+    Returns:
+        AsyncConnectionPool: The pool, opened on first use
+
+    Raises:
+        RuntimeError: If psycopg/psycopg_pool or DATABASE_URL are missing
+    """
+    if AsyncConnectionPool is None:
+        raise RuntimeError("READ_BACKEND=postgres requires psycopg (pip install 'guiacuidarapi[direct]')")
+    if not settings.database_url:
+        raise RuntimeError("READ_BACKEND=postgres requires DATABASE_URL")
+
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = AsyncConnectionPool(
+            settings.database_url,
+            min_size=settings.database_pool_min,
+            max_size=settings.database_pool_max,
+            timeout=settings.supabase_pool_timeout,
+            kwargs={"autocommit": True, "prepare_threshold": None},
+            configure=_configure,
+            open=False,
+        )
+        _pools[loop] = pool
+        await pool.open()
+    return pool
+
+
+def page_query(
+    table: str,
+    columns: Sequence[str],
+    embeds: Sequence[Any],
+    filters: Dict[str, Any],
+    order_by: str,
+    after: Optional[List[Any]],
+    limit: int,
+):
+    """
+    Build the SQL PostgREST would run for a keyset page, as one JSON array.
+
+    Rows are aggregated with `json_agg` in Postgres, like PostgREST does, so
+    values come back with the same JSON representation (timestamps, numerics)
+    and to-one embeddings as nested objects (or null).
+
+    Args:
+        table: Table name
+        columns: Columns to select
+        embeds: `Embed`s to add as nested objects
+        filters: Equality filters
+        order_by: `id` (ascending) or a timestamp column (newest first, `id` as tie-breaker)
+        after: Decoded cursor (`[id]` or `[value, id]`), or None for the first page
+        limit: Maximum number of rows
+
+    Returns:
+        tuple: `(query, params)` for `cursor.execute`
+    """
+    t = sql.Identifier("t")
+    fields = [sql.SQL("{}.{}").format(t, sql.Identifier(c)) for c in columns]
+    for embed in embeds:
+        fields.append(sql.SQL(
+            "(SELECT json_build_object({pairs}) FROM {table} e WHERE e.{pk} = {t}.{fk}) AS {alias}"
+        ).format(
+            pairs=sql.SQL(", ").join(
+                sql.SQL("{}, e.{}").format(sql.Literal(c), sql.Identifier(c)) for c in embed.columns
+            ),
+            table=sql.Identifier("public", embed.table),
+            pk=sql.Identifier("id"),
+            t=t,
+            fk=sql.Identifier(embed.foreign_key),
+            alias=sql.Identifier(embed.alias),
+        ))
+
+    where, params = [], []
+    for column, value in filters.items():
+        where.append(sql.SQL("{}.{} = %s").format(t, sql.Identifier(column)))
+        params.append(value)
+
+    id_ = sql.SQL("{}.{}").format(t, sql.Identifier("id"))
+    if order_by == "id":
+        order = id_
+        if after:
+            where.append(sql.SQL("{} > %s").format(id_))
+            params.append(after[0])
+    else:
+        column = sql.SQL("{}.{}").format(t, sql.Identifier(order_by))
+        order = sql.SQL("{} DESC, {} DESC").format(column, id_)
+        if after:
+            where.append(sql.SQL("({c} < %s OR ({c} = %s AND {id} < %s))").format(c=column, id=id_))
+            params += [after[0], after[0], after[1]]
+    params.append(limit)
+
+    query = sql.SQL(
+        "SELECT coalesce(json_agg(page), '[]'::json) FROM ("
+        "SELECT {fields} FROM {table} t {where} ORDER BY {order} LIMIT %s"
+        ") page"
+    ).format(
+        fields=sql.SQL(", ").join(fields),
+        table=sql.Identifier("public", table),
+        where=sql.SQL("WHERE ") + sql.SQL(" AND ").join(where) if where else sql.SQL(""),
+        order=order,
+    )
+    return query, params
+
+
+async def fetch_json(query, params: Sequence[Any]) -> Any:
+    """
+    Run a single-value JSON query in a read-only transaction.
+
+    The transaction takes the role PostgREST uses for the API's key
+    (`DATABASE_READ_ROLE`, `service_role` by default) and a statement
+    timeout, so both backends see the same rows. Setup, query and commit
+    are pipelined into one round trip.
+    """
+    pool = await get_pool()
+    async with pool.connection() as conn:
+        async with conn.pipeline():
+            async with conn.transaction():
+                await conn.execute(
+                    "SELECT set_config('role', %s, true), set_config('statement_timeout', %s, true)",
+                    (settings.database_read_role, str(settings.database_statement_timeout)),
+                )
+                cursor = await conn.execute(query, params)
+        (value,) = await cursor.fetchone()
+    return value
@@ -0,0 +1,192 @@
+import asyncio
+import weakref
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict
+
+import httpx
+from supabase_auth.http_clients import SyncClient
+
+from app.core.config import Settings
+
+settings = Settings()
+
+
+@dataclass
+class PoolStats:
+    requests: int = 0
+    errors: int = 0
+    pool_timeouts: int = 0
+    connections_opened: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    waiting: int = 0
+    max_waiting: int = 0
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body that frees its pool slot once the body is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class InstrumentedTransport(httpx.AsyncHTTPTransport):
+    """
+    Pooled httpx transport that counts requests and new TCP connections.
+
+    Requests beyond `max_connections` wait here, on a semaphore released when
+    the response body is closed, instead of in httpcore's queue: httpcore
+    rescans every pooled connection for every queued request, which becomes
+    the bottleneck once a large keep-alive pool meets a burst of calls (see
+    benchmarks/http_pool.py). Waiting longer than the pool timeout raises
+    `httpx.PoolTimeout` as usual.
+
+    New connections are counted through httpcore's `trace` request extension,
+    so a healthy pool shows `connections_opened` staying flat while
+    `requests` grows; a climbing ratio means connections are not being reused
+    (keep-alive limit or expiry too low for the traffic).
+    """
+
+    def __init__(self, name: str, limits: httpx.Limits = httpx.Limits(), **kwargs):
+        super().__init__(limits=limits, **kwargs)
+        self.name = name
+        self.stats = PoolStats()
+        self._slots = asyncio.Semaphore(limits.max_connections) if limits.max_connections else None
+        _transports.add(self)
+
+    def _tracer(self, parent):
+        async def trace(event: str, info: Dict[str, Any]):
+            if event == "connection.connect_tcp.complete":
+                self.stats.connections_opened += 1
+            if parent is not None:
+                await parent(event, info)
+        return trace
+
+    async def _acquire(self, request: httpx.Request):
+        if self._slots is None:
+            return
+        if not self._slots.locked():
+            await self._slots.acquire()
+            return
+        stats = self.stats
+        stats.waiting += 1
+        stats.max_waiting = max(stats.max_waiting, stats.waiting)
+        try:
+            await asyncio.wait_for(self._slots.acquire(), request.extensions.get("timeout", {}).get("pool"))
+        except asyncio.TimeoutError:
+            raise httpx.PoolTimeout("Timed out waiting for a Supabase connection", request=request)
+        finally:
+            stats.waiting -= 1
+
+    def _release(self):
+        self.stats.in_flight -= 1
+        if self._slots is not None:
+            self._slots.release()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.extensions = {**request.extensions, "trace": self._tracer(request.extensions.get("trace"))}
+        stats = self.stats
+        stats.requests += 1
+        try:
+            await self._acquire(request)
+        except httpx.PoolTimeout:
+            stats.pool_timeouts += 1
+            stats.errors += 1
+            raise
+        stats.in_flight += 1
+        stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException as e:
+            if isinstance(e, httpx.PoolTimeout):
+                stats.pool_timeouts += 1
+            if isinstance(e, httpx.TransportError):
+                stats.errors += 1
+            self._release()
+            raise
+        response.stream = _ReleasingStream(response.stream, self._release)
+        return response
+
+    def connections(self) -> Dict[str, int]:
+        """Connections currently held by the pool (open and idle)."""
+        connections = list(getattr(self._pool, "connections", []))
+        return {"open": len(connections), "idle": sum(1 for c in connections if c.is_idle())}
+
+
+# Every live transport (one per client per event loop), for `pool_stats()`
+_transports: "weakref.WeakSet[InstrumentedTransport]" = weakref.WeakSet()
+
+
+def http_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.supabase_max_connections,
+        max_keepalive_connections=settings.supabase_max_keepalive,
+        keepalive_expiry=settings.supabase_keepalive_expiry,
+    )
+
+
+def http_timeout() -> httpx.Timeout:
+    return httpx.Timeout(
+        settings.supabase_timeout,
+        connect=settings.supabase_connect_timeout,
+        pool=settings.supabase_pool_timeout,
+    )
+
+
+def create_http_client(name: str) -> httpx.AsyncClient:
+    """
+    Build a pooled httpx client configured from `Settings`.
+
+    One client must serve a single Supabase service: postgrest-py rewrites the
+    `base_url` of the client it is given, so sharing it with storage or
+    functions would send PostgREST calls to the wrong path.
+
+    Args:
+        name: Label used in `pool_stats()` (e.g. "postgrest", "auth")
+
+    Returns:
+        httpx.AsyncClient: Client bound to the running event loop
+    """
+    transport = InstrumentedTransport(name, http2=settings.supabase_http2, limits=http_limits())
+    return httpx.AsyncClient(transport=transport, timeout=http_timeout(), follow_redirects=True)
+
+
+def create_sync_http_client() -> httpx.Client:
+    """Blocking counterpart of `create_http_client` (no metrics)."""
+    # SyncClient: httpx.Client plus the `aclose()` the sync auth client calls on close
+    return SyncClient(
+        http2=settings.supabase_http2,
+        limits=http_limits(),
+        timeout=http_timeout(),
+        follow_redirects=True,
+    )
+
+
+def pool_stats() -> Dict[str, Any]:
+    """Request/connection counters per client name, summed over event loops."""
+    clients: Dict[str, Dict[str, int]] = {}
+    for transport in list(_transports):
+        totals = clients.setdefault(transport.name, {"loops": 0, "open": 0, "idle": 0, **vars(PoolStats())})
+        totals["loops"] += 1
+        for key, value in {**vars(transport.stats), **transport.connections()}.items():
+            totals[key] = max(totals[key], value) if key == "max_in_flight" else totals[key] + value
+    return {
+        "limits": {
+            "max_connections": settings.supabase_max_connections,
+            "max_keepalive": settings.supabase_max_keepalive,
+            "keepalive_expiry": settings.supabase_keepalive_expiry,
+            "http2": settings.supabase_http2,
+        },
+        "clients": clients,
+    }
@@ -0,0 +1,190 @@
+import base64
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Literal, Optional, Tuple, Type
+
+from ninja import Schema
+from pydantic import BaseModel, Field
+
+from app.core.cache import TABLE_TTLS, reference_cache
+from app.core.db import get_async_supabase_client
+from app.core.direct import direct_reads_enabled, fetch_json, page_query
+
+
+class PaginationParams(Schema):
+    """Query parameters shared by the paginated list endpoints"""
+    limit: int = Field(20, ge=1, le=100)
+    cursor: Optional[str] = None
+    order_by: Literal["id", "data_criacao"] = "id"
+    fields: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class Embed:
+    """
+    To-one related row added to each item, e.g. `categoria: {id, nome}`.
+
+    `str()` gives the PostgREST embedding (`categoria:CategoriaMaterial(id,nome)`);
+    the direct Postgres path joins `table.id` to `foreign_key`.
+    """
+    alias: str
+    table: str
+    columns: Tuple[str, ...]
+    foreign_key: str
+
+    def __str__(self) -> str:
+        return f"{self.alias}:{self.table}({','.join(self.columns)})"
+
+
+class InvalidPageRequest(ValueError):
+    """Raised for a malformed cursor or an unknown field in `fields=`"""
+
+
+def encode_key(key: List[Any]) -> str:
+    """Encode a keyset position (list of JSON scalars) as an opaque URL-safe token."""
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip("=")
+
+
+def decode_key(cursor: str, length: int) -> List[Any]:
+    """Decode a token produced by `encode_key`, checking only its length."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError):
+        raise InvalidPageRequest("Invalid cursor")
+    if not isinstance(key, list) or len(key) != length:
+        raise InvalidPageRequest("Invalid cursor")
+    return key
+
+
+def encode_cursor(row: Dict[str, Any], order_by: str) -> str:
+    """Encode the keyset position after `row` as an opaque URL-safe token."""
+    return encode_key([row["id"]] if order_by == "id" else [row[order_by], row["id"]])
+
+
+def decode_cursor(cursor: str, order_by: str) -> List[Any]:
+    """Decode a token produced by `encode_cursor`."""
+    key = decode_key(cursor, 1 if order_by == "id" else 2)
+    # The values end up inside PostgREST filters, so only accept the shapes we emit.
+    if not isinstance(key[-1], int) or any(not isinstance(v, str) or '"' in v for v in key[:-1]):
+        raise InvalidPageRequest("Invalid cursor")
+    return key
+
+
+def select_columns(model: Type[BaseModel], fields: Optional[str], order_by: str) -> List[str]:
+    """
+    Turn a `fields=` projection into the PostgREST column list.
+
+    Without a projection every schema field is selected (never `*`, so table
+    columns the API does not expose are not transferred). The keyset columns
+    are always included so the next cursor can be built.
+    """
+    available = list(model.model_fields)
+    if not fields:
+        return available
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in available]
+    if unknown:
+        raise InvalidPageRequest(f"Unknown fields: {', '.join(unknown)}")
+    required = ["id"] if order_by == "id" else ["id", order_by]
+    return [f for f in available if f in requested or f in required]
+
+
+def apply_keyset(query, params: PaginationParams):
+    """Order `query` by the keyset and skip everything up to `params.cursor`."""
+    if params.order_by == "id":
+        query = query.order("id")
+        if params.cursor:
+            (last_id,) = decode_cursor(params.cursor, "id")
+            query = query.gt("id", last_id)
+    else:
+        # Newest first; `id` breaks ties between equal timestamps.
+        query = query.order(params.order_by, desc=True).order("id", desc=True)
+        if params.cursor:
+            last_value, last_id = decode_cursor(params.cursor, params.order_by)
+            query = query.or_(
+                f'{params.order_by}.lt."{last_value}",'
+                f'and({params.order_by}.eq."{last_value}",id.lt.{last_id})'
+            )
+    # One extra row tells us whether there is a next page.
+    return query.limit(params.limit + 1)
+
+
+async def fetch_page(
+    table: str,
+    model: Type[BaseModel],
+    params: PaginationParams,
+    filters: Optional[Dict[str, Any]] = None,
+    embeds: Optional[List[Embed]] = None,
+    cached: bool = False,
+    direct: bool = False,
+) -> Dict[str, Any]:
+    """
+    Fetch one keyset page of `table` shaped as a `Page` of `partial_model(model)`.
+    
+    Items are the raw PostgREST rows (only the selected schema columns), so
+    they are validated at most once, by the route's response schema.
+
+    Args:
+        table: Supabase table name
+        model: Full item schema; projected items use its partial variant
+        params: Pagination, ordering and projection parameters
+        filters: Equality filters applied before paging
+        embeds: To-one relations added to each item
+        cached: Serve the page through the reference-data cache. The cache
+            is shared by every user, so only tables in `TABLE_TTLS` (public
+            reference data) may use it
+        direct: Read straight from Postgres when `READ_BACKEND=postgres`
+            (same rows and JSON, without the Kong/PostgREST hops)
+
+    Returns:
+        dict: `items` and `next_cursor`
+
+    Raises:
+        InvalidPageRequest: If the cursor or the projection is invalid
+        ValueError: If `cached` is asked for a table that is not reference data
+    """
+    if cached and table not in TABLE_TTLS:
+        # Per-user rows (favorites, dependents) would be served to other users
+        raise ValueError(f"{table} is not reference data and cannot use the shared page cache")
+
+    columns = select_columns(model, params.fields, params.order_by)
+    embeds = embeds or []
+    filters = filters or {}
+
+    async def load_rest():
+        supabase = await get_async_supabase_client()
+        query = supabase.table(table).select(",".join(columns + [str(e) for e in embeds]))
+        for column, value in filters.items():
+            query = query.eq(column, value)
+        result = await apply_keyset(query, params).execute()
+        return result.data or []
+
+    async def load_direct():
+        after = decode_cursor(params.cursor, params.order_by) if params.cursor else None
+        query, args = page_query(table, columns, embeds, filters, params.order_by, after, params.limit + 1)
+        return await fetch_json(query, args)
+
+    loader = load_direct if direct and direct_reads_enabled() else load_rest
+
+    if cached:
+        key = (
+            ",".join(columns + [str(e) for e in embeds]),
+            params.order_by,
+            params.cursor,
+            params.limit,
+            tuple(sorted(filters.items())),
+        )
+        rows = await reference_cache.get_or_load(table, key, loader)
+    else:
+        rows = await loader()
+
+    next_cursor = None
+    if len(rows) > params.limit:
+        rows = rows[:params.limit]
+        next_cursor = encode_cursor(rows[-1], params.order_by)
+
+    return {
+        "items": rows,
+        "next_cursor": next_cursor,
+    }
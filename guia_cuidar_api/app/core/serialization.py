@@ -0,0 +1,49 @@
+import json
+from typing import Any, Dict, Iterable, List, Type
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+from pydantic import BaseModel
+
+from app.core.config import Settings
+
+try:
+    import orjson
+except ImportError:  # optional speed-up, the stdlib encoder is the fallback
+    orjson = None
+
+settings = Settings()
+
+
+def project_rows(model: Type[BaseModel], rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Key PostgREST rows to `model`: exactly the schema's fields, missing ones as null."""
+    fields = list(model.model_fields)
+    return [{name: row.get(name) for name in fields} for row in rows]
+
+
+def dumps(data: Any) -> bytes:
+    """Encode `data` as JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, cls=DjangoJSONEncoder).encode()
+
+
+def respond(data: Any, status: int = 200):
+    """
+    Return plain PostgREST data (dicts/lists) from a handler.
+    
+    In trusted mode (`TRUSTED_RESPONSES`, the default) the rows were already
+    typed by Postgres and keyed to the schema, so they are rendered straight to
+    JSON and Ninja's response validation is skipped. Otherwise `(status, data)`
+    is returned and Ninja validates it once against the route's `response=`.
+    
+    Args:
+        data: JSON-compatible payload, e.g. a `Page` dict or a list of rows
+        status: HTTP status code
+    
+    Returns:
+        HttpResponse or tuple: Ready response, or `(status, data)` for Ninja
+    """
+    if settings.trusted_responses:
+        return HttpResponse(dumps(data), status=status, content_type="application/json")
+    return status, data
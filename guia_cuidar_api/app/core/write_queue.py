@@ -0,0 +1,276 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from postgrest.exceptions import APIError
+
+from app.core.config import Settings
+from app.core.db import get_async_supabase_client
+
+settings = Settings()
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    payload TEXT NOT NULL,
+    enqueued_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    leased_until REAL,
+    last_error TEXT,
+    dead INTEGER NOT NULL DEFAULT 0,
+    failures INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+
+def is_rejection(error: Exception) -> bool:
+    """
+    Whether PostgREST rejected the rows themselves.
+
+    Only data and integrity errors (SQLSTATE classes 22 and 23) are; they
+    will fail again on retry. Anything else (PGRST errors, timeouts,
+    permission or connection problems) is an upstream failure the rows
+    should simply wait out.
+    """
+    code = getattr(error, "code", None) or ""
+    return isinstance(error, APIError) and code[:2] in ("22", "23")
+
+
+class DurableQueue:
+    """
+    Disk-backed FIFO of JSON payloads (SQLite, WAL, fsync on every commit).
+
+    Several processes (uvicorn workers, the `drain_depoimentos` command) can
+    share one file: consumers lease a batch for `lease` seconds, then `ack`
+    it once written upstream or `release` it for a retry. A lease that is
+    never acked (crashed consumer) expires and the items are delivered again,
+    so delivery is at least once.
+
+    Released items wait an exponential backoff before they can be leased
+    again. Only rejections count as attempts, so an upstream outage of any
+    length never parks items as dead.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        conn = self._connect()
+        conn.execute(_SCHEMA)
+        # Queue files created before `failures` existed
+        if "failures" not in {row[1] for row in conn.execute("PRAGMA table_info(items)")}:
+            conn.execute("ALTER TABLE items ADD COLUMN failures INTEGER NOT NULL DEFAULT 0")
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections are bound to their thread
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=FULL")
+            self._local.conn = conn
+        return conn
+
+    def put(self, payload: Dict[str, Any]) -> int:
+        """Append a payload; returns its queue id once it is on disk."""
+        cursor = self._connect().execute(
+            "INSERT INTO items (payload, enqueued_at) VALUES (?, ?)",
+            (json.dumps(payload), time.time()),
+        )
+        return cursor.lastrowid
+
+    @contextmanager
+    def _transaction(self):
+        # One fsync per batch instead of one per statement
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def lease(self, limit: int, seconds: float) -> List[Tuple[int, Dict[str, Any]]]:
+        """Take up to `limit` of the oldest available items for `seconds`."""
+        now = time.time()
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT id, payload FROM items"
+                " WHERE NOT dead AND (leased_until IS NULL OR leased_until < ?)"
+                " ORDER BY id LIMIT ?",
+                (now, limit),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE items SET leased_until = ? WHERE id = ?",
+                [(now + seconds, item_id) for item_id, _ in rows],
+            )
+        return [(item_id, json.loads(payload)) for item_id, payload in rows]
+
+    def ack(self, ids: List[int]):
+        """Remove delivered items."""
+        with self._transaction() as conn:
+            conn.executemany("DELETE FROM items WHERE id = ?", [(i,) for i in ids])
+
+    def release(
+        self,
+        ids: List[int],
+        error: str,
+        rejected: bool = False,
+        max_attempts: int = 0,
+        backoff: float = 0,
+        max_backoff: float = 0,
+    ):
+        """
+        Return items for a retry after `backoff * 2**failures` seconds (capped).
+
+        `rejected` items also spend an attempt, and are parked as dead once
+        they have spent `max_attempts`.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            for item_id in ids:
+                row = conn.execute("SELECT failures, attempts FROM items WHERE id = ?", (item_id,)).fetchone()
+                if row is None:
+                    continue
+                failures, attempts = row[0] + 1, row[1] + int(rejected)
+                delay = min(backoff * 2 ** (failures - 1), max_backoff)
+                conn.execute(
+                    "UPDATE items SET leased_until = ?, last_error = ?, failures = ?, attempts = ?, dead = ?"
+                    " WHERE id = ?",
+                    (now + delay, error, failures, attempts, rejected and attempts >= max_attempts, item_id),
+                )
+
+    def requeue_dead(self) -> int:
+        """Make every dead item available again, with fresh counters."""
+        with self._transaction() as conn:
+            return conn.execute(
+                "UPDATE items SET dead = 0, attempts = 0, failures = 0, leased_until = NULL WHERE dead"
+            ).rowcount
+
+    def stats(self) -> Dict[str, int]:
+        """Pending, leased and dead item counts."""
+        pending, leased, dead = self._connect().execute(
+            "SELECT"
+            " coalesce(sum(NOT dead AND (leased_until IS NULL OR leased_until < ?)), 0),"
+            " coalesce(sum(NOT dead AND leased_until >= ?), 0),"
+            " coalesce(sum(dead), 0)"
+            " FROM items",
+            (time.time(), time.time()),
+        ).fetchone()
+        return {"pending": pending, "leased": leased, "dead": dead}
+
+
+@dataclass
+class DrainResult:
+    written: int = 0
+    retried: int = 0
+
+
+def _release(queue: DurableQueue, ids: List[int], error: Exception, rejected: bool):
+    queue.release(
+        ids,
+        getattr(error, "message", None) or str(error),
+        rejected=rejected,
+        max_attempts=settings.write_queue_max_attempts,
+        backoff=settings.write_queue_backoff,
+        max_backoff=settings.write_queue_max_backoff,
+    )
+
+
+async def drain_batch(queue: DurableQueue, table: str) -> DrainResult:
+    """
+    Write one leased batch of queued rows to `table` with a single insert.
+
+    If PostgREST rejects the batch (a constraint or data error in some row),
+    the rows are inserted one by one so only the offending ones spend an
+    attempt and are eventually parked as dead. Any other failure releases
+    the rest of the batch for a later retry without spending attempts.
+    """
+    items = queue.lease(settings.write_queue_batch_size, settings.write_queue_lease)
+    result = DrainResult()
+    if not items:
+        return result
+
+    supabase = await get_async_supabase_client()
+    try:
+        await supabase.table(table).insert([payload for _, payload in items]).execute()
+        queue.ack([item_id for item_id, _ in items])
+        result.written = len(items)
+        return result
+    except Exception as e:
+        if not is_rejection(e):
+            _release(queue, [item_id for item_id, _ in items], e, rejected=False)
+            result.retried = len(items)
+            return result
+
+    # Isolate the rows the database rejects
+    for position, (item_id, payload) in enumerate(items):
+        try:
+            await supabase.table(table).insert(payload).execute()
+            queue.ack([item_id])
+            result.written += 1
+        except Exception as e:
+            if is_rejection(e):
+                _release(queue, [item_id], e, rejected=True)
+                result.retried += 1
+                continue
+            rest = [i for i, _ in items[position:]]
+            _release(queue, rest, e, rejected=False)
+            result.retried += len(rest)
+            break
+    return result
+
+
+async def drain(queue: DurableQueue, table: str) -> DrainResult:
+    """Drain batches until the queue has nothing available or a batch fails."""
+    total = DrainResult()
+    while True:
+        batch = await drain_batch(queue, table)
+        total.written += batch.written
+        total.retried += batch.retried
+        if not batch.written or batch.retried:
+            return total
+
+
+class DrainWorker:
+    """
+    Background thread draining one queue into one table.
+
+    Runs its own event loop (and so its own pooled Supabase client), waking
+    up on `notify()` or every `WRITE_QUEUE_INTERVAL` seconds.
+    """
+
+    def __init__(self, queue: DurableQueue, table: str):
+        self.queue = queue
+        self.table = table
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def ensure_started(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=f"drain-{self.table}", daemon=True)
+                self._thread.start()
+
+    def notify(self):
+        self._wakeup.set()
+
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        while True:
+            self._wakeup.wait(settings.write_queue_interval)
+            self._wakeup.clear()
+            try:
+                loop.run_until_complete(drain(self.queue, self.table))
+            except Exception:
+                logger.exception("Draining %s failed", self.table)
@@ -0,0 +1,34 @@
+import asyncio
+
+from django.core.management.base import BaseCommand
+
+from app.core.depoimentos import TABLE, get_queue
+from app.core.write_queue import drain, settings
+
+
+class Command(BaseCommand):
+    help = "Insert the testimonials waiting in the write-behind queue (DEPOIMENTOS_QUEUE_PATH)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--loop", action="store_true", help="Keep draining every WRITE_QUEUE_INTERVAL seconds")
+        parser.add_argument("--stats", action="store_true", help="Only print the queue counters")
+        parser.add_argument("--requeue-dead", action="store_true", help="Retry the items parked as dead, then drain")
+
+    def handle(self, *args, **options):
+        queue = get_queue()
+        if options["stats"]:
+            self.stdout.write(str(queue.stats()))
+            return
+        if options["requeue_dead"]:
+            self.stdout.write(f"{queue.requeue_dead()} dead items requeued")
+
+        async def run():
+            while True:
+                result = await drain(queue, TABLE)
+                if result.written or result.retried:
+                    self.stdout.write(f"{result.written} inserted, {result.retried} to retry; {queue.stats()}")
+                if not options["loop"]:
+                    return
+                await asyncio.sleep(settings.write_queue_interval)
+
+        asyncio.run(run())
@@ -0,0 +1,19 @@
+from ninja import Schema
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
+
+
+class BuscaParams(Schema):
+    """Query parameters of the full-text search endpoint"""
+    q: str = Field(..., min_length=2, max_length=200)
+    tipo: Optional[Literal["artigo", "material"]] = None
+    limit: int = Field(20, ge=1, le=50)
+    cursor: Optional[str] = None
+
+
+class ResultadoBusca(BaseModel):
+    tipo: Literal["artigo", "material"]
+    id: int
+    titulo: str
+    trecho: str
+    rank: float
@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+from typing import Optional
+
+
+class CacheInvalidationRequest(BaseModel):
+    """Accepts the Supabase Database Webhook payload (only `table` is used)"""
+    table: Optional[str] = None
+
+
+class CacheInvalidationResponse(BaseModel):
+    success: bool
+    message: str
+    removed: int
@@ -1,5 +1,7 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, create_model
+from typing import Dict, Generic, List, Optional, Type, TypeVar
+
+T = TypeVar("T")
 
 
 class ErrorResponse(BaseModel):
@@ -10,3 +12,32 @@ class ErrorResponse(BaseModel):
 class SuccessResponse(BaseModel):
     success: bool
     message: str
+
+
+class Page(BaseModel, Generic[T]):
+    """Keyset-paginated list; pass `next_cursor` back as `cursor` for the next page"""
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+def partial_model(model: Type[BaseModel]) -> Type[BaseModel]:
+    """
+    Build a variant of `model` where every field is optional.
+
+    Used as the item schema of projected list endpoints (`fields=`), together
+    with `exclude_unset=True` so columns that were not selected are omitted.
+    """
+    if model not in _partial_models:
+        fields = {
+            name: (Optional[info.annotation], None)
+            for name, info in model.model_fields.items()
+        }
+        _partial_models[model] = create_model(
+            f"{model.__name__}Parcial",
+            __config__=ConfigDict(from_attributes=True),
+            **fields
+        )
+    return _partial_models[model]
+
+
+_partial_models: Dict[Type[BaseModel], Type[BaseModel]] = {}
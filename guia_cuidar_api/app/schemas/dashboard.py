@@ -0,0 +1,38 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import datetime
+
+from app.schemas.dependente import Dependente
+from app.schemas.material import CategoriaMaterial, NivelSuporteTEA
+
+
+class Responsavel(BaseModel):
+    """Profile of the logged-in caregiver (the password hash is never selected)"""
+    id: str
+    nome: str
+    email: str
+    data_criacao: datetime
+    data_atualizacao: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class DashboardTips(BaseModel):
+    """Everything the tips page needs before the first render"""
+    dependentes: List[Dependente]
+    categorias: List[CategoriaMaterial]
+    niveis_suporte: List[NivelSuporteTEA]
+
+
+class DashboardFavorites(BaseModel):
+    """Everything the favorites page needs before the first render"""
+    dependentes: List[Dependente]
+    categorias: List[CategoriaMaterial]
+
+
+class DashboardProfile(BaseModel):
+    """Everything the profile page needs before the first render"""
+    responsavel: Optional[Responsavel] = None
+    dependentes: List[Dependente]
+    niveis_suporte: List[NivelSuporteTEA]
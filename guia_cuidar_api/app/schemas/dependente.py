@@ -0,0 +1,30 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import datetime
+
+
+class DependenteBase(BaseModel):
+    nome: str = Field(..., min_length=1, max_length=200)
+    nivel_suporte_tea_id: Optional[int] = None
+
+
+class DependenteCreate(DependenteBase):
+    pass
+
+
+class DependenteUpdate(BaseModel):
+    """Fields to change; omitted fields keep their current value"""
+    nome: Optional[str] = Field(None, min_length=1, max_length=200)
+    nivel_suporte_tea_id: Optional[int] = None
+
+
+class Dependente(BaseModel):
+    id: int
+    nome: str
+    responsavel_id: str
+    nivel_suporte_tea_id: Optional[int] = None
+    data_criacao: datetime
+    data_atualizacao: datetime
+
+    class Config:
+        from_attributes = True
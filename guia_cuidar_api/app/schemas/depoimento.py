@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -22,6 +22,43 @@ class DepoimentoResponsavel(DepoimentoResponsavelBase):
         from_attributes = True
 
 
+class DepoimentoFiltros(BaseModel):
+    categoria_id: Optional[int] = None
+
+
+class DepoimentoEnfileirado(BaseModel):
+    """Submission accepted into the write-behind queue (202)"""
+    success: bool
+    message: str
+    fila_id: int
+
+
+class ModeracaoLote(BaseModel):
+    """Testimonial ids to approve and to reject (set `aprovado` back to false)"""
+    aprovar: List[int] = Field(default_factory=list, max_length=500)
+    rejeitar: List[int] = Field(default_factory=list, max_length=500)
+
+    @model_validator(mode="after")
+    def check_ids(self):
+        if not self.aprovar and not self.rejeitar:
+            raise ValueError("Nothing to moderate")
+        if set(self.aprovar) & set(self.rejeitar):
+            raise ValueError("An id cannot be both approved and rejected")
+        return self
+
+
+class DepoimentoModerado(BaseModel):
+    id: int
+    aprovado: bool
+
+
+class ModeracaoResponse(BaseModel):
+    success: bool
+    message: str
+    atualizados: List[DepoimentoModerado]
+    nao_encontrados: List[int]
+
+
 class CategoriaMaterial(BaseModel):
     id: int
     nome: str
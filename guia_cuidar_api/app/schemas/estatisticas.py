@@ -1,5 +1,6 @@
-from pydantic import BaseModel
-from typing import Optional
+from ninja import Schema
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
 from datetime import datetime
 
 
@@ -13,3 +14,50 @@ class DadosEstatisticosTEA(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class EscolarizacaoParams(Schema):
+    """Query parameters of the schooling-rate aggregation endpoint"""
+    agrupar: Optional[str] = Field(
+        "localidade",
+        description="Comma-separated dimensions: localidade, ano, sexo, faixa_idade, tipo_deficiencia"
+    )
+    localidade: Optional[str] = None
+    ano: Optional[int] = None
+    sexo: Optional[str] = None
+    faixa_idade: Optional[str] = None
+    tipo_deficiencia: Optional[str] = None
+
+
+class EscolarizacaoAgregada(BaseModel):
+    """One group of TEA_escolarizacao_por_estado; dimensions not grouped are null"""
+    localidade: Optional[str] = None
+    ano: Optional[int] = None
+    sexo: Optional[str] = None
+    faixa_idade: Optional[str] = None
+    tipo_deficiencia: Optional[str] = None
+    media: Optional[float] = None
+    minimo: Optional[float] = None
+    maximo: Optional[float] = None
+    registros: int
+
+
+class NivelParams(Schema):
+    """Query parameters of the TEA support-level aggregation endpoint"""
+    agrupar: Optional[str] = Field("local", description="Comma-separated dimensions: local, dificuldades")
+    local: Optional[str] = None
+    dificuldades: Optional[str] = None
+
+
+class NivelAgregado(BaseModel):
+    """One group of TEA_nivel_por_estado; dimensions not grouped are null"""
+    local: Optional[str] = None
+    dificuldades: Optional[str] = None
+    soma_absoluto: Optional[int] = None
+    media_relativo: Optional[float] = None
+    registros: int
+
+
+class ExportacaoParams(Schema):
+    """Query parameters of the columnar export endpoint"""
+    formato: Literal["arrow", "parquet"] = Field("arrow", description="arrow (IPC stream) or parquet")
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -36,6 +36,28 @@ class MaterialDeApoio(BaseModel):
         from_attributes = True
 
 
+class CategoriaMaterialResumo(BaseModel):
+    id: int
+    nome: str
+
+
+class NivelSuporteTEAResumo(BaseModel):
+    id: int
+    nome: str
+
+
+class MaterialDeApoioDetalhado(MaterialDeApoio):
+    """Support material with its category and support level embedded (`embed=true`)"""
+    categoria: Optional[CategoriaMaterialResumo] = None
+    nivel_suporte: Optional[NivelSuporteTEAResumo] = None
+
+
+class MaterialFiltros(BaseModel):
+    categoria_id: Optional[int] = None
+    nivel_suporte_tea_id: Optional[int] = None
+    embed: bool = False
+
+
 class MaterialFavoritoCreate(BaseModel):
     material_id: int
     dependente_id: int
@@ -49,3 +71,43 @@ class MaterialFavorito(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class MaterialFavoritoParams(BaseModel):
+    """Query parameters of GET /materiais/favoritos"""
+    dependente_id: Optional[int] = None
+    embed: bool = False
+    limit: int = Field(50, ge=1, le=100)
+    cursor: Optional[str] = None
+
+
+class MaterialFavoritoResumo(BaseModel):
+    """Favorited material as embedded in each favorite (`embed=true`)"""
+    id: int
+    titulo: str
+    corpo: Optional[str] = None
+    categoria_id: Optional[int] = None
+    nivel_suporte_tea_id: Optional[int] = None
+    categoria: Optional[CategoriaMaterialResumo] = None
+    nivel_suporte: Optional[NivelSuporteTEAResumo] = None
+
+
+class MaterialFavoritoDetalhado(MaterialFavorito):
+    """Favorite with its material embedded (`embed=true`)"""
+    material: Optional[MaterialFavoritoResumo] = None
+
+
+class MaterialFavoritoLote(BaseModel):
+    itens: List[MaterialFavoritoCreate] = Field(..., min_length=1, max_length=200)
+
+
+class MaterialFavoritoLoteItem(BaseModel):
+    material_id: int
+    dependente_id: int
+    status: str
+
+
+class MaterialFavoritoLoteResponse(BaseModel):
+    success: bool
+    message: str
+    resultados: List[MaterialFavoritoLoteItem]
@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from ninja import Schema
+from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
 
@@ -18,8 +19,24 @@ class ServicoLocal(BaseModel):
     name: str
     endereco: Optional[str] = None
     tipo_servico_id: Optional[int] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
     data_criacao: datetime
     data_atualizacao: datetime
 
     class Config:
         from_attributes = True
+
+
+class ServicoProximo(ServicoLocal):
+    distancia_m: float
+
+
+class ProximosParams(Schema):
+    """Query parameters of the nearest-services endpoint"""
+    lat: float = Field(..., ge=-90, le=90)
+    lon: float = Field(..., ge=-180, le=180)
+    raio: float = Field(10, gt=0, le=500, description="Radius in kilometres")
+    tipo: Optional[int] = Field(None, description="tipo_servico_id")
+    limit: int = Field(20, ge=1, le=100)
+    cursor: Optional[str] = None
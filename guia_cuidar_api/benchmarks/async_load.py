@@ -0,0 +1,124 @@
+"""
+Load benchmark: blocking supabase-py calls on a worker thread pool versus the
+async client on a single event loop, both against a local stub PostgREST.
+
+Usage (from guia_cuidar_api/):
+    python -m benchmarks.async_load --requests 2000 --latency 25 --threads 8 --concurrency 100
+
+`sync` reproduces the old request path (one gunicorn worker with N threads,
+each blocked on `supabase.table(...).execute()`), `async` is what a single
+uvicorn worker does with `get_async_supabase_client()`, and `api` drives the
+real Ninja routes through Django's async test client.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.stub_postgrest import StubSupabaseServer
+
+# Any well-formed JWT is accepted by the client; the stub never checks it.
+FAKE_KEY = "eyJhbGciOiJIUzI1NiJ9.eyJyb2xlIjoiYW5vbiJ9.c3R1Yg"
+
+
+def report(name: str, latencies: list, elapsed: float):
+    latencies = sorted(latencies)
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(
+        f"{name:<6} {len(latencies):>6} req  {len(latencies) / elapsed:>9.1f} req/s  "
+        f"p50 {p50:>7.1f} ms  p99 {p99:>7.1f} ms  mean {statistics.mean(latencies) * 1000:>7.1f} ms"
+    )
+
+
+def run_sync(url: str, total: int, threads: int):
+    from supabase import create_client
+
+    client = create_client(url, FAKE_KEY)
+
+    def one():
+        start = time.perf_counter()
+        client.table("MaterialDeApoio").select("*").execute()
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        latencies = list(pool.map(lambda _: one(), range(total)))
+    report("sync", latencies, time.perf_counter() - start)
+
+
+async def run_async(url: str, total: int, concurrency: int):
+    from supabase import acreate_client
+
+    client = await acreate_client(url, FAKE_KEY)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            await client.table("MaterialDeApoio").select("*").execute()
+            return time.perf_counter() - start
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(one() for _ in range(total)))
+    report("async", latencies, time.perf_counter() - start)
+
+
+async def run_api(url: str, total: int, concurrency: int, path: str):
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "guia_cuidar.settings")
+    os.environ.setdefault("SUPABASE_URL", url)
+    os.environ.setdefault("SUPABASE_KEY", FAKE_KEY)
+
+    import django
+    from asgiref.sync import sync_to_async
+
+    await sync_to_async(django.setup)()
+
+    from django.test import AsyncClient
+    from app.core import db
+
+    # A local .env may point somewhere else; always hit the stub.
+    db.settings.supabase_url = url
+    db.settings.supabase_key = FAKE_KEY
+
+    client = AsyncClient()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.get(path)
+            assert response.status_code == 200, response.content[:200]
+            return time.perf_counter() - start
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(one() for _ in range(total)))
+    report("api", latencies, time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=25.0, help="Stub latency per call (ms)")
+    parser.add_argument("--rows", type=int, default=50, help="Rows returned per call")
+    parser.add_argument("--threads", type=int, default=8, help="Worker threads for the sync run")
+    parser.add_argument("--concurrency", type=int, default=100, help="In-flight calls for the async runs")
+    parser.add_argument("--path", default="/api/v1/materiais/", help="Route exercised by the api run")
+    parser.add_argument("--modes", default="sync,async,api")
+    args = parser.parse_args()
+
+    modes = args.modes.split(",")
+    with StubSupabaseServer(latency_ms=args.latency, rows=args.rows) as stub:
+        print(f"stub at {stub.url}, {args.latency} ms latency, {args.rows} rows/response")
+        if "sync" in modes:
+            run_sync(stub.url, args.requests, args.threads)
+        if "async" in modes:
+            asyncio.run(run_async(stub.url, args.requests, args.concurrency))
+        if "api" in modes:
+            asyncio.run(run_api(stub.url, args.requests, args.concurrency, args.path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Latency of `/materiais/favoritos` with remote vs local token validation.
+
+Usage (from guia_cuidar_api/):
+    python -m benchmarks.auth_latency --requests 500 --latency 25
+
+`remote` is the previous request path: `auth.get_user()` against Supabase
+Auth followed by the favorites query (two round trips). `local` verifies the
+JWT in-process with `app.core.auth.verify_token` and only queries PostgREST.
+`api` drives the real route through Django's async test client.
+"""
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime, timezone
+
+import jwt
+
+from benchmarks.async_load import FAKE_KEY, report
+from benchmarks.stub_postgrest import StubSupabaseServer
+
+JWT_SECRET = "benchmark-jwt-secret-with-at-least-32-bytes"
+USER_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def make_token() -> str:
+    return jwt.encode(
+        {"sub": USER_ID, "aud": "authenticated", "role": "authenticated", "exp": int(time.time()) + 3600},
+        JWT_SECRET,
+        algorithm="HS256",
+    )
+
+
+def stub_user(method, path, query, headers, body):
+    return 200, {
+        "id": USER_ID,
+        "aud": "authenticated",
+        "role": "authenticated",
+        "email": "responsavel@example.com",
+        "app_metadata": {},
+        "user_metadata": {},
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+async def measure(name: str, total: int, concurrency: int, call):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            await call()
+            return time.perf_counter() - start
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(one() for _ in range(total)))
+    report(name, latencies, time.perf_counter() - start)
+
+
+async def run(url: str, total: int, concurrency: int, modes: list):
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "guia_cuidar.settings")
+    os.environ.setdefault("SUPABASE_URL", url)
+    os.environ.setdefault("SUPABASE_KEY", FAKE_KEY)
+
+    import django
+    from asgiref.sync import sync_to_async
+
+    await sync_to_async(django.setup)()
+
+    from django.test import AsyncClient
+    from app.core import auth, db
+
+    # A local .env may point somewhere else; always hit the stub.
+    db.settings.supabase_url = url
+    db.settings.supabase_key = FAKE_KEY
+    auth.settings.supabase_jwt_secret = JWT_SECRET
+
+    token = make_token()
+    supabase = await db.get_async_supabase_client()
+    auth_client = await db.get_async_auth_client()
+
+    async def remote():
+        user = await auth_client.get_user(token)
+        await supabase.table("MaterialFavorito").select("*").eq("responsavel_id", user.user.id).execute()
+
+    async def local():
+        claims = auth.verify_token(token)
+        await supabase.table("MaterialFavorito").select("*").eq("responsavel_id", claims["sub"]).execute()
+
+    client = AsyncClient()
+
+    async def api():
+        response = await client.get("/api/v1/materiais/favoritos", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 200, response.content[:200]
+
+    for name, call in (("remote", remote), ("local", local), ("api", api)):
+        if name in modes:
+            await measure(name, total, concurrency, call)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=25.0, help="Stub latency per call (ms)")
+    parser.add_argument("--rows", type=int, default=20, help="Favorites returned per call")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--modes", default="remote,local,api")
+    args = parser.parse_args()
+
+    routes = {"/auth/v1/user": stub_user}
+    with StubSupabaseServer(latency_ms=args.latency, rows=args.rows, routes=routes) as stub:
+        print(f"stub at {stub.url}, {args.latency} ms latency, concurrency {args.concurrency}")
+        asyncio.run(run(stub.url, args.requests, args.concurrency, args.modes.split(",")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Microbenchmark of response serialization for the list schemas in app/schemas/.
+
+Usage (from guia_cuidar_api/):
+    python -m benchmarks.serialization --rows 5000 --repeat 5
+
+For every schema with an `id` field it renders `--rows` PostgREST-shaped rows
+three ways:
+
+`double`   the previous handler path: `[Model(**row) for row in rows]`, then
+           Ninja validates the models again against `response=` and encodes
+           them with its JSON encoder
+`single`   plain rows validated once by the response schema (`TRUSTED_RESPONSES=false`)
+`trusted`  `project_rows` + `dumps` from app.core.serialization (the default)
+"""
+import argparse
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import time
+import typing
+from datetime import datetime, timezone
+from typing import List
+
+from pydantic import BaseModel, create_model
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "guia_cuidar.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from ninja.responses import NinjaJSONEncoder  # noqa: E402
+
+from app.core import serialization  # noqa: E402
+
+SAMPLES = {
+    int: lambda i: i,
+    float: lambda i: i / 7,
+    bool: lambda i: i % 2 == 0,
+    str: lambda i: f"Lorem ipsum dolor sit amet {i}",
+    datetime: lambda i: datetime.now(timezone.utc).isoformat(),
+}
+
+
+def list_schemas() -> list:
+    """Every schema in app/schemas/ that is served as a list (has an `id`)."""
+    import app.schemas
+
+    schemas = {}
+    for module_info in pkgutil.iter_modules(app.schemas.__path__):
+        module = importlib.import_module(f"app.schemas.{module_info.name}")
+        for _, obj in inspect.getmembers(module, inspect.isclass):
+            if issubclass(obj, BaseModel) and obj.__module__ == module.__name__ and "id" in obj.model_fields:
+                schemas[obj.__name__] = obj
+    return sorted(schemas.values(), key=lambda model: model.__name__)
+
+
+def sample_rows(model, count: int) -> list:
+    """Rows shaped like the PostgREST response for `model` (timestamps as strings)."""
+    columns = {}
+    for name, info in model.model_fields.items():
+        annotation = info.annotation
+        if typing.get_origin(annotation) is typing.Union:
+            annotation = next(arg for arg in typing.get_args(annotation) if arg is not type(None))
+        columns[name] = SAMPLES.get(annotation, SAMPLES[str])
+    return [{name: make(i) for name, make in columns.items()} for i in range(1, count + 1)]
+
+
+def render_double(model, response_model, rows) -> bytes:
+    items = [model(**row) for row in rows]
+    data = response_model.model_validate({"response": items}).model_dump()["response"]
+    return json.dumps(data, cls=NinjaJSONEncoder).encode()
+
+
+def render_single(model, response_model, rows) -> bytes:
+    data = response_model.model_validate({"response": rows}).model_dump()["response"]
+    return json.dumps(data, cls=NinjaJSONEncoder).encode()
+
+
+def render_trusted(model, response_model, rows) -> bytes:
+    return serialization.dumps(serialization.project_rows(model, rows))
+
+
+def best_of(repeat: int, render, *args) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    encoder = "orjson" if serialization.orjson is not None else "json"
+    print(f"{args.rows} rows, best of {args.repeat}, trusted encoder: {encoder}")
+    print(f"{'schema':<28} {'double':>10} {'single':>10} {'trusted':>10} {'speed-up':>9}")
+    for model in list_schemas():
+        rows = sample_rows(model, args.rows)
+        # Same shape as the model Ninja builds for `response=List[model]`
+        response_model = create_model(f"{model.__name__}Response", response=(List[model], ...))
+        double, single, trusted = (
+            best_of(args.repeat, render, model, response_model, rows)
+            for render in (render_double, render_single, render_trusted)
+        )
+        print(
+            f"{model.__name__:<28} {double * 1000:>8.1f}ms {single * 1000:>8.1f}ms "
+            f"{trusted * 1000:>8.1f}ms {double / trusted:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Minimal stand-in for the Supabase gateway (Kong -> PostgREST/GoTrue) used by
+the benchmarks in this directory.
+
+It speaks just enough HTTP/1.1 (keep-alive, Content-Length bodies) for the
+supabase-py clients, adds a fixed artificial latency to every response to
+emulate the network hop to Supabase, and serves canned JSON payloads.
+"""
+import asyncio
+import json
+import multiprocessing
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+Handler = Callable[[str, str, Dict[str, Any], Dict[str, str], bytes], Tuple[int, Any]]
+
+
+def sample_rows(table: str, count: int) -> list:
+    """Build `count` fake rows shaped like the given table."""
+    now = datetime.now(timezone.utc).isoformat()
+    if table == "MaterialFavorito":
+        return [
+            {
+                "responsavel_id": "00000000-0000-0000-0000-000000000001",
+                "material_id": i,
+                "dependente_id": 1,
+                "data_favoritado": now,
+            }
+            for i in range(1, count + 1)
+        ]
+    # One superset row shape is enough: the API schemas ignore extra columns.
+    return [
+        {
+            "id": i,
+            "titulo": f"Material {i}",
+            "nome": f"Item {i}",
+            "name": f"Item {i}",
+            "corpo": "Lorem ipsum dolor sit amet. " * 20,
+            "conteudo": "Lorem ipsum dolor sit amet.",
+            "texto": "Lorem ipsum dolor sit amet.",
+            "aprovado": True,
+            "responsavel_id": "00000000-0000-0000-0000-000000000001",
+            "categoria_id": i % 5 + 1,
+            "nivel_suporte_tea_id": i % 3 + 1,
+            "tipo_servico_id": i % 4 + 1,
+            "data_criacao": now,
+            "data_atualizacao": now,
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+class StubSupabaseServer:
+    """
+    Asyncio HTTP server answering `/rest/v1/<table>` with sample rows.
+
+    The server runs in a forked child process so its own CPU time does not
+    compete with the client being measured for the GIL.
+
+    Extra routes (e.g. `/auth/v1/user`) can be registered through `routes`,
+    mapping a path prefix to a handler returning `(status, json_payload)`.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 20.0,
+        rows: int = 50,
+        routes: Optional[Dict[str, Handler]] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.latency = latency_ms / 1000
+        self.rows = rows
+        self.routes = routes or {}
+        self.host = host
+        self.port = port
+        self._process: Optional[multiprocessing.Process] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def _default_handler(self, method, path, query, headers, body):
+        if path.startswith("/rest/v1/"):
+            table = path[len("/rest/v1/"):]
+            rows = sample_rows(table, self.rows)
+            # Honour the keyset/projection parameters the API sends.
+            after = query.get("id", [""])[0]
+            if after.startswith("gt."):
+                rows = [r for r in rows if r["id"] > int(after[3:])]
+            for column, values in query.items():
+                if values[0].startswith("eq."):
+                    rows = [r for r in rows if str(r.get(column)).lower() == values[0][3:].lower()]
+            if "limit" in query:
+                rows = rows[:int(query["limit"][0])]
+            columns = query.get("select", ["*"])[0]
+            if columns != "*" and "(" not in columns:
+                rows = [{c: r.get(c) for c in columns.split(",")} for r in rows]
+            return 200, rows
+        return 404, {"message": f"No stub route for {path}"}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                body = await reader.readexactly(length) if length else b""
+
+                parts = urlsplit(target)
+                query = parse_qs(parts.query)
+                handler = self._default_handler
+                for prefix, route in self.routes.items():
+                    if parts.path.startswith(prefix):
+                        handler = route
+                        break
+
+                await asyncio.sleep(self.latency)
+                status, payload = handler(method, parts.path, query, headers, body)
+
+                data = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} OK\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    "Connection: keep-alive\r\n\r\n".encode("latin-1") + data
+                )
+                await writer.drain()
+        except (ConnectionResetError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def _run(self, port_queue):
+        loop = asyncio.new_event_loop()
+        server = loop.run_until_complete(
+            asyncio.start_server(self._handle, self.host, self.port, backlog=4096)
+        )
+        port_queue.put(server.sockets[0].getsockname()[1])
+        loop.run_forever()
+
+    def start(self) -> "StubSupabaseServer":
+        context = multiprocessing.get_context("fork")
+        port_queue = context.Queue()
+        self._process = context.Process(target=self._run, args=(port_queue,), daemon=True)
+        self._process.start()
+        self.port = port_queue.get(timeout=10)
+        return self
+
+    def stop(self):
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
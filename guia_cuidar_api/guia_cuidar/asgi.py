@@ -8,4 +8,9 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'guia_cuidar.settings')
 
-application = get_asgi_application()
\ No newline at end of file
+application = get_asgi_application()
+
+# Drain testimonials left in the write-behind queue by a restart or crash
+from app.core.depoimentos import start_worker  # noqa: E402
+
+start_worker()
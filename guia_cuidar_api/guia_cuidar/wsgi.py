@@ -9,3 +9,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'guia_cuidar.settings')
 
 application = get_wsgi_application()
+
+# Drain testimonials left in the write-behind queue by a restart or crash
+from app.core.depoimentos import start_worker  # noqa: E402
+
+start_worker()
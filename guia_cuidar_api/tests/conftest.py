@@ -0,0 +1,10 @@
+import os
+
+import django
+
+# app.core.db refuses to import without these; the tests never reach Supabase
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "test-service-role-key")
+# django-ninja reads its settings on import
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "guia_cuidar.settings")
+django.setup()
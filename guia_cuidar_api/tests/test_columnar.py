@@ -0,0 +1,34 @@
+from app.core.columnar import after_key
+
+ORDER = ("localidade", "ano", "sexo")
+
+
+def test_after_key_expands_the_comparison_column_by_column():
+    last = {"localidade": "Brasil", "ano": 2010, "sexo": "Total"}
+
+    assert after_key(ORDER, last) == ",".join([
+        'localidade.gt."Brasil"',
+        "localidade.is.null",
+        'and(localidade.eq."Brasil",ano.gt.2010)',
+        'and(localidade.eq."Brasil",ano.is.null)',
+        'and(localidade.eq."Brasil",ano.eq.2010,sexo.gt."Total")',
+        'and(localidade.eq."Brasil",ano.eq.2010,sexo.is.null)',
+    ])
+
+
+def test_after_key_sorts_nulls_last():
+    last = {"localidade": "Brasil", "ano": None, "sexo": "Total"}
+
+    assert after_key(ORDER, last) == ",".join([
+        'localidade.gt."Brasil"',
+        "localidade.is.null",
+        'and(localidade.eq."Brasil",ano.is.null,sexo.gt."Total")',
+        'and(localidade.eq."Brasil",ano.is.null,sexo.is.null)',
+    ])
+    assert after_key(ORDER, dict.fromkeys(ORDER)) is None
+
+
+def test_after_key_quotes_reserved_characters():
+    last = {"localidade": 'Santa "Bárbara", (SP)\\'}
+
+    assert after_key(("localidade",), last) == 'localidade.gt."Santa \\"Bárbara\\", (SP)\\\\",localidade.is.null'
@@ -0,0 +1,17 @@
+import asyncio
+
+import pytest
+
+from app.core import pagination
+from app.core.pagination import PaginationParams, fetch_page
+from app.schemas.material import MaterialDeApoio
+
+
+def test_shared_cache_is_refused_for_user_tables(monkeypatch):
+    async def no_client():
+        raise AssertionError("must fail before querying")
+
+    monkeypatch.setattr(pagination, "get_async_supabase_client", no_client)
+
+    with pytest.raises(ValueError, match="MaterialFavorito"):
+        asyncio.run(fetch_page("MaterialFavorito", MaterialDeApoio, PaginationParams(), cached=True))
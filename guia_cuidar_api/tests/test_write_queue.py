@@ -0,0 +1,200 @@
+import asyncio
+import time
+
+import pytest
+from postgrest.exceptions import APIError
+
+from app.core import write_queue
+from app.core.write_queue import DurableQueue, drain, drain_batch, is_rejection
+
+
+def rejection(message="violates foreign key constraint"):
+    return APIError({"message": message, "code": "23503", "hint": None, "details": None})
+
+
+def upstream_error():
+    return APIError({"message": "Could not connect to the database", "code": "PGRST000", "hint": None, "details": None})
+
+
+class StubTable:
+    def __init__(self, client, rows):
+        self.client = client
+        self.rows = rows
+
+    async def execute(self):
+        self.client.calls.append(self.rows)
+        rows = self.rows if isinstance(self.rows, list) else [self.rows]
+        if self.client.error is not None:
+            raise self.client.error
+        if any(row.get("bad") for row in rows):
+            raise rejection()
+        self.client.inserted.extend(rows)
+
+
+class StubClient:
+    """Just enough of AsyncClient for `table(...).insert(...).execute()`."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.calls = []
+        self.inserted = []
+
+    def table(self, name):
+        return self
+
+    def insert(self, rows):
+        return StubTable(self, rows)
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return DurableQueue(str(tmp_path / "queue.sqlite3"))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    stub = StubClient()
+
+    async def get_client():
+        return stub
+
+    monkeypatch.setattr(write_queue, "get_async_supabase_client", get_client)
+    monkeypatch.setattr(write_queue.settings, "write_queue_batch_size", 100)
+    monkeypatch.setattr(write_queue.settings, "write_queue_max_attempts", 3)
+    monkeypatch.setattr(write_queue.settings, "write_queue_backoff", 0)
+    monkeypatch.setattr(write_queue.settings, "write_queue_max_backoff", 0)
+    return stub
+
+
+def test_lease_hides_items_until_the_lease_expires(queue):
+    first, second = queue.put({"n": 1}), queue.put({"n": 2})
+
+    assert queue.lease(10, 60) == [(first, {"n": 1}), (second, {"n": 2})]
+    assert queue.lease(10, 60) == []
+    assert queue.stats() == {"pending": 0, "leased": 2, "dead": 0}
+
+    queue.ack([first])
+    queue.release([second], "boom", backoff=0)
+    assert queue.lease(10, 60) == [(second, {"n": 2})]
+
+
+def test_release_backs_off_exponentially(queue):
+    item = queue.put({"n": 1})
+    delays = []
+    for _ in range(4):
+        queue.lease(1, 60)
+        before = time.time()
+        queue.release([item], "boom", backoff=10, max_backoff=50)
+        (leased_until,) = queue._connect().execute("SELECT leased_until FROM items").fetchone()
+        delays.append(round(leased_until - before))
+        queue._connect().execute("UPDATE items SET leased_until = NULL")
+
+    assert delays == [10, 20, 40, 50]
+
+
+def test_only_rejections_spend_attempts(queue):
+    item = queue.put({"n": 1})
+    for _ in range(10):
+        queue.lease(1, 60)
+        queue.release([item], "upstream down", max_attempts=2)
+    assert queue.stats()["dead"] == 0
+
+    for _ in range(2):
+        queue.lease(1, 60)
+        queue.release([item], "rejected", rejected=True, max_attempts=2)
+    assert queue.stats()["dead"] == 1
+    assert queue.lease(1, 60) == []
+
+    assert queue.requeue_dead() == 1
+    assert queue.lease(1, 60) == [(item, {"n": 1})]
+
+
+def test_is_rejection():
+    assert is_rejection(rejection())
+    assert is_rejection(APIError({"code": "22P02", "message": "invalid input syntax"}))
+    assert not is_rejection(upstream_error())
+    assert not is_rejection(APIError({"message": "Internal Server Error"}))
+    assert not is_rejection(TimeoutError())
+
+
+def test_drain_writes_batches_with_one_insert_each(queue, client, monkeypatch):
+    monkeypatch.setattr(write_queue.settings, "write_queue_batch_size", 100)
+    for n in range(250):
+        queue.put({"n": n})
+
+    result = asyncio.run(drain(queue, "DepoimentoResponsavel"))
+
+    assert (result.written, result.retried) == (250, 0)
+    assert [len(call) for call in client.calls] == [100, 100, 50]
+    assert queue.stats() == {"pending": 0, "leased": 0, "dead": 0}
+
+
+def test_rejected_batch_is_retried_row_by_row(queue, client):
+    queue.put({"n": 1})
+    queue.put({"n": 2, "bad": True})
+    queue.put({"n": 3})
+
+    result = asyncio.run(drain_batch(queue, "DepoimentoResponsavel"))
+
+    assert (result.written, result.retried) == (2, 1)
+    assert [row["n"] for row in client.inserted] == [1, 3]
+    assert queue.stats() == {"pending": 1, "leased": 0, "dead": 0}
+
+    for _ in range(2):
+        asyncio.run(drain_batch(queue, "DepoimentoResponsavel"))
+    assert queue.stats() == {"pending": 0, "leased": 0, "dead": 1}
+
+
+@pytest.mark.parametrize("error", [upstream_error(), ConnectionError("connection refused")])
+def test_upstream_failures_release_the_batch_without_spending_attempts(queue, client, error):
+    client.error = error
+    for n in range(3):
+        queue.put({"n": n})
+
+    for _ in range(10):
+        result = asyncio.run(drain_batch(queue, "DepoimentoResponsavel"))
+        assert (result.written, result.retried) == (0, 3)
+
+    # One bulk insert per drain, never the row-by-row fallback
+    assert len(client.calls) == 10
+    assert queue.stats() == {"pending": 3, "leased": 0, "dead": 0}
+    (attempts,) = queue._connect().execute("SELECT max(attempts) FROM items").fetchone()
+    assert attempts == 0
+
+    client.error = None
+    result = asyncio.run(drain(queue, "DepoimentoResponsavel"))
+    assert result.written == 3
+
+
+class StubWorker:
+    started = False
+
+    def ensure_started(self):
+        self.started = True
+
+    def notify(self):
+        pass
+
+
+@pytest.mark.parametrize("write_behind, queued, started", [
+    (False, None, False),
+    (False, 0, False),
+    (False, 2, True),
+    (True, None, True),
+])
+def test_start_worker_at_startup(tmp_path, monkeypatch, write_behind, queued, started):
+    from app.core import depoimentos
+
+    path = tmp_path / "depoimentos.sqlite3"
+    if queued is not None:
+        queue = DurableQueue(str(path))
+        for n in range(queued):
+            queue.put({"n": n})
+    worker = StubWorker()
+    monkeypatch.setattr(depoimentos.settings, "depoimentos_write_behind", write_behind)
+    monkeypatch.setattr(depoimentos.settings, "depoimentos_queue_path", str(path))
+    monkeypatch.setattr(depoimentos, "_queue", None)
+    monkeypatch.setattr(depoimentos, "get_worker", lambda: worker)
+
+    assert depoimentos.start_worker() is started
+    assert worker.started is started
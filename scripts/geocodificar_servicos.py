@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Backfill de latitude/longitude de ServicoLocal a partir do campo `endereco`.
+
+Uso (com SUPABASE_URL e SUPABASE_KEY no ambiente ou no .env da API):
+    python geocodificar_servicos.py --lote 200
+
+- Busca apenas serviços sem coordenadas, em páginas de `--lote` linhas.
+- Geocodifica cada endereço distinto uma única vez (Nominatim/OpenStreetMap por
+  padrão, respeitando 1 requisição por segundo, com espera dobrada a cada falha
+  seguida) e guarda o resultado em um cache
+  JSON local, então execuções repetidas não refazem consultas.
+- Grava as coordenadas de cada página em uma única chamada RPC
+  (`atualizar_coordenadas_servicos`, em 09_servicos_geo.sql).
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import urllib.parse
+import urllib.request
+from pathlib import Path
+
+from dotenv import load_dotenv
+from supabase import create_client
+
+NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+USER_AGENT = "GuiaCuidar-geocodificacao/1.0"
+# Teto da espera entre tentativas quando o geocodificador falha seguidamente
+ESPERA_MAXIMA = 60.0
+
+
+def normalizar(endereco):
+    """Chave do cache: endereço sem espaços repetidos e em minúsculas."""
+    return " ".join(endereco.split()).lower()
+
+
+def geocodificar(endereco, url, pais):
+    """Retorna (latitude, longitude) do endereço ou None se não encontrado."""
+    params = urllib.parse.urlencode({"q": endereco, "format": "jsonv2", "limit": 1, "countrycodes": pais})
+    request = urllib.request.Request(f"{url}?{params}", headers={"User-Agent": USER_AGENT})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        resultados = json.load(response)
+    if not resultados:
+        return None
+    return float(resultados[0]["lat"]), float(resultados[0]["lon"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lote", type=int, default=200, help="Serviços por página/atualização")
+    parser.add_argument("--limite", type=int, default=None, help="Máximo de serviços a processar")
+    parser.add_argument("--intervalo", type=float, default=1.0, help="Segundos entre consultas ao geocodificador")
+    parser.add_argument("--url", default=os.getenv("GEOCODER_URL", NOMINATIM_URL))
+    parser.add_argument("--pais", default="br")
+    parser.add_argument("--cache", default="geocodificacao_cache.json")
+    parser.add_argument("--dry-run", action="store_true", help="Não grava no banco")
+    args = parser.parse_args()
+
+    load_dotenv(Path(__file__).resolve().parent.parent / "guia_cuidar_api" / ".env")
+    if not os.getenv("SUPABASE_URL") or not os.getenv("SUPABASE_KEY"):
+        sys.exit("Defina SUPABASE_URL e SUPABASE_KEY (service role)")
+    supabase = create_client(os.environ["SUPABASE_URL"], os.environ["SUPABASE_KEY"])
+
+    cache_path = Path(args.cache)
+    cache = json.loads(cache_path.read_text(encoding="utf-8")) if cache_path.exists() else {}
+
+    processados = atualizados = sem_resultado = consultas = falhas = 0
+    falhas_seguidas = 0
+    ultimo_id = 0
+    inicio = time.perf_counter()
+
+    while args.limite is None or processados < args.limite:
+        # Próxima página de serviços sem coordenadas (keyset por id)
+        pagina = (
+            supabase.table("ServicoLocal")
+            .select("id,endereco")
+            .is_("latitude", "null")
+            .not_.is_("endereco", "null")
+            .gt("id", ultimo_id)
+            .order("id")
+            .limit(args.lote)
+            .execute()
+        ).data
+        if not pagina:
+            break
+        ultimo_id = pagina[-1]["id"]
+
+        coordenadas = []
+        for servico in pagina:
+            if args.limite is not None and processados >= args.limite:
+                break
+            processados += 1
+            chave = normalizar(servico["endereco"])
+            if chave not in cache:
+                try:
+                    cache[chave] = geocodificar(servico["endereco"], args.url, args.pais)
+                except OSError as e:
+                    # Também respeita o limite de requisições, esperando mais a cada falha seguida
+                    falhas += 1
+                    falhas_seguidas += 1
+                    espera = min(args.intervalo * 2 ** falhas_seguidas, ESPERA_MAXIMA)
+                    print(f"⚠️  Falha ao geocodificar '{servico['endereco']}': {e} (aguardando {espera:.0f}s)")
+                    time.sleep(espera)
+                    continue
+                consultas += 1
+                falhas_seguidas = 0
+                time.sleep(args.intervalo)
+            if cache[chave] is None:
+                sem_resultado += 1
+                continue
+            latitude, longitude = cache[chave]
+            coordenadas.append({"id": servico["id"], "latitude": latitude, "longitude": longitude})
+
+        if coordenadas and not args.dry_run:
+            # Uma única chamada para gravar a página inteira
+            resultado = supabase.rpc("atualizar_coordenadas_servicos", {"p_itens": coordenadas}).execute()
+            atualizados += resultado.data or 0
+        elif args.dry_run:
+            atualizados += len(coordenadas)
+
+        cache_path.write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
+        print(f"... {processados} processados, {atualizados} atualizados, {consultas} consultas ao geocodificador")
+
+    print("\n=== GEOCODIFICAÇÃO ===")
+    print(f"Processados: {processados}")
+    print(f"Atualizados: {atualizados}{' (dry-run)' if args.dry_run else ''}")
+    print(f"Sem resultado: {sem_resultado}")
+    print(f"Consultas ao geocodificador: {consultas} (demais vieram do cache)")
+    print(f"Falhas do geocodificador: {falhas}")
+    print(f"Tempo: {time.perf_counter() - inicio:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
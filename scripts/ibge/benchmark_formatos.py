@@ -0,0 +1,96 @@
+"""
+Benchmark dos formatos de saída: CSV x Parquet x Arrow IPC.
+
+Uso (a partir de scripts/, exige o pyarrow):
+    python -m ibge.benchmark_formatos --localidades 5000 --colunas 200
+
+Normaliza uma planilha sintética (layout da tabela 10139, ver
+`ibge.benchmark.synthetic_sheet`), grava os mesmos registros com `CsvSink`,
+`ParquetSink` e `ArrowSink` e mede, para cada formato:
+
+- tamanho em disco;
+- tempo de escrita;
+- leitura completa em um DataFrame com os tipos certos (o CSV precisa
+  reconverter ano/valor e transformar as categorias em `category`);
+- leitura de uma coluna só (média da taxa), onde os formatos colunares não
+  precisam percorrer o arquivo inteiro.
+
+Também confere que os três DataFrames lidos são iguais.
+"""
+import argparse
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ibge.benchmark import synthetic_sheet, timed
+from ibge.normalize import ESCOLARIZACAO, normalize_frame
+from ibge.sinks import ArrowSink, CsvSink, ParquetSink, run_pipeline
+
+CATEGORIES = [c for c in ESCOLARIZACAO.names if c not in ESCOLARIZACAO.integer_levels]
+
+
+def write(sink, rows):
+    with sink:
+        run_pipeline(rows, [sink])
+
+
+def read_csv(path: Path) -> pd.DataFrame:
+    df = pd.read_csv(path, dtype={c: "category" for c in CATEGORIES})
+    return df.astype({"ano": "int64", ESCOLARIZACAO.value_name: "float64"})
+
+
+def read_arrow(path: Path) -> pd.DataFrame:
+    with pa.ipc.open_stream(path) as reader:
+        return reader.read_pandas()
+
+
+def column_mean(path: Path, kind: str) -> float:
+    value = ESCOLARIZACAO.value_name
+    if kind == "csv":
+        return pd.read_csv(path, usecols=[value])[value].mean()
+    if kind == "parquet":
+        return pq.read_table(path, columns=[value]).column(value).to_pandas().mean()
+    # IPC stream: lê os lotes inteiros, mas só converte a coluna pedida
+    with pa.ipc.open_stream(path) as reader:
+        return reader.read_all().column(value).to_pandas().mean()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--localidades", type=int, default=5000)
+    parser.add_argument("--colunas", type=int, default=200)
+    args = parser.parse_args()
+
+    df = normalize_frame(synthetic_sheet(args.localidades, args.colunas))
+    rows = list(df.itertuples(index=False, name=None))
+    print(f"{len(rows):,} registros normalizados")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        formats = {
+            "csv": (CsvSink(tmp / "saida.csv", ESCOLARIZACAO.columns), read_csv),
+            "parquet": (ParquetSink(tmp / "saida.parquet"), pd.read_parquet),
+            "arrow": (ArrowSink(tmp / "saida.arrows"), read_arrow),
+        }
+
+        frames = {}
+        print(f"{'formato':<8} {'tamanho':>10} {'escrita':>9} {'leitura':>9} {'1 coluna':>9}")
+        for kind, (sink, reader) in formats.items():
+            _, t_write = timed(write, sink, rows)
+            frames[kind], t_read = timed(reader, sink.path)
+            _, t_column = timed(column_mean, sink.path, kind)
+            size = sink.path.stat().st_size / 1024 ** 2
+            print(f"{kind:<8} {size:8.1f}MiB {t_write:8.2f}s {t_read:8.2f}s {t_column:8.2f}s")
+
+        for kind in ("parquet", "arrow"):
+            expected = frames["csv"].astype({c: str for c in CATEGORIES})
+            got = frames[kind].astype({c: str for c in CATEGORIES})
+            pd.testing.assert_frame_equal(expected, got, check_dtype=False)
+        print("✅ os três formatos têm os mesmos registros")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark de memória: leitura em streaming x planilha inteira em memória.
+
+Uso (a partir de scripts/):
+    python -m ibge.benchmark_memoria --localidades 1000,4000,8000 --colunas 200
+
+Para cada tamanho, grava uma planilha .xlsx sintética (layout da tabela 10139,
+ver `ibge.benchmark.synthetic_sheet`) e roda `python -m ibge.loader --sem-banco
+--csv` duas vezes, cada uma em um processo separado: com `--em-memoria`
+(pd.read_excel + DataFrame normalizado) e em streaming (openpyxl read-only,
+blocos de `--bloco` linhas). Mostra o pico de memória (RSS máximo) e o tempo de
+cada modo e confere que os dois CSVs são idênticos.
+
+No modo streaming o pico deve ficar praticamente constante entre os tamanhos.
+"""
+import argparse
+import filecmp
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+from openpyxl import Workbook
+
+from ibge.benchmark import synthetic_sheet
+
+# Roda o loader e imprime o pico de RSS do próprio processo, em KiB. VmHWM
+# (Linux) é zerado no exec; ru_maxrss herdaria o pico do processo pai.
+RUNNER = (
+    "import resource, runpy, sys\n"
+    "sys.argv = ['ibge.loader'] + sys.argv[1:]\n"
+    "runpy.run_module('ibge.loader', run_name='__main__')\n"
+    "try:\n"
+    "    hwm = next(l for l in open('/proc/self/status') if l.startswith('VmHWM')).split()[1]\n"
+    "except OSError:\n"
+    "    hwm = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+    "print('maxrss', hwm)\n"
+)
+
+
+def write_xlsx(raw: pd.DataFrame, path: Path):
+    """Grava a planilha crua em .xlsx sem montá-la inteira em memória (write-only)."""
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    for row in raw.itertuples(index=False, name=None):
+        sheet.append([None if pd.isna(v) else v for v in row])
+    workbook.save(path)
+
+
+def run_loader(planilha: Path, saida: Path, *extra: str):
+    """Executa o loader em um subprocesso; devolve (pico de RSS em MiB, segundos)."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", RUNNER, str(planilha), "--sem-banco", "--csv", str(saida), *extra],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+    maxrss = next(int(line.split()[1]) for line in result.stdout.splitlines() if line.startswith("maxrss"))
+    return maxrss / 1024, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--localidades", default="1000,4000,8000", help="Tamanhos separados por vírgula")
+    parser.add_argument("--colunas", type=int, default=200)
+    parser.add_argument("--bloco", type=int, default=500, help="Linhas por bloco no modo streaming")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for localidades in (int(n) for n in args.localidades.split(",")):
+            planilha = tmp / f"sintetica_{localidades}.xlsx"
+            write_xlsx(synthetic_sheet(localidades, args.colunas), planilha)
+            size = planilha.stat().st_size / 1024 ** 2
+            print(f"{localidades} localidades x {args.colunas} colunas ({size:.1f} MiB em disco)")
+
+            memoria, t_memoria = run_loader(planilha, tmp / "memoria.csv", "--em-memoria")
+            streaming, t_streaming = run_loader(planilha, tmp / "streaming.csv", "--bloco", str(args.bloco))
+            print(f"  em memória: pico {memoria:8.1f} MiB  {t_memoria:6.2f}s")
+            print(f"  streaming:  pico {streaming:8.1f} MiB  {t_streaming:6.2f}s")
+
+            if not filecmp.cmp(tmp / "memoria.csv", tmp / "streaming.csv", shallow=False):
+                sys.exit("  ❌ os CSVs gerados são diferentes")
+            print("  ✅ CSVs idênticos")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""
+Importação em lote das planilhas do IBGE, em paralelo.
+
+Uso (a partir de scripts/):
+    python -m ibge.importar planilhas/ --dsn "$DATABASE_URL"
+    python -m ibge.importar "downloads/*.xlsx" --saida normalizados/ --processos 8
+    python -m ibge.importar planilhas/ --sem-banco --saida normalizados/ --formatos csv,parquet
+
+Recebe um diretório (todas as .xlsx/.csv dentro dele) ou um padrão glob. Cada
+arquivo é associado a uma entrada do catálogo `ibge/tabelas.json` pelo nome
+(ver `ibge.specs`) e processado em um pool de processos com
+`ibge.loader.import_workbook`: leitura em streaming, arquivos normalizados em
+`--saida` (CSV, Parquet e/ou Arrow, conforme `--formatos`) e carga
+incremental no banco quando há `--dsn`. Ao final, as views materializadas de
+estatísticas são atualizadas uma única vez.
+
+Um arquivo com erro (layout inesperado, planilha corrompida, falha no banco)
+não interrompe os outros: a carga dele é desfeita e o erro entra no relatório
+final. O código de saída é 1 se algum arquivo falhou.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from ibge.loader import import_workbook, refresh_aggregates
+from ibge.specs import SPECS_PATH, TableSpec, load_specs, match_spec
+
+EXTENSIONS = (".xlsx", ".csv")
+# Formato de saída -> (extensão, argumento de import_workbook)
+FORMATS = {
+    "csv": (".csv", "csv_path"),
+    "parquet": (".parquet", "parquet_path"),
+    "arrow": (".arrows", "arrow_path"),
+}
+
+
+@dataclass
+class FileResult:
+    arquivo: str
+    tabela: Optional[str]
+    status: str  # "ok", "pulado" ou "erro"
+    registros: int = 0
+    segundos: float = 0.0
+    inseridas: Optional[int] = None
+    alteradas: Optional[int] = None
+    removidas: Optional[int] = None
+    erro: Optional[str] = None
+
+
+def collect_files(source: str) -> List[Path]:
+    """Planilhas de um diretório ou de um padrão glob, em ordem de nome."""
+    path = Path(source)
+    if path.is_dir():
+        files = [p for p in path.iterdir() if p.suffix.lower() in EXTENSIONS]
+    else:
+        files = [Path(p) for p in glob.glob(source)]
+    # Arquivos temporários do Excel (~$planilha.xlsx) não são planilhas
+    return sorted(p for p in files if p.is_file() and not p.name.startswith("~$"))
+
+
+def import_one(
+    path: Path,
+    spec: TableSpec,
+    output_dir: Optional[Path],
+    dsn: Optional[str],
+    force: bool,
+    chunk_rows: int,
+    formats: Sequence[str] = ("csv",),
+) -> FileResult:
+    """Importa um arquivo no processo do pool; nunca levanta exceção."""
+    start = time.perf_counter()
+    outputs = {}
+    if output_dir:
+        for name in formats:
+            extension, argument = FORMATS[name]
+            outputs[argument] = output_dir / f"{path.stem}{extension}"
+    try:
+        result = import_workbook(
+            path,
+            spec.header,
+            spec.table,
+            dsn=dsn,
+            force=force,
+            chunk_rows=chunk_rows,
+            **outputs,
+        )
+    except Exception as e:
+        return FileResult(
+            path.name,
+            spec.table,
+            "erro",
+            segundos=time.perf_counter() - start,
+            erro=f"{type(e).__name__}: {e}\n{traceback.format_exc(limit=3)}",
+        )
+
+    report = result.report
+    return FileResult(
+        path.name,
+        spec.table,
+        "pulado" if result.pulado and not report else "ok",
+        registros=result.registros,
+        segundos=time.perf_counter() - start,
+        inseridas=report.inserted if report else None,
+        alteradas=report.updated if report else None,
+        removidas=report.deleted if report else None,
+    )
+
+
+def plan(files: List[Path], specs: Dict[str, TableSpec]):
+    """
+    Associa cada arquivo à sua tabela.
+
+    A carga incremental remove da tabela as linhas que não vieram no arquivo,
+    então dois arquivos da mesma tabela no mesmo lote são recusados.
+
+    Returns:
+        tuple: `(tarefas, erros)` — pares `(arquivo, spec)` e `FileResult`s de erro
+    """
+    tasks, errors, by_table = [], [], {}
+    for path in files:
+        spec = match_spec(path, specs)
+        if spec is None:
+            errors.append(FileResult(path.name, None, "erro", erro="nenhuma entrada do catálogo casa com o nome"))
+            continue
+        by_table.setdefault(spec.table, []).append(path)
+        tasks.append((path, spec))
+
+    duplicated = {table for table, paths in by_table.items() if len(paths) > 1}
+    for path, spec in [t for t in tasks if t[1].table in duplicated]:
+        others = ", ".join(p.name for p in by_table[spec.table] if p != path)
+        errors.append(FileResult(path.name, spec.table, "erro", erro=f"mesma tabela que {others}"))
+    return [t for t in tasks if t[1].table not in duplicated], errors
+
+
+def print_summary(results: List[FileResult], elapsed: float):
+    print("\n=== RESUMO ===")
+    name_width = max(len(r.arquivo) for r in results)
+    table_width = max(len(r.tabela or "-") for r in results)
+    for r in sorted(results, key=lambda r: r.arquivo):
+        changes = ""
+        if r.inseridas is not None:
+            changes = f"  +{r.inseridas:,} ~{r.alteradas:,} -{r.removidas:,}"
+        print(
+            f"{r.status:<7} {r.arquivo:<{name_width}}  {r.tabela or '-':<{table_width}}  "
+            f"{r.registros:>10,} {r.segundos:7.1f}s{changes}"
+        )
+    counts = {status: sum(r.status == status for r in results) for status in ("ok", "pulado", "erro")}
+    total = sum(r.registros for r in results)
+    print(
+        f"\n{len(results)} arquivos em {elapsed:.1f}s: {counts['ok']} ok, {counts['pulado']} pulados, "
+        f"{counts['erro']} com erro; {total:,} registros"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("origem", help="Diretório ou padrão glob (entre aspas) das planilhas")
+    parser.add_argument("--catalogo", type=Path, default=SPECS_PATH, help="Catálogo de tabelas (JSON)")
+    parser.add_argument("--dsn", default=os.getenv("DATABASE_URL"), help="Padrão: $DATABASE_URL")
+    parser.add_argument("--sem-banco", action="store_true", help="Só gera os arquivos normalizados")
+    parser.add_argument("--saida", type=Path, help="Diretório para os arquivos normalizados")
+    parser.add_argument(
+        "--formatos", default="csv", help=f"Formatos gravados em --saida, separados por vírgula ({', '.join(FORMATS)})"
+    )
+    parser.add_argument("--processos", type=int, default=os.cpu_count(), help="Padrão: número de CPUs")
+    parser.add_argument("--forcar", action="store_true", help="Importa mesmo os arquivos sem mudanças")
+    parser.add_argument("--bloco", type=int, default=500, help="Linhas da planilha normalizadas por vez")
+    parser.add_argument("--relatorio", type=Path, help="Grava o resumo em JSON")
+    args = parser.parse_args()
+
+    dsn = None if args.sem_banco else args.dsn
+    if not dsn and not args.saida:
+        parser.error("informe --dsn (ou DATABASE_URL) e/ou --saida")
+    formats = [f.strip() for f in args.formatos.split(",") if f.strip()]
+    unknown = [f for f in formats if f not in FORMATS]
+    if unknown or not formats:
+        parser.error(f"--formatos: use {', '.join(FORMATS)}")
+
+    files = collect_files(args.origem)
+    if not files:
+        parser.error(f"nenhuma planilha em {args.origem}")
+    tasks, results = plan(files, load_specs(args.catalogo))
+    if args.saida:
+        args.saida.mkdir(parents=True, exist_ok=True)
+
+    print(f"{len(files)} arquivos, {len(tasks)} para importar com {args.processos} processos")
+    for r in results:
+        print(f"❌ {r.arquivo}: {r.erro}")
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.processos) as pool:
+        futures = {
+            pool.submit(import_one, path, spec, args.saida, dsn, args.forcar, args.bloco, formats): (path, spec)
+            for path, spec in tasks
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            try:
+                r = future.result()
+            except Exception as e:
+                # Processo do pool morreu (ex.: falta de memória)
+                path, spec = futures[future]
+                r = FileResult(path.name, spec.table, "erro", erro=f"{type(e).__name__}: {e}")
+            results.append(r)
+            if r.status == "erro":
+                print(f"[{done}/{len(tasks)}] ❌ {r.arquivo}: {r.erro.splitlines()[0]}")
+            elif r.status == "pulado":
+                print(f"[{done}/{len(tasks)}] ⏭️  {r.arquivo}: sem alterações")
+            else:
+                print(f"[{done}/{len(tasks)}] ✅ {r.arquivo}: {r.registros:,} registros em {r.segundos:.1f}s")
+
+    # Um refresh só para o lote inteiro
+    if dsn and any(r.status == "ok" for r in results):
+        try:
+            if refresh_aggregates(dsn):
+                print("✅ Estatísticas agregadas atualizadas")
+        except Exception as e:
+            print(f"❌ Falha ao atualizar as estatísticas agregadas: {e}")
+            results.append(FileResult("(estatísticas agregadas)", None, "erro", erro=str(e)))
+
+    print_summary(results, time.perf_counter() - start)
+    if args.relatorio:
+        args.relatorio.write_text(json.dumps([asdict(r) for r in results], ensure_ascii=False, indent=2))
+        print(f"✅ Relatório: {args.relatorio}")
+    sys.exit(1 if any(r.status == "erro" for r in results) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Manifesto de importação: checksum de cada planilha já carregada.
+
+A tabela `ImportacaoArquivo` (supabase-project/volumes/db/init/10_importacao_incremental.sql)
+guarda, por tabela de destino e nome de arquivo, o SHA-256 do último arquivo
+importado. O loader compara o checksum antes de ler a planilha e pula arquivos
+que não mudaram; o registro é gravado na mesma transação da carga, então um
+manifesto atualizado sempre corresponde a dados confirmados.
+"""
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+import psycopg
+from psycopg import sql
+
+MANIFEST_TABLE = sql.Identifier("public", "ImportacaoArquivo")
+
+
+def file_checksum(path, block_size: int = 1 << 20) -> str:
+    """SHA-256 do arquivo, lido em blocos."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def imported_checksum(conninfo: str, table: str, arquivo: str) -> Optional[str]:
+    """Checksum registrado na última importação de `arquivo` para `table`, se houver."""
+    with psycopg.connect(conninfo) as conn:
+        row = conn.execute(
+            sql.SQL('SELECT "sha256" FROM {} WHERE "tabela" = %s AND "arquivo" = %s').format(MANIFEST_TABLE),
+            (table, arquivo),
+        ).fetchone()
+    return row[0] if row else None
+
+
+def record_import(cursor: psycopg.Cursor, table: str, path, sha256: str, rows: int):
+    """Registra (ou atualiza) a importação de `path` na transação de `cursor`."""
+    cursor.execute(
+        sql.SQL(
+            'INSERT INTO {} ("tabela", "arquivo", "sha256", "linhas") VALUES (%s, %s, %s, %s) '
+            'ON CONFLICT ("tabela", "arquivo") DO UPDATE '
+            'SET "sha256" = EXCLUDED."sha256", "linhas" = EXCLUDED."linhas", "data_importacao" = now()'
+        ).format(MANIFEST_TABLE),
+        (table, Path(path).name, sha256, rows),
+    )
@@ -0,0 +1,197 @@
+"""
+Normalização vetorizada das tabelas do IBGE (SIDRA) exportadas em Excel.
+
+As planilhas têm um cabeçalho de várias linhas (ex.: ano / sexo / grupo de
+idade / existência de deficiência), em que células mescladas aparecem só na
+primeira coluna do grupo, seguido de um bloco de dados com a localidade na
+primeira coluna. `normalize_frame` transforma esse bloco em formato longo
+(uma linha por localidade x combinação de categorias) sem laços em Python:
+o cabeçalho é preenchido com `ffill` e o bloco de dados é "derretido" com
+NumPy.
+
+Para planilhas grandes, `stream_workbook` lê a planilha linha a linha (openpyxl
+read-only ou CSV) e normaliza em blocos, emitindo registros por um gerador:
+o pico de memória depende do tamanho do bloco, não da planilha.
+"""
+import csv
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+
+@dataclass(frozen=True)
+class HeaderSpec:
+    """Layout de uma tabela exportada: em que linha está cada nível do cabeçalho."""
+
+    # (nome da coluna de saída, linha da planilha), do nível mais externo ao mais interno
+    levels: Tuple[Tuple[str, int], ...]
+    data_start_row: int
+    value_name: str
+    id_name: str = "localidade"
+    # Níveis que vêm de células mescladas e devem ser propagados para a direita
+    fill_forward: Tuple[str, ...] = ()
+    # Níveis gravados como inteiro (ex.: ano lido do Excel como "2022" ou 2022.0)
+    integer_levels: Tuple[str, ...] = ()
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return tuple(name for name, _ in self.levels)
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        """Colunas do resultado normalizado, na ordem de saída."""
+        return (self.id_name, *self.names, self.value_name)
+
+    @property
+    def key(self) -> Tuple[str, ...]:
+        """Colunas que identificam um registro (localidade + categorias)."""
+        return (self.id_name, *self.names)
+
+
+# Tabela 10139 - Taxa de escolarização por sexo, grupos de idade e deficiência
+ESCOLARIZACAO = HeaderSpec(
+    levels=(("ano", 3), ("sexo", 4), ("faixa_idade", 5), ("tipo_deficiencia", 6)),
+    data_start_row=7,
+    value_name="taxa_escolarizacao",
+    fill_forward=("ano", "sexo", "faixa_idade"),
+    integer_levels=("ano",),
+)
+
+
+def build_headers(raw: pd.DataFrame, spec: HeaderSpec = ESCOLARIZACAO) -> pd.DataFrame:
+    """
+    Cabeçalho das colunas de dados (coluna 1 em diante), um registro por coluna.
+
+    Os níveis em `spec.fill_forward` são propagados da esquerda para a direita,
+    reproduzindo as células mescladas da planilha.
+    """
+    rows = [row for _, row in spec.levels]
+    headers = raw.iloc[rows, 1:].T.reset_index(drop=True)
+    headers.columns = list(spec.names)
+    fill = list(spec.fill_forward)
+    if fill:
+        headers[fill] = headers[fill].ffill()
+    headers = headers.astype(object).where(headers.notna(), None)
+    for name in spec.integer_levels:
+        numbers = pd.to_numeric(headers[name], errors="coerce")
+        headers[name] = [int(n) if pd.notna(n) else v for n, v in zip(numbers, headers[name])]
+    return headers
+
+
+def to_numeric(values: np.ndarray) -> np.ndarray:
+    """
+    Converte um bloco de células em float, com NaN onde não há número.
+
+    Números já lidos como float passam direto; textos são aceitos com vírgula
+    decimal ("12,5"). Marcadores do IBGE como "-", "X" ou "..." viram NaN.
+    """
+    flat = pd.Series(values.ravel(), dtype=object)
+    numbers = pd.to_numeric(flat, errors="coerce")
+    retry = numbers.isna() & flat.notna()
+    if retry.any():
+        texts = flat[retry].astype(str).str.strip().str.replace(",", ".", regex=False)
+        numbers[retry] = pd.to_numeric(texts, errors="coerce")
+    return numbers.to_numpy(dtype=float).reshape(values.shape)
+
+
+def normalize_block(block: pd.DataFrame, headers: pd.DataFrame, spec: HeaderSpec = ESCOLARIZACAO) -> pd.DataFrame:
+    """
+    Normaliza um bloco de linhas de dados (localidade na coluna 0) já separado do cabeçalho.
+
+    Args:
+        block: Linhas de dados; colunas além das do cabeçalho são ignoradas
+        headers: Resultado de `build_headers` para a mesma planilha
+        spec: Layout do cabeçalho
+
+    Returns:
+        pd.DataFrame: Colunas `spec.columns`
+    """
+    localidades = block.iloc[:, 0]
+    localidades = localidades.where(localidades.isna(), localidades.astype(str).str.strip())
+    keep = (localidades.notna() & (localidades != "")).to_numpy()
+
+    values = to_numeric(block.iloc[:, 1:len(headers) + 1].to_numpy(dtype=object)[keep])
+    row_idx, col_idx = np.nonzero(~np.isnan(values))
+
+    data = {spec.id_name: localidades.to_numpy(dtype=object)[keep][row_idx]}
+    for name in spec.names:
+        data[name] = headers[name].to_numpy(dtype=object)[col_idx]
+    data[spec.value_name] = values[row_idx, col_idx]
+    return pd.DataFrame(data, columns=list(spec.columns))
+
+
+def normalize_frame(raw: pd.DataFrame, spec: HeaderSpec = ESCOLARIZACAO) -> pd.DataFrame:
+    """
+    Transforma a planilha crua (lida com `header=None`) em formato longo.
+
+    Linhas sem localidade (notas de rodapé, linhas vazias) e células sem valor
+    numérico são descartadas. A ordem de saída é a da planilha: localidade por
+    localidade, coluna por coluna.
+
+    Args:
+        raw: Planilha completa, sem cabeçalho interpretado
+        spec: Layout do cabeçalho
+
+    Returns:
+        pd.DataFrame: Colunas `spec.columns`
+    """
+    headers = build_headers(raw, spec)
+    return normalize_block(raw.iloc[spec.data_start_row:], headers, spec)
+
+
+def read_workbook(path, spec: HeaderSpec = ESCOLARIZACAO, sheet_name=0) -> pd.DataFrame:
+    """Lê uma planilha exportada e devolve os dados normalizados."""
+    return normalize_frame(pd.read_excel(path, header=None, sheet_name=sheet_name), spec)
+
+
+def iter_sheet_rows(path, sheet_name=0) -> Iterator[tuple]:
+    """
+    Linhas cruas de uma planilha, uma tupla por vez, sem carregar o arquivo inteiro.
+
+    `.xlsx` é lido com openpyxl em modo read-only; `.csv` (planilha convertida)
+    com o módulo csv, com células vazias como None.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.reader(f):
+                yield tuple(cell if cell != "" else None for cell in row)
+        return
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[sheet_name] if isinstance(sheet_name, int) else workbook[sheet_name]
+        yield from sheet.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def iter_normalized(rows: Iterable[Sequence], spec: HeaderSpec = ESCOLARIZACAO, chunk_rows: int = 500) -> Iterator[tuple]:
+    """
+    Normaliza linhas cruas em streaming, com memória limitada por `chunk_rows`.
+
+    As primeiras `spec.data_start_row` linhas formam o cabeçalho; o restante é
+    normalizado em blocos de `chunk_rows` linhas (vetorizado dentro de cada
+    bloco) e emitido registro a registro, na ordem de `spec.columns`.
+    """
+    rows = iter(rows)
+    head = pd.DataFrame(list(islice(rows, spec.data_start_row)))
+    headers = build_headers(head, spec)
+    width = len(headers) + 1
+
+    while True:
+        chunk = list(islice(rows, chunk_rows))
+        if not chunk:
+            break
+        block = pd.DataFrame(chunk).reindex(columns=range(width))
+        yield from normalize_block(block, headers, spec).itertuples(index=False, name=None)
+
+
+def stream_workbook(path, spec: HeaderSpec = ESCOLARIZACAO, sheet_name=0, chunk_rows: int = 500) -> Iterator[tuple]:
+    """Registros normalizados de uma planilha (`.xlsx` ou `.csv`), em streaming."""
+    return iter_normalized(iter_sheet_rows(path, sheet_name), spec, chunk_rows)
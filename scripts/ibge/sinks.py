@@ -0,0 +1,406 @@
+"""
+Destinos (sinks) para registros normalizados, consumidos em uma única passada.
+
+Cada sink é um context manager com `write_row(row)`: abre o destino na entrada,
+recebe um registro por vez e finaliza na saída (fecha o arquivo, faz COMMIT).
+Nenhum deles guarda mais que um lote de registros em memória, então uma planilha
+lida em streaming (`ibge.normalize.stream_workbook`) pode ser gravada em CSV,
+Parquet, Arrow, script SQL e Postgres ao mesmo tempo com memória constante:
+
+    with CsvSink("saida.csv") as csv_sink, PostgresCopySink(dsn) as db:
+        run_pipeline(stream_workbook(planilha), [csv_sink, db])
+
+Se a passada falhar no meio, o sink do Postgres faz ROLLBACK (a tabela final
+não muda) e os arquivos ficam incompletos, mas sem o `COMMIT;` final no caso
+do script SQL.
+"""
+import csv
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+import psycopg
+from psycopg import sql
+
+from ibge.manifesto import record_import
+from ibge.normalize import ESCOLARIZACAO, HeaderSpec
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # opcional, só para as saídas Parquet/Arrow
+    pa = pq = None
+
+SCHEMA = "public"
+TABLE = "TEA_escolarizacao_por_estado"
+
+
+@dataclass
+class LoadReport:
+    table: str
+    rows: int
+    seconds: float
+    # Só na carga incremental
+    inserted: Optional[int] = None
+    updated: Optional[int] = None
+    deleted: Optional[int] = None
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds else float("inf")
+
+    def __str__(self) -> str:
+        text = f"{self.table}: {self.rows:,} linhas em {self.seconds:.2f}s ({self.rows_per_sec:,.0f} linhas/s)"
+        if self.inserted is not None:
+            text += f"; {self.inserted:,} novas, {self.updated:,} alteradas, {self.deleted:,} removidas"
+        return text
+
+
+def _copy_text(value) -> str:
+    """Valor no formato texto do COPY (\\N para nulo, escapes de controle)."""
+    if value is None:
+        return "\\N"
+    text = str(value)
+    return (
+        text.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+    )
+
+
+class CsvSink:
+    """Grava os registros em CSV (UTF-8, com cabeçalho)."""
+
+    def __init__(self, path, columns: Sequence[str] = ESCOLARIZACAO.columns):
+        self.path = path
+        self.columns = columns
+        self.rows = 0
+
+    def __enter__(self) -> "CsvSink":
+        self._file = open(self.path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.columns)
+        return self
+
+    def write_row(self, row: Sequence):
+        self._writer.writerow(row)
+        self.rows += 1
+
+    def __exit__(self, *exc):
+        self._file.close()
+
+
+class CopySqlSink:
+    """Grava um script psql que substitui o conteúdo da tabela com um bloco COPY."""
+
+    def __init__(
+        self,
+        path,
+        table: str = TABLE,
+        columns: Sequence[str] = ESCOLARIZACAO.columns,
+        schema: str = SCHEMA,
+    ):
+        self.path = path
+        self.table = table
+        self.columns = columns
+        self.schema = schema
+        self.rows = 0
+
+    def __enter__(self) -> "CopySqlSink":
+        quoted = ", ".join(f'"{c}"' for c in self.columns)
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._file.write("BEGIN;\n\n")
+        self._file.write(f'DELETE FROM "{self.schema}"."{self.table}";\n\n')
+        self._file.write(f'COPY "{self.schema}"."{self.table}" ({quoted}) FROM stdin;\n')
+        return self
+
+    def write_row(self, row: Sequence):
+        self._file.write("\t".join(_copy_text(v) for v in row))
+        self._file.write("\n")
+        self.rows += 1
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            # Sem COMMIT, um script interrompido não altera a tabela ao ser aplicado
+            self._file.write("\\.\n\n" + ("COMMIT;\n" if exc_type is None else "ROLLBACK;\n"))
+        finally:
+            self._file.close()
+
+
+def arrow_schema(spec: HeaderSpec = ESCOLARIZACAO) -> "pa.Schema":
+    """
+    Schema Arrow dos registros normalizados.
+
+    Categorias de texto (sexo, faixa_idade, tipo_deficiencia...) são colunas
+    dictionary-encoded: cada valor distinto é gravado uma vez e as linhas guardam
+    só o índice; o pandas lê essas colunas como `category`.
+    """
+    fields = [pa.field(spec.id_name, pa.string())]
+    for name in spec.names:
+        if name in spec.integer_levels:
+            fields.append(pa.field(name, pa.int64()))
+        else:
+            fields.append(pa.field(name, pa.dictionary(pa.int32(), pa.string())))
+    fields.append(pa.field(spec.value_name, pa.float64()))
+    return pa.schema(fields)
+
+
+class _ArrowBatchSink:
+    """Acumula até `batch_rows` registros e grava cada lote como um RecordBatch."""
+
+    def __init__(self, path, spec: HeaderSpec = ESCOLARIZACAO, batch_rows: int = 65_536):
+        if pa is None:
+            raise RuntimeError("saídas Parquet/Arrow exigem o pyarrow (pip install pyarrow)")
+        self.path = path
+        self.schema = arrow_schema(spec)
+        self.batch_rows = batch_rows
+        self.rows = 0
+        self._pending: List[Sequence] = []
+
+    def _open(self):
+        raise NotImplementedError
+
+    def __enter__(self):
+        self._writer = self._open()
+        return self
+
+    def write_row(self, row: Sequence):
+        self._pending.append(row)
+        self.rows += 1
+        if len(self._pending) >= self.batch_rows:
+            self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        columns = zip(*self._pending)
+        arrays = [pa.array(values, type=field.type) for values, field in zip(columns, self.schema)]
+        self._writer.write_batch(pa.record_batch(arrays, schema=self.schema))
+        self._pending = []
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._flush()
+        finally:
+            self._writer.close()
+
+
+class ParquetSink(_ArrowBatchSink):
+    """Grava os registros em Parquet (zstd, categorias dictionary-encoded)."""
+
+    def _open(self):
+        return pq.ParquetWriter(self.path, self.schema, compression="zstd")
+
+
+class ArrowSink(_ArrowBatchSink):
+    """
+    Grava os registros em Arrow IPC (formato stream, sem compressão).
+
+    O formato stream permite um dicionário por lote, então a planilha continua
+    sendo gravada aos poucos; leitura com `pyarrow.ipc.open_stream`.
+    """
+
+    def _open(self):
+        return pa.ipc.new_stream(self.path, self.schema)
+
+
+class PostgresCopySink:
+    """
+    Substitui o conteúdo de `schema.table` em uma única transação.
+
+    Os registros vão por COPY FROM STDIN para uma tabela de staging temporária;
+    na saída, o conteúdo da tabela final é trocado (DELETE + INSERT ... SELECT)
+    e a transação é confirmada. Leitores continuam vendo os dados antigos até o
+    COMMIT. Depois da saída, `report` traz linhas carregadas e taxa.
+
+    Args:
+        conninfo: DSN do Postgres (conexão direta ou pooler em modo sessão)
+        table: Tabela final
+        columns: Colunas preenchidas, na ordem dos registros
+        schema: Schema da tabela final
+        progress: Chamado com o total de linhas enviadas a cada `progress_every`
+        manifest: `(arquivo, sha256)` registrado em `ImportacaoArquivo` na mesma transação
+    """
+
+    def __init__(
+        self,
+        conninfo: str,
+        table: str = TABLE,
+        columns: Sequence[str] = ESCOLARIZACAO.columns,
+        schema: str = SCHEMA,
+        progress: Optional[Callable[[int], None]] = None,
+        progress_every: int = 100_000,
+        manifest: Optional[Tuple[str, str]] = None,
+    ):
+        self.conninfo = conninfo
+        self.table = table
+        self.columns = columns
+        self.schema = schema
+        self.progress = progress
+        self.progress_every = progress_every
+        self.manifest = manifest
+        self.rows = 0
+        self.report: Optional[LoadReport] = None
+
+    def __enter__(self) -> "PostgresCopySink":
+        self._target = sql.Identifier(self.schema, self.table)
+        self._staging = sql.Identifier(f"{self.table}_staging")
+        self._start = time.perf_counter()
+        self._conn = psycopg.connect(self.conninfo)
+        try:
+            self._cursor = self._conn.cursor()
+            self._cursor.execute(
+                sql.SQL("CREATE TEMP TABLE {} (LIKE {} INCLUDING DEFAULTS) ON COMMIT DROP").format(
+                    self._staging, self._target
+                )
+            )
+            statement = sql.SQL("COPY {} ({}) FROM STDIN").format(
+                self._staging, sql.SQL(", ").join(map(sql.Identifier, self.columns))
+            )
+            self._copy_cm = self._cursor.copy(statement)
+            self._copy = self._copy_cm.__enter__()
+        except BaseException:
+            self._conn.close()
+            raise
+        return self
+
+    def write_row(self, row: Sequence):
+        self._copy.write_row(row)
+        self.rows += 1
+        if self.progress and self.rows % self.progress_every == 0:
+            self.progress(self.rows)
+
+    def _apply(self) -> dict:
+        """Leva o conteúdo da staging para a tabela final; devolve contadores extras do relatório."""
+        column_list = sql.SQL(", ").join(map(sql.Identifier, self.columns))
+        # Troca o conteúdo; o lock só bloqueia outros escritores, não leitores
+        self._cursor.execute(sql.SQL("LOCK TABLE {} IN EXCLUSIVE MODE").format(self._target))
+        self._cursor.execute(sql.SQL("DELETE FROM {}").format(self._target))
+        self._cursor.execute(
+            sql.SQL("INSERT INTO {} ({}) SELECT {} FROM {}").format(
+                self._target, column_list, column_list, self._staging
+            )
+        )
+        return {}
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self._copy_cm.__exit__(exc_type, exc, tb)
+            if exc_type is not None:
+                self._conn.rollback()
+                return
+            counters = self._apply()
+            if self.manifest:
+                arquivo, sha256 = self.manifest
+                record_import(self._cursor, self.table, arquivo, sha256, self.rows)
+            self._conn.commit()
+            self.report = LoadReport(
+                f"{self.schema}.{self.table}", self.rows, time.perf_counter() - self._start, **counters
+            )
+        finally:
+            self._conn.close()
+
+
+class PostgresUpsertSink(PostgresCopySink):
+    """
+    Carga incremental: grava só o que mudou desde a última importação.
+
+    Os registros vão por COPY para a staging, como em `PostgresCopySink`; na
+    saída, a staging é comparada à tabela final em um hash join pela chave
+    (`key`) e, para chaves existentes, pelo conteúdo (demais colunas):
+
+    - chaves novas são inseridas;
+    - chaves com hash diferente são atualizadas;
+    - chaves que não vieram na planilha são removidas.
+
+    Linhas iguais não são tocadas (sem UPDATE, sem bloat) e a tabela não é
+    bloqueada: leitores e escritores só disputam as linhas alteradas. Duas
+    importações da mesma tabela são serializadas por um advisory lock. Chaves
+    repetidas na planilha fazem a carga falhar (ROLLBACK).
+
+    Requer o índice único sobre `key` (10_importacao_incremental.sql).
+
+    Args:
+        key: Colunas que identificam um registro; as demais de `columns` são o conteúdo
+        (demais argumentos como em `PostgresCopySink`)
+    """
+
+    def __init__(
+        self,
+        conninfo: str,
+        table: str = TABLE,
+        columns: Sequence[str] = ESCOLARIZACAO.columns,
+        key: Sequence[str] = ESCOLARIZACAO.key,
+        schema: str = SCHEMA,
+        **kwargs,
+    ):
+        super().__init__(conninfo, table, columns, schema, **kwargs)
+        self.key = key
+
+    def _apply(self) -> dict:
+        def join_on_key(left, right):
+            return sql.SQL(" AND ").join(
+                sql.SQL("{} = {}").format(sql.Identifier(left, k), sql.Identifier(right, k)) for k in self.key
+            )
+
+        def columns_of(alias, names):
+            return sql.SQL(", ").join(sql.Identifier(alias, n) for n in names)
+
+        values = [c for c in self.columns if c not in self.key]
+        self._cursor.execute(
+            sql.SQL("SELECT pg_advisory_xact_lock(hashtext(%s))"), (f"{self.schema}.{self.table}",)
+        )
+
+        # Junções por igualdade da chave viram hash joins. Uma chave com NULL
+        # nunca casa: a linha é removida aqui e reinserida abaixo (correto, só
+        # não é poupada).
+        self._cursor.execute(
+            sql.SQL("DELETE FROM {target} t WHERE NOT EXISTS (SELECT 1 FROM {staging} s WHERE {on_key})").format(
+                target=self._target, staging=self._staging, on_key=join_on_key("s", "t")
+            )
+        )
+        deleted = self._cursor.rowcount
+
+        # Só chaves novas ou com conteúdo diferente chegam ao INSERT ... ON CONFLICT
+        self._cursor.execute(
+            sql.SQL(
+                "WITH gravadas AS ("
+                "  INSERT INTO {target} AS t ({columns})"
+                "  SELECT {columns_s} FROM {staging} s LEFT JOIN {target} t ON {on_key}"
+                "  WHERE t.{first_key} IS NULL OR ROW({values_s}) IS DISTINCT FROM ROW({values_t})"
+                "  ON CONFLICT ({key}) DO UPDATE SET {updates}"
+                "  RETURNING (xmax = 0) AS inserida"
+                ") "
+                "SELECT count(*) FILTER (WHERE inserida), count(*) FILTER (WHERE NOT inserida) FROM gravadas"
+            ).format(
+                target=self._target,
+                columns=sql.SQL(", ").join(map(sql.Identifier, self.columns)),
+                columns_s=columns_of("s", self.columns),
+                staging=self._staging,
+                on_key=join_on_key("s", "t"),
+                first_key=sql.Identifier(self.key[0]),
+                values_s=columns_of("s", values),
+                values_t=columns_of("t", values),
+                key=sql.SQL(", ").join(map(sql.Identifier, self.key)),
+                updates=sql.SQL(", ").join(sql.SQL("{0} = EXCLUDED.{0}").format(sql.Identifier(c)) for c in values),
+            )
+        )
+        inserted, updated = self._cursor.fetchone()
+        return {"inserted": inserted, "updated": updated, "deleted": deleted}
+
+
+def run_pipeline(rows: Iterable[Sequence], sinks: List) -> int:
+    """
+    Consome `rows` uma única vez, entregando cada registro a todos os `sinks`.
+
+    Os sinks já devem estar abertos (dentro do `with`).
+
+    Returns:
+        int: Número de registros processados
+    """
+    writers = [sink.write_row for sink in sinks]
+    count = 0
+    for row in rows:
+        for write in writers:
+            write(row)
+        count += 1
+    return count
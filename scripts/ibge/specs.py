@@ -0,0 +1,79 @@
+"""
+Catálogo declarativo das tabelas do IBGE importadas (`tabelas.json`).
+
+Cada entrada descreve uma tabela do SIDRA: quais arquivos a contêm (padrões
+glob sobre o nome do arquivo), a tabela de destino no banco e o layout do
+cabeçalho. Para importar uma tabela nova basta acrescentar uma entrada:
+
+    "nome": {
+      "arquivos": ["padrao-*.xlsx"],
+      "tabela": "TabelaDestino",
+      "inicio_dados": 7,
+      "niveis": [["coluna", linha], ...],
+      "valor": "coluna_do_valor",
+      "preencher": ["colunas mescladas"],
+      "inteiros": ["colunas inteiras"]
+    }
+
+A tabela de destino precisa de um índice único sobre localidade + níveis
+para a carga incremental (ver 10_importacao_incremental.sql).
+"""
+import json
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from ibge.normalize import HeaderSpec
+
+SPECS_PATH = Path(__file__).with_name("tabelas.json")
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    name: str
+    patterns: Tuple[str, ...]
+    table: str
+    header: HeaderSpec
+    description: str = ""
+
+    def matches(self, path) -> bool:
+        return any(fnmatch(Path(path).name, pattern) for pattern in self.patterns)
+
+
+def load_specs(path=SPECS_PATH) -> Dict[str, TableSpec]:
+    """
+    Lê o catálogo de tabelas.
+
+    Raises:
+        ValueError: Se uma entrada estiver incompleta
+    """
+    with open(path, encoding="utf-8") as f:
+        raw = json.load(f)
+
+    specs = {}
+    for name, entry in raw.items():
+        try:
+            header = HeaderSpec(
+                levels=tuple((column, int(row)) for column, row in entry["niveis"]),
+                data_start_row=int(entry["inicio_dados"]),
+                value_name=entry["valor"],
+                id_name=entry.get("id", "localidade"),
+                fill_forward=tuple(entry.get("preencher", ())),
+                integer_levels=tuple(entry.get("inteiros", ())),
+            )
+            specs[name] = TableSpec(
+                name=name,
+                patterns=tuple(entry["arquivos"]),
+                table=entry["tabela"],
+                header=header,
+                description=entry.get("descricao", ""),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"{path}: entrada '{name}' inválida ({e!r})") from e
+    return specs
+
+
+def match_spec(path, specs: Dict[str, TableSpec]) -> Optional[TableSpec]:
+    """Primeira entrada do catálogo cujo padrão casa com o nome do arquivo."""
+    return next((spec for spec in specs.values() if spec.matches(path)), None)
@@ -0,0 +1,40 @@
+-- Favoritar material em uma única chamada (RPC)
+-- Valida o material e a posse do dependente e insere o favorito no mesmo
+-- round trip. Erros de negócio usam ERRCODE P0002 e a mensagem como código:
+--   MATERIAL_NOT_FOUND   -> material inexistente
+--   DEPENDENTE_NOT_FOUND -> dependente inexistente ou de outro responsável
+-- Favorito duplicado propaga o unique_violation (23505) da chave primária.
+
+CREATE OR REPLACE FUNCTION "public"."favoritar_material"(
+    p_responsavel_id UUID,
+    p_material_id INTEGER,
+    p_dependente_id INTEGER
+)
+RETURNS SETOF "public"."MaterialFavorito"
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM "public"."MaterialDeApoio" WHERE "id" = p_material_id
+    ) THEN
+        RAISE EXCEPTION 'MATERIAL_NOT_FOUND' USING ERRCODE = 'P0002';
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1 FROM "public"."Dependente"
+        WHERE "id" = p_dependente_id AND "responsavel_id" = p_responsavel_id
+    ) THEN
+        RAISE EXCEPTION 'DEPENDENTE_NOT_FOUND' USING ERRCODE = 'P0002';
+    END IF;
+
+    RETURN QUERY
+    INSERT INTO "public"."MaterialFavorito" ("responsavel_id", "material_id", "dependente_id")
+    VALUES (p_responsavel_id, p_material_id, p_dependente_id)
+    RETURNING *;
+END;
+$$;
+
+-- O responsável é informado pela API (já autenticado), então apenas a
+-- service_role pode chamar a função diretamente.
+REVOKE EXECUTE ON FUNCTION "public"."favoritar_material"(UUID, INTEGER, INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION "public"."favoritar_material"(UUID, INTEGER, INTEGER) TO service_role;
@@ -0,0 +1,93 @@
+-- Favoritar / desfavoritar materiais em lote (RPC)
+-- Recebem uma lista JSON de {"material_id", "dependente_id"} e devolvem uma
+-- linha de status por par, tudo em um único round trip:
+--   favoritar:    CREATED | ALREADY_FAVORITED | MATERIAL_NOT_FOUND | DEPENDENTE_NOT_FOUND
+--   desfavoritar: REMOVED | FAVORITE_NOT_FOUND
+
+CREATE OR REPLACE FUNCTION "public"."favoritar_materiais_lote"(
+    p_responsavel_id UUID,
+    p_itens JSONB
+)
+RETURNS TABLE (material_id INTEGER, dependente_id INTEGER, status TEXT)
+LANGUAGE sql
+AS $$
+    WITH itens AS (
+        SELECT DISTINCT
+            (item->>'material_id')::INTEGER AS material_id,
+            (item->>'dependente_id')::INTEGER AS dependente_id
+        FROM jsonb_array_elements(p_itens) AS item
+    ),
+    classificados AS (
+        SELECT
+            it.material_id,
+            it.dependente_id,
+            CASE
+                WHEN m."id" IS NULL THEN 'MATERIAL_NOT_FOUND'
+                WHEN d."id" IS NULL THEN 'DEPENDENTE_NOT_FOUND'
+                WHEN f."material_id" IS NOT NULL THEN 'ALREADY_FAVORITED'
+                ELSE 'CREATED'
+            END AS status
+        FROM itens it
+        LEFT JOIN "public"."MaterialDeApoio" m ON m."id" = it.material_id
+        LEFT JOIN "public"."Dependente" d
+            ON d."id" = it.dependente_id AND d."responsavel_id" = p_responsavel_id
+        LEFT JOIN "public"."MaterialFavorito" f
+            ON f."responsavel_id" = p_responsavel_id
+            AND f."material_id" = it.material_id
+            AND f."dependente_id" = it.dependente_id
+    ),
+    inseridos AS (
+        INSERT INTO "public"."MaterialFavorito" ("responsavel_id", "material_id", "dependente_id")
+        SELECT p_responsavel_id, c.material_id, c.dependente_id
+        FROM classificados c
+        WHERE c.status = 'CREATED'
+        -- Um insert concorrente do mesmo par vira ALREADY_FAVORITED abaixo
+        ON CONFLICT DO NOTHING
+        RETURNING "material_id", "dependente_id"
+    )
+    SELECT
+        c.material_id,
+        c.dependente_id,
+        CASE
+            WHEN c.status = 'CREATED' AND i."material_id" IS NULL THEN 'ALREADY_FAVORITED'
+            ELSE c.status
+        END
+    FROM classificados c
+    LEFT JOIN inseridos i
+        ON i."material_id" = c.material_id AND i."dependente_id" = c.dependente_id;
+$$;
+
+CREATE OR REPLACE FUNCTION "public"."desfavoritar_materiais_lote"(
+    p_responsavel_id UUID,
+    p_itens JSONB
+)
+RETURNS TABLE (material_id INTEGER, dependente_id INTEGER, status TEXT)
+LANGUAGE sql
+AS $$
+    WITH itens AS (
+        SELECT DISTINCT
+            (item->>'material_id')::INTEGER AS material_id,
+            (item->>'dependente_id')::INTEGER AS dependente_id
+        FROM jsonb_array_elements(p_itens) AS item
+    ),
+    removidos AS (
+        DELETE FROM "public"."MaterialFavorito" f
+        USING itens it
+        WHERE f."responsavel_id" = p_responsavel_id
+            AND f."material_id" = it.material_id
+            AND f."dependente_id" = it.dependente_id
+        RETURNING f."material_id", f."dependente_id"
+    )
+    SELECT
+        it.material_id,
+        it.dependente_id,
+        CASE WHEN r."material_id" IS NULL THEN 'FAVORITE_NOT_FOUND' ELSE 'REMOVED' END
+    FROM itens it
+    LEFT JOIN removidos r
+        ON r."material_id" = it.material_id AND r."dependente_id" = it.dependente_id;
+$$;
+
+REVOKE EXECUTE ON FUNCTION "public"."favoritar_materiais_lote"(UUID, JSONB) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION "public"."desfavoritar_materiais_lote"(UUID, JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION "public"."favoritar_materiais_lote"(UUID, JSONB) TO service_role;
+GRANT EXECUTE ON FUNCTION "public"."desfavoritar_materiais_lote"(UUID, JSONB) TO service_role;
@@ -0,0 +1,48 @@
+-- Versão das tabelas de catálogo (ETag dos endpoints de listagem)
+-- A API usa max(data_atualizacao) + count(*) como versão da tabela; o trigger
+-- garante que todo UPDATE avance data_atualizacao e os índices tornam o
+-- max() uma leitura de índice.
+
+CREATE OR REPLACE FUNCTION "public"."set_data_atualizacao"()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    NEW."data_atualizacao" := now();
+    RETURN NEW;
+END;
+$$;
+
+CREATE OR REPLACE TRIGGER "ArtigoInformativo_set_data_atualizacao"
+    BEFORE UPDATE ON "public"."ArtigoInformativo"
+    FOR EACH ROW EXECUTE FUNCTION "public"."set_data_atualizacao"();
+
+CREATE OR REPLACE TRIGGER "MaterialDeApoio_set_data_atualizacao"
+    BEFORE UPDATE ON "public"."MaterialDeApoio"
+    FOR EACH ROW EXECUTE FUNCTION "public"."set_data_atualizacao"();
+
+CREATE OR REPLACE TRIGGER "ServicoLocal_set_data_atualizacao"
+    BEFORE UPDATE ON "public"."ServicoLocal"
+    FOR EACH ROW EXECUTE FUNCTION "public"."set_data_atualizacao"();
+
+CREATE INDEX IF NOT EXISTS "ArtigoInformativo_data_atualizacao_idx"
+    ON "public"."ArtigoInformativo" ("data_atualizacao" DESC NULLS LAST);
+CREATE INDEX IF NOT EXISTS "MaterialDeApoio_data_atualizacao_idx"
+    ON "public"."MaterialDeApoio" ("data_atualizacao" DESC NULLS LAST);
+CREATE INDEX IF NOT EXISTS "ServicoLocal_data_atualizacao_idx"
+    ON "public"."ServicoLocal" ("data_atualizacao" DESC NULLS LAST);
+
+-- Tabelas embutidas em GET /materiais/?embed=true (categoria e nível de suporte):
+-- a ETag da listagem também usa a versão delas, então precisam do mesmo controle
+ALTER TABLE "public"."CategoriaMaterial"
+    ADD COLUMN IF NOT EXISTS "data_atualizacao" timestamp with time zone DEFAULT now();
+ALTER TABLE "public"."NivelSuporteTEA"
+    ADD COLUMN IF NOT EXISTS "data_atualizacao" timestamp with time zone DEFAULT now();
+
+CREATE OR REPLACE TRIGGER "CategoriaMaterial_set_data_atualizacao"
+    BEFORE UPDATE ON "public"."CategoriaMaterial"
+    FOR EACH ROW EXECUTE FUNCTION "public"."set_data_atualizacao"();
+
+CREATE OR REPLACE TRIGGER "NivelSuporteTEA_set_data_atualizacao"
+    BEFORE UPDATE ON "public"."NivelSuporteTEA"
+    FOR EACH ROW EXECUTE FUNCTION "public"."set_data_atualizacao"();
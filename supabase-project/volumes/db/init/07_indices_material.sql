@@ -0,0 +1,9 @@
+-- Índices compostos para os filtros de GET /materiais/
+-- (categoria_id e/ou nivel_suporte_tea_id + paginação por id)
+
+CREATE INDEX IF NOT EXISTS "MaterialDeApoio_categoria_id_id_idx"
+    ON "public"."MaterialDeApoio" ("categoria_id", "id");
+CREATE INDEX IF NOT EXISTS "MaterialDeApoio_nivel_suporte_tea_id_id_idx"
+    ON "public"."MaterialDeApoio" ("nivel_suporte_tea_id", "id");
+CREATE INDEX IF NOT EXISTS "MaterialDeApoio_categoria_id_nivel_suporte_tea_id_id_idx"
+    ON "public"."MaterialDeApoio" ("categoria_id", "nivel_suporte_tea_id", "id");
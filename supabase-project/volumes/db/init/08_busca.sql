@@ -0,0 +1,85 @@
+-- Busca textual em ArtigoInformativo e MaterialDeApoio (GET /busca/)
+-- Configuração "portuguese_unaccent": stemming em português sem acentos, de
+-- modo que "educacao" encontra "educação" e o ts_headline marca o texto original.
+
+CREATE EXTENSION IF NOT EXISTS unaccent;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'portuguese_unaccent') THEN
+        CREATE TEXT SEARCH CONFIGURATION "public"."portuguese_unaccent" (COPY = pg_catalog.portuguese);
+        ALTER TEXT SEARCH CONFIGURATION "public"."portuguese_unaccent"
+            ALTER MAPPING FOR hword, hword_part, word WITH unaccent, portuguese_stem;
+    END IF;
+END;
+$$;
+
+-- Colunas tsvector geradas (título com peso A, corpo com peso B)
+ALTER TABLE "public"."ArtigoInformativo"
+    ADD COLUMN IF NOT EXISTS "busca" tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('public.portuguese_unaccent', coalesce("titulo", '')), 'A') ||
+        setweight(to_tsvector('public.portuguese_unaccent', coalesce("corpo", '')), 'B')
+    ) STORED;
+
+ALTER TABLE "public"."MaterialDeApoio"
+    ADD COLUMN IF NOT EXISTS "busca" tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('public.portuguese_unaccent', coalesce("titulo", '')), 'A') ||
+        setweight(to_tsvector('public.portuguese_unaccent', coalesce("corpo", '')), 'B')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS "ArtigoInformativo_busca_idx"
+    ON "public"."ArtigoInformativo" USING GIN ("busca");
+CREATE INDEX IF NOT EXISTS "MaterialDeApoio_busca_idx"
+    ON "public"."MaterialDeApoio" USING GIN ("busca");
+
+-- Resultados ordenados por relevância, paginados por (rank, tipo, id).
+-- O trecho (ts_headline) só é calculado para as linhas da página.
+CREATE OR REPLACE FUNCTION "public"."buscar_conteudo"(
+    p_consulta TEXT,
+    p_limite INTEGER DEFAULT 20,
+    p_tipo TEXT DEFAULT NULL,
+    p_cursor_rank REAL DEFAULT NULL,
+    p_cursor_tipo TEXT DEFAULT NULL,
+    p_cursor_id INTEGER DEFAULT NULL
+)
+RETURNS TABLE (tipo TEXT, id INTEGER, titulo TEXT, trecho TEXT, rank REAL)
+LANGUAGE sql
+STABLE
+AS $$
+    WITH consulta AS (
+        SELECT websearch_to_tsquery('public.portuguese_unaccent', p_consulta) AS q
+    ),
+    resultados AS (
+        SELECT 'artigo'::TEXT AS tipo, a."id", a."titulo"::TEXT AS titulo, a."corpo" AS texto,
+            ts_rank(a."busca", c.q) AS rank
+        FROM "public"."ArtigoInformativo" a, consulta c
+        WHERE a."busca" @@ c.q AND (p_tipo IS NULL OR p_tipo = 'artigo')
+        UNION ALL
+        SELECT 'material'::TEXT, m."id", m."titulo"::TEXT, coalesce(m."corpo", ''),
+            ts_rank(m."busca", c.q)
+        FROM "public"."MaterialDeApoio" m, consulta c
+        WHERE m."busca" @@ c.q AND (p_tipo IS NULL OR p_tipo = 'material')
+    ),
+    pagina AS (
+        SELECT r.*
+        FROM resultados r
+        WHERE p_cursor_id IS NULL
+            OR (r.rank, r.tipo, r."id") < (p_cursor_rank, p_cursor_tipo, p_cursor_id)
+        ORDER BY r.rank DESC, r.tipo DESC, r."id" DESC
+        LIMIT p_limite
+    )
+    SELECT
+        p.tipo,
+        p."id",
+        p.titulo,
+        ts_headline(
+            'public.portuguese_unaccent', p.texto, c.q,
+            'StartSel=<mark>, StopSel=</mark>, MinWords=15, MaxWords=35, MaxFragments=2'
+        ),
+        p.rank
+    FROM pagina p, consulta c
+    ORDER BY p.rank DESC, p.tipo DESC, p."id" DESC;
+$$;
+
+REVOKE EXECUTE ON FUNCTION "public"."buscar_conteudo"(TEXT, INTEGER, TEXT, REAL, TEXT, INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION "public"."buscar_conteudo"(TEXT, INTEGER, TEXT, REAL, TEXT, INTEGER) TO service_role;
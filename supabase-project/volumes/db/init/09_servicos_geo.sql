@@ -0,0 +1,92 @@
+-- Coordenadas de ServicoLocal e busca por proximidade (GET /servicos/proximos)
+-- Índice GiST sobre ll_to_earth(latitude, longitude) (cube/earthdistance): o
+-- filtro earth_box() usa o índice e earth_distance() refina para o raio exato.
+
+CREATE EXTENSION IF NOT EXISTS cube;
+CREATE EXTENSION IF NOT EXISTS earthdistance;
+
+ALTER TABLE "public"."ServicoLocal"
+    ADD COLUMN IF NOT EXISTS "latitude" double precision,
+    ADD COLUMN IF NOT EXISTS "longitude" double precision;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'ServicoLocal_coordenadas_check') THEN
+        ALTER TABLE "public"."ServicoLocal"
+            ADD CONSTRAINT "ServicoLocal_coordenadas_check" CHECK (
+                ("latitude" IS NULL) = ("longitude" IS NULL)
+                AND ("latitude" IS NULL OR "latitude" BETWEEN -90 AND 90)
+                AND ("longitude" IS NULL OR "longitude" BETWEEN -180 AND 180)
+            );
+    END IF;
+END;
+$$;
+
+CREATE INDEX IF NOT EXISTS "ServicoLocal_localizacao_idx"
+    ON "public"."ServicoLocal" USING GIST (ll_to_earth("latitude", "longitude"))
+    WHERE "latitude" IS NOT NULL;
+
+-- Serviços dentro de p_raio_m metros de (p_lat, p_lon), do mais próximo ao mais
+-- distante, paginados por (distancia_m, id).
+CREATE OR REPLACE FUNCTION "public"."servicos_proximos"(
+    p_lat DOUBLE PRECISION,
+    p_lon DOUBLE PRECISION,
+    p_raio_m DOUBLE PRECISION,
+    p_tipo_servico_id INTEGER DEFAULT NULL,
+    p_limite INTEGER DEFAULT 20,
+    p_cursor_distancia DOUBLE PRECISION DEFAULT NULL,
+    p_cursor_id INTEGER DEFAULT NULL
+)
+RETURNS TABLE (
+    id INTEGER,
+    name TEXT,
+    endereco TEXT,
+    tipo_servico_id INTEGER,
+    latitude DOUBLE PRECISION,
+    longitude DOUBLE PRECISION,
+    data_criacao TIMESTAMPTZ,
+    data_atualizacao TIMESTAMPTZ,
+    distancia_m DOUBLE PRECISION
+)
+LANGUAGE sql
+STABLE
+AS $$
+    WITH candidatos AS (
+        SELECT
+            s.*,
+            earth_distance(ll_to_earth(p_lat, p_lon), ll_to_earth(s."latitude", s."longitude")) AS distancia
+        FROM "public"."ServicoLocal" s
+        WHERE s."latitude" IS NOT NULL
+            AND earth_box(ll_to_earth(p_lat, p_lon), p_raio_m) @> ll_to_earth(s."latitude", s."longitude")
+            AND (p_tipo_servico_id IS NULL OR s."tipo_servico_id" = p_tipo_servico_id)
+    )
+    SELECT
+        c."id", c."name"::TEXT, c."endereco"::TEXT, c."tipo_servico_id",
+        c."latitude", c."longitude", c."data_criacao", c."data_atualizacao",
+        c.distancia
+    FROM candidatos c
+    WHERE c.distancia <= p_raio_m
+        AND (p_cursor_id IS NULL OR (c.distancia, c."id") > (p_cursor_distancia, p_cursor_id))
+    ORDER BY c.distancia, c."id"
+    LIMIT p_limite;
+$$;
+
+-- Backfill de coordenadas em lote (scripts/geocodificar_servicos.py)
+CREATE OR REPLACE FUNCTION "public"."atualizar_coordenadas_servicos"(p_itens JSONB)
+RETURNS INTEGER
+LANGUAGE sql
+AS $$
+    WITH atualizados AS (
+        UPDATE "public"."ServicoLocal" s
+        SET "latitude" = i.latitude, "longitude" = i.longitude
+        FROM jsonb_to_recordset(p_itens) AS i(id INTEGER, latitude DOUBLE PRECISION, longitude DOUBLE PRECISION)
+        WHERE s."id" = i.id
+        RETURNING 1
+    )
+    SELECT count(*)::INTEGER FROM atualizados;
+$$;
+
+REVOKE EXECUTE ON FUNCTION "public"."servicos_proximos"(DOUBLE PRECISION, DOUBLE PRECISION, DOUBLE PRECISION, INTEGER, INTEGER, DOUBLE PRECISION, INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION "public"."atualizar_coordenadas_servicos"(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION "public"."servicos_proximos"(DOUBLE PRECISION, DOUBLE PRECISION, DOUBLE PRECISION, INTEGER, INTEGER, DOUBLE PRECISION, INTEGER) TO service_role;
+GRANT EXECUTE ON FUNCTION "public"."atualizar_coordenadas_servicos"(JSONB) TO service_role;
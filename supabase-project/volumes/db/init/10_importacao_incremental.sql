@@ -0,0 +1,33 @@
+-- Reimportação incremental das tabelas do IBGE (scripts/ibge/loader.py)
+-- Cada registro é identificado pela chave (localidade, ano, sexo, faixa_idade,
+-- tipo_deficiencia); uma reimportação compara o hash do conteúdo de cada chave,
+-- só grava as linhas novas ou alteradas e remove as que sumiram da planilha,
+-- sem bloquear a tabela inteira. O manifesto registra o checksum de cada
+-- arquivo importado para pular arquivos que não mudaram.
+
+-- Cargas completas anteriores podem ter deixado chaves repetidas; mantém uma
+DELETE FROM "public"."TEA_escolarizacao_por_estado" t
+USING "public"."TEA_escolarizacao_por_estado" d
+WHERE t.ctid > d.ctid
+  AND t."localidade" IS NOT DISTINCT FROM d."localidade"
+  AND t."ano" IS NOT DISTINCT FROM d."ano"
+  AND t."sexo" IS NOT DISTINCT FROM d."sexo"
+  AND t."faixa_idade" IS NOT DISTINCT FROM d."faixa_idade"
+  AND t."tipo_deficiencia" IS NOT DISTINCT FROM d."tipo_deficiencia";
+
+-- NULLS NOT DISTINCT: uma categoria vazia no cabeçalho ainda identifica a linha
+CREATE UNIQUE INDEX IF NOT EXISTS "TEA_escolarizacao_por_estado_chave_idx"
+    ON "public"."TEA_escolarizacao_por_estado"
+    ("localidade", "ano", "sexo", "faixa_idade", "tipo_deficiencia") NULLS NOT DISTINCT;
+
+CREATE TABLE IF NOT EXISTS "public"."ImportacaoArquivo" (
+    "tabela" TEXT NOT NULL,
+    "arquivo" TEXT NOT NULL,
+    "sha256" TEXT NOT NULL,
+    "linhas" INTEGER NOT NULL,
+    "data_importacao" TIMESTAMPTZ NOT NULL DEFAULT now(),
+    CONSTRAINT "ImportacaoArquivo_pkey" PRIMARY KEY ("tabela", "arquivo")
+);
+
+-- Só o loader (conexão direta) acessa o manifesto
+ALTER TABLE "public"."ImportacaoArquivo" ENABLE ROW LEVEL SECURITY;
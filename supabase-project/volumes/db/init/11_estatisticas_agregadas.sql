@@ -0,0 +1,61 @@
+-- Estatísticas pré-agregadas para os gráficos (GET /estatisticas/escolarizacao e
+-- GET /estatisticas/niveis)
+-- As views materializadas guardam todos os agrupamentos possíveis (CUBE) das
+-- tabelas do IBGE; "agrupamento" é o GROUPING() das dimensões, ou seja, um bit
+-- por dimensão agregada (bit mais alto = primeira dimensão). A API escolhe o
+-- agrupamento pedido e lê poucas linhas pelo índice, sem agregar nada por
+-- requisição. O loader (scripts/ibge) chama atualizar_estatisticas_agregadas()
+-- depois de cada importação.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS "public"."TEA_escolarizacao_agregada" AS
+SELECT
+    GROUPING("localidade", "ano", "sexo", "faixa_idade", "tipo_deficiencia") AS "agrupamento",
+    "localidade",
+    "ano",
+    "sexo",
+    "faixa_idade",
+    "tipo_deficiencia",
+    avg("taxa_escolarizacao") AS "media",
+    min("taxa_escolarizacao") AS "minimo",
+    max("taxa_escolarizacao") AS "maximo",
+    count("taxa_escolarizacao") AS "registros"
+FROM "public"."TEA_escolarizacao_por_estado"
+GROUP BY CUBE ("localidade", "ano", "sexo", "faixa_idade", "tipo_deficiencia");
+
+-- Único (exigido pelo REFRESH ... CONCURRENTLY) e usado pelas consultas por agrupamento + filtros
+CREATE UNIQUE INDEX IF NOT EXISTS "TEA_escolarizacao_agregada_chave_idx"
+    ON "public"."TEA_escolarizacao_agregada"
+    ("agrupamento", "localidade", "ano", "sexo", "faixa_idade", "tipo_deficiencia") NULLS NOT DISTINCT;
+CREATE INDEX IF NOT EXISTS "TEA_escolarizacao_agregada_ano_idx"
+    ON "public"."TEA_escolarizacao_agregada" ("agrupamento", "ano", "sexo", "faixa_idade", "tipo_deficiencia");
+
+-- absolute/relative podem ser texto (02_tea_nivel_por_estado.sql) ou numéricos
+CREATE MATERIALIZED VIEW IF NOT EXISTS "public"."TEA_nivel_agregado" AS
+SELECT
+    GROUPING("local", "dificuldades") AS "agrupamento",
+    "local",
+    "dificuldades",
+    sum(NULLIF("absolute"::text, '')::numeric)::bigint AS "soma_absoluto",
+    avg(NULLIF("relative"::text, '')::numeric)::double precision AS "media_relativo",
+    count(*) AS "registros"
+FROM "public"."TEA_nivel_por_estado"
+GROUP BY CUBE ("local", "dificuldades");
+
+CREATE UNIQUE INDEX IF NOT EXISTS "TEA_nivel_agregado_chave_idx"
+    ON "public"."TEA_nivel_agregado" ("agrupamento", "local", "dificuldades") NULLS NOT DISTINCT;
+
+-- CONCURRENTLY: leitores continuam vendo a versão anterior durante o refresh
+CREATE OR REPLACE FUNCTION "public"."atualizar_estatisticas_agregadas"()
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    REFRESH MATERIALIZED VIEW CONCURRENTLY "public"."TEA_escolarizacao_agregada";
+    REFRESH MATERIALIZED VIEW CONCURRENTLY "public"."TEA_nivel_agregado";
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION "public"."atualizar_estatisticas_agregadas"() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION "public"."atualizar_estatisticas_agregadas"() TO service_role;
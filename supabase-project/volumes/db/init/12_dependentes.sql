@@ -0,0 +1,5 @@
+-- Dependentes de um responsável, mais recentes primeiro
+-- (GET /dependentes/, dashboards e a checagem de posse em favoritar_material)
+
+CREATE INDEX IF NOT EXISTS "Dependente_responsavel_id_data_criacao_idx"
+    ON "public"."Dependente" ("responsavel_id", "data_criacao" DESC);
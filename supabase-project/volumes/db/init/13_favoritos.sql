@@ -0,0 +1,6 @@
+-- Favoritos de um responsável, por dependente
+-- (GET /materiais/favoritos?dependente_id=...; a ordem das colunas é a ordem
+-- de paginação, então nenhuma página precisa ordenar em memória)
+
+CREATE INDEX IF NOT EXISTS "MaterialFavorito_responsavel_id_dependente_id_idx"
+    ON "public"."MaterialFavorito" ("responsavel_id", "dependente_id", "material_id");
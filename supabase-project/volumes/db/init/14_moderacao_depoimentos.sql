@@ -0,0 +1,21 @@
+-- Moderação de depoimentos em lote (RPC)
+-- Aprova os ids de p_aprovar e reprova (aprovado = false) os de p_rejeitar
+-- em um único UPDATE / round trip. Devolve o novo estado de cada depoimento
+-- encontrado; ids inexistentes simplesmente não aparecem.
+
+CREATE OR REPLACE FUNCTION "public"."moderar_depoimentos"(
+    p_aprovar INTEGER[],
+    p_rejeitar INTEGER[]
+)
+RETURNS TABLE (id INTEGER, aprovado BOOLEAN)
+LANGUAGE sql
+AS $$
+    UPDATE "public"."DepoimentoResponsavel" d
+    SET "aprovado" = d."id" = ANY(p_aprovar)
+    WHERE d."id" = ANY(p_aprovar) OR d."id" = ANY(p_rejeitar)
+    RETURNING d."id", d."aprovado";
+$$;
+
+-- Só a API (service_role) modera, depois de checar o papel de administrador
+REVOKE EXECUTE ON FUNCTION "public"."moderar_depoimentos"(INTEGER[], INTEGER[]) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION "public"."moderar_depoimentos"(INTEGER[], INTEGER[]) TO service_role;
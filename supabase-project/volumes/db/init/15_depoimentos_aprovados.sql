@@ -0,0 +1,11 @@
+-- Depoimentos aprovados (GET /depoimentos/, página inicial)
+-- A tabela cresce com depoimentos pendentes; os índices parciais guardam só
+-- os aprovados, então cada página lê apenas o que é exibido, em qualquer uma
+-- das ordens e com ou sem filtro de categoria.
+
+CREATE INDEX IF NOT EXISTS "DepoimentoResponsavel_aprovado_id_idx"
+    ON "public"."DepoimentoResponsavel" ("id") WHERE "aprovado";
+CREATE INDEX IF NOT EXISTS "DepoimentoResponsavel_aprovado_data_criacao_idx"
+    ON "public"."DepoimentoResponsavel" ("data_criacao" DESC, "id" DESC) WHERE "aprovado";
+CREATE INDEX IF NOT EXISTS "DepoimentoResponsavel_aprovado_categoria_id_idx"
+    ON "public"."DepoimentoResponsavel" ("categoria_id", "id") WHERE "aprovado";